@@ -0,0 +1,123 @@
+import json
+import sys
+from argparse import ArgumentParser
+
+from benchmarks.runner import compare, run_scenario
+from benchmarks.scenarios import SCENARIOS
+
+
+def main() -> int:
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Executa os cenários de benchmark do jogo.",
+    )
+    parser.add_argument(
+        "scenarios", nargs="*",
+        help="cenários executados, todos por padrão",
+    )
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--recording", help="sessão gravada, necessária no cenário replay",
+    )
+    parser.add_argument("--output", help="arquivo json com os resultados")
+    parser.add_argument("--baseline", help="baseline json para comparação")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1,
+        help="variação relativa aceita antes de acusar regressão",
+    )
+    parser.add_argument(
+        "--dirty-rects", action="store_true",
+        help="registra apenas as áreas da tela alteradas em cada frame",
+    )
+    parser.add_argument(
+        "--quality", type=int, default=0,
+        help="nível de qualidade fixo, sendo 0 a qualidade completa",
+    )
+    parser.add_argument(
+        "--pipelined", action="store_true",
+        help="desenha cada frame em outra thread enquanto simula o próximo",
+    )
+    parser.add_argument(
+        "--ai-workers", type=int,
+        help="processos que calculam a IA dos inimigos, 0 no processo atual",
+    )
+    parser.add_argument("--list", action="store_true")
+
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<16}{scenario.description}"
+                  f"{'' if scenario.default else ' (fora do padrão)'}")
+
+        return 0
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(sorted(unknown))}")
+
+    names = args.scenarios or [
+        name for name, scenario in SCENARIOS.items()
+        if scenario.default or (name == "replay" and args.recording)
+    ]
+
+    if "replay" in names and not args.recording:
+        parser.error("o cenário replay precisa de --recording")
+
+    results = {}
+
+    for name in names:
+        results[name] = run_scenario(
+            name,
+            frames=args.frames,
+            warmup=args.warmup,
+            seed=args.seed,
+            recording=args.recording,
+            dirty_rects=args.dirty_rects,
+            quality_level=args.quality,
+            pipelined=args.pipelined,
+            ai_workers=args.ai_workers,
+        )
+        print(
+            f"{name:<16}{results[name]['fps']:>10.2f} fps"
+            f"{results[name]['peak_rss_kb']:>12} KB",
+            file=sys.stderr,
+        )
+
+        if results[name]["loading_frames"]:
+            print(
+                f"{'':<16}{results[name]['loading_frames']:>10} frames"
+                " preparando um nível, o mais lento com"
+                f" {results[name]['loading_frame_ms']['max']} ms, dos"
+                f" quais {results[name]['loading_step_ms']['max']} ms"
+                " na preparação",
+                file=sys.stderr,
+            )
+
+    report = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(
+                results, json.load(baseline_file), args.tolerance,
+            )
+
+        for regression in regressions:
+            print(f"REGRESSÃO {regression}", file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
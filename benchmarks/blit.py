@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
+
+# Pastas de imagens medidas, pela categoria de asset
+FOLDERS: Tuple[Tuple[str, str], ...] = (
+    ("tiles", "graphics/grass"),
+    ("tiles", "graphics/objects"),
+    ("player", "graphics/player"),
+    ("monsters", "graphics/monsters"),
+    ("particles", "graphics/particles"),
+    ("weapons", "graphics/weapons"),
+)
+
+
+def _images(folder: str) -> List[str]:
+    return sorted(
+        f"{path}/{name}"
+        for path, _, names in os.walk(folder)
+        for name in names
+        if name.endswith(".png")
+    )
+
+
+def _blit_seconds(screen: Any, surfaces: List[Any], blits: int) -> float:
+    """Mede o tempo de desenhar cada superfície várias vezes, em
+    posições que se espalham pela tela.
+    """
+    width, height = screen.get_size()
+    sequence = [
+        (surface, ((index * 97) % width, (index * 61) % height))
+        for surface in surfaces
+        for index in range(blits)
+    ]
+
+    start = perf_counter()
+    screen.blits(sequence, False)
+
+    return perf_counter() - start
+
+
+def run(blits: int = 200, repeat: int = 5) -> Dict[str, Dict[str, Any]]:
+    """Compara a velocidade de desenho das imagens convertidas apenas com
+    convert_alpha com a das imagens no formato escolhido pelos assets.
+
+    Args:
+        blits (int, optional):
+            quantidade de vezes que cada imagem é desenhada em cada
+            medição. 200 por padrão.
+        repeat (int, optional):
+            quantidade de medições, das quais a mais rápida é usada.
+            5 por padrão.
+
+    Returns:
+        Dict[str, Dict[str, Any]]:
+            resultado por categoria e formato, no formato
+            'categoria/formato', com a quantidade de imagens e os blits
+            por segundo antes e depois da conversão
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    import pygame
+
+    from zelda.src.core.assets import classify_surface, optimize_surface
+    from zelda.src.settings import BASE_PATH, SCREEN_HEIGHT, SCREEN_WIDTH
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    groups: Dict[str, Tuple[List[Any], List[Any]]] = defaultdict(
+        lambda: ([], []),
+    )
+
+    for category, folder in FOLDERS:
+        for path in _images(f"{BASE_PATH}/{folder}"):
+            surface = pygame.image.load(path).convert_alpha()
+            kind = classify_surface(surface)
+            baseline, optimized = groups[f"{category}/{kind}"]
+
+            baseline.append(surface)
+            optimized.append(optimize_surface(surface.copy(), kind))
+
+    results = {}
+
+    for name, (baseline, optimized) in sorted(groups.items()):
+        count = len(baseline) * blits
+        before = min(
+            _blit_seconds(screen, baseline, blits) for _ in range(repeat)
+        )
+        after = min(
+            _blit_seconds(screen, optimized, blits) for _ in range(repeat)
+        )
+        results[name] = {
+            "images": len(baseline),
+            "convert_alpha_blits_per_s": round(count / before),
+            "optimized_blits_per_s": round(count / after),
+            "speedup": round(before / after, 2),
+        }
+
+    pygame.quit()
+
+    return results
+
+
+def main() -> int:
+    parser = ArgumentParser(
+        prog="python -m benchmarks.blit",
+        description=(
+            "Compara a velocidade de desenho dos assets por categoria e "
+            "formato."
+        ),
+    )
+    parser.add_argument("--blits", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="arquivo json com os resultados")
+
+    args = parser.parse_args()
+    results = run(args.blits, args.repeat)
+
+    for name, result in results.items():
+        print(
+            f"{name:<24}{result['images']:>6} imagens"
+            f"{result['speedup']:>10.2f}x",
+            file=sys.stderr,
+        )
+
+    report = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+import os
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from statistics import mean, median
+from time import perf_counter
+from typing import Any, Dict, List, Union
+
+Result = Dict[str, Any]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _summary_ms(values: List[float]) -> Dict[str, float]:
+    """Resume uma lista de tempos, em segundos, para milissegundos.
+    """
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+
+    return {
+        "mean": round(mean(values) * 1000, 4),
+        "p50": round(median(values) * 1000, 4),
+        "p95": round(_percentile(values, 0.95) * 1000, 4),
+        "max": round(max(values) * 1000, 4),
+    }
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # No macOS o valor é dado em bytes, no linux em kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _run_in_process(name: str,
+                    frames: int,
+                    warmup: int,
+                    seed: int,
+                    recording: Union[str, None],
+                    dirty_rects: bool,
+                    quality_level: int,
+                    pipelined: bool,
+                    ai_workers: Union[int, None]) -> Result:
+    """Executa um cenário no processo atual, sem janela nem áudio.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+
+    from benchmarks.scenarios import SCENARIOS
+    from zelda.src.core import quality, rng
+    from zelda.src.core.clock import advance as advance_game_clock
+    from zelda.src.core.clock import use_fixed_step
+    from zelda.src.core.input import Recording
+    from zelda.src.core.render_thread import RenderThread
+    from zelda.src.levels.level_manager import LevelManager
+    from zelda.src.levels.main_level import MainLevel
+    from zelda.src.settings import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+
+    scenario = SCENARIOS[name]
+
+    if recording:
+        scenario.recording = Recording.load(recording)
+
+    # O tempo do jogo avança em passos fixos para que timers e cooldowns
+    # não dependam da velocidade da máquina
+    rng.seed(scenario.seed(seed))
+    use_fixed_step(FPS)
+    quality.set_level(quality_level)
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # A pasta temporária fica disponível durante todo o cenário, já que
+    # ele pode carregar outros mapas gerados nela
+    workdir = tempfile.TemporaryDirectory()
+
+    # Argumentos de todos os níveis do cenário, além do mapa
+    options = {
+        "input_source": scenario.input_source(),
+        "dirty_rects": dirty_rects,
+        "ai_workers": ai_workers,
+    }
+
+    start = perf_counter()
+    level = MainLevel(
+        screen, map_path=scenario.map_path(workdir.name), **options,
+    )
+    scenario.setup(level)
+    load_time = perf_counter() - start
+
+    manager = LevelManager(screen, level)
+    render_thread = RenderThread(screen) if pipelined else None
+
+    frame_times = []
+    presented = []
+    screen_area = SCREEN_WIDTH * SCREEN_HEIGHT
+
+    # Frames em que um nível estava sendo preparado, e o tempo gasto na
+    # preparação em cada um deles, medidos desde o início, inclusive
+    # durante o aquecimento
+    loading_times = []
+    loading_steps = []
+    switches = 0
+
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            level.profiler.enabled = True
+            level.profiler.reset()
+            frame_times.clear()
+            presented.clear()
+
+        start = perf_counter()
+
+        scenario.switch_level(manager, frame, options)
+        loading = manager.loading
+
+        step_start = perf_counter()
+        switched = manager.update()
+
+        if loading:
+            loading_steps.append(perf_counter() - step_start)
+
+        if switched:
+            # As medições das etapas continuam no próximo nível
+            for stage, timings in level.profiler.timings.items():
+                manager.current.profiler.timings[stage].extend(timings)
+
+            manager.current.profiler.enabled = level.profiler.enabled
+            level = manager.current
+            switches += 1
+
+        level.input_source.poll(())
+
+        if level.input_source.menu_toggled:
+            level.toggle_menu()
+
+        scenario.step(level, frame)
+
+        if render_thread:
+            level.run_pipelined(render_thread)
+            present = render_thread.last_present
+        else:
+            level.run()
+            present = level.dirty_regions.collect()
+
+        advance_game_clock()
+
+        frame_times.append(perf_counter() - start)
+        presented.append(sum(
+            rect.width * rect.height for rect in present
+        ) / screen_area)
+
+        # O frame da troca já é do próximo nível, e não entra na medição
+        if loading and not switched:
+            loading_times.append(frame_times[-1])
+
+    if render_thread:
+        # O último frame entregue ainda faz parte da medição
+        start = perf_counter()
+        render_thread.close()
+        frame_times[-1] += perf_counter() - start
+
+    total_time = sum(frame_times)
+    level.close()
+    pygame.quit()
+    workdir.cleanup()
+
+    return {
+        "frames": frames,
+        "fps": round(frames / total_time, 2),
+        "load_ms": round(load_time * 1000, 2),
+        "frame_ms": _summary_ms(frame_times),
+        "stages_ms": {
+            stage: _summary_ms(timings)
+            for stage, timings in level.profiler.timings.items()
+        },
+        "presented": round(mean(presented), 4),
+        "quality": quality.get_level(),
+        "pipelined": pipelined,
+        "ai_workers": ai_workers,
+        "sprites": len(level.visible_sprites),
+        "loading_frames": len(loading_times),
+        "loading_frame_ms": _summary_ms(loading_times),
+        "loading_step_ms": _summary_ms(loading_steps),
+        "switches": switches,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def run_scenario(name: str,
+                 frames: int = 600,
+                 warmup: int = 60,
+                 seed: int = 0,
+                 recording: Union[str, None] = None,
+                 dirty_rects: bool = False,
+                 quality_level: int = 0,
+                 pipelined: bool = False,
+                 ai_workers: Union[int, None] = None) -> Result:
+    """Executa um cenário em um processo novo.
+
+    Um processo por cenário garante que o pico de memória medido
+    pertence apenas ao cenário executado.
+
+    Args:
+        name (str): nome do cenário
+        frames (int, optional): frames medidos. 600 por padrão.
+        warmup (int, optional):
+            frames executados antes das medições. 60 por padrão.
+        seed (int, optional): semente aleatória. 0 por padrão.
+        recording (Union[str, None], optional):
+            gravação usada pelo cenário replay. None por padrão.
+        dirty_rects (bool, optional):
+            registra apenas as áreas alteradas em cada frame. False por
+            padrão.
+        quality_level (int, optional):
+            nível de qualidade fixo durante o cenário. 0 por padrão.
+        pipelined (bool, optional):
+            desenha cada frame em uma thread de renderização enquanto o
+            próximo é simulado. False por padrão.
+        ai_workers (Union[int, None], optional):
+            processos que calculam a IA dos inimigos, sendo 0 o cálculo
+            em lote no próprio processo. None por padrão.
+
+    Returns:
+        Result: métricas do cenário
+    """
+    # Os processos do ProcessPoolExecutor não são daemon, e por isso
+    # podem criar os workers da IA dos inimigos
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(
+            _run_in_process,
+            name, frames, warmup, seed, recording, dirty_rects,
+            quality_level, pipelined, ai_workers,
+        ).result()
+
+
+def compare(results: Dict[str, Result],
+            baseline: Dict[str, Result],
+            tolerance: float) -> List[str]:
+    """Compara os resultados com um baseline salvo anteriormente.
+
+    Args:
+        results (Dict[str, Result]): resultados por cenário
+        baseline (Dict[str, Result]): baseline por cenário
+        tolerance (float): variação relativa aceita, 0.1 para 10%
+
+    Returns:
+        List[str]: descrição de cada regressão encontrada
+    """
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        reference = baseline[name]
+
+        if result["fps"] < reference["fps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: fps {result['fps']} < {reference['fps']}"
+            )
+
+        if result["peak_rss_kb"] > reference["peak_rss_kb"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak_rss_kb {result['peak_rss_kb']}"
+                f" > {reference['peak_rss_kb']}"
+            )
+
+        for stage, timings in result["stages_ms"].items():
+            reference_stage = reference["stages_ms"].get(stage)
+
+            if (
+                reference_stage
+                and timings["mean"] > reference_stage["mean"] * (1 + tolerance)
+            ):
+                regressions.append(
+                    f"{name}: {stage} {timings['mean']}ms"
+                    f" > {reference_stage['mean']}ms"
+                )
+
+    return regressions
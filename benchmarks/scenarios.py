@@ -0,0 +1,282 @@
+from typing import Any, Dict, List, Tuple, Union
+
+from pygame import Rect
+from pygame.sprite import Sprite
+
+from zelda.src.core.input import (
+    InputSource,
+    Recording,
+    ReplayInput,
+    ScriptedInput,
+)
+from zelda.src.levels.level_manager import LevelManager
+from zelda.src.levels.main_level import MainLevel
+from zelda.src.settings import MAP_PATH, MONSTER_DATA, TILESIZE
+from zelda.src.core.map_generator import generate_map, scale_to_grid
+
+
+class Scenario:
+    """Cenário reproduzível executado sobre um MainLevel headless.
+
+    Subclasses podem gerar um mapa próprio em map_path, preparar o
+    nível em setup e interferir a cada frame em step.
+    """
+
+    name: str = ""
+    description: str = ""
+
+    # Cenários muito lentos ficam fora da execução padrão e precisam
+    # ser pedidos explicitamente
+    default: bool = True
+
+    def seed(self, default: int) -> int:
+        """Retorna a semente aleatória utilizada pelo cenário.
+
+        Args:
+            default (int): semente pedida na linha de comando
+        """
+        return default
+
+    def input_source(self) -> InputSource:
+        """Retorna a fonte de entradas do player, por padrão nenhuma
+        tecla pressionada.
+        """
+        return ScriptedInput()
+
+    def map_path(self, workdir: str) -> str:
+        """Retorna a pasta do mapa utilizado pelo cenário.
+
+        Args:
+            workdir (str): pasta temporária disponível para o cenário
+        """
+        return MAP_PATH
+
+    def setup(self, level: MainLevel) -> None:
+        pass
+
+    def step(self, level: MainLevel, frame: int) -> None:
+        pass
+
+    def switch_level(self,
+                     manager: LevelManager,
+                     frame: int,
+                     options: Dict[str, Any]) -> None:
+        """Pede a preparação ou a troca de nível, antes de cada frame.
+
+        Args:
+            manager (LevelManager): gerenciador do nível medido
+            frame (int): frame atual, contando o aquecimento
+            options (Dict[str, Any]):
+                argumentos do MainLevel usados em todos os níveis, além
+                do mapa
+        """
+        pass
+
+
+class Idle(Scenario):
+    name = "idle"
+    description = "player parado no mapa original"
+
+
+class EnemyChase(Scenario):
+    name = "enemy_chase"
+    description = "200 inimigos perseguindo o player"
+
+    count = 200
+
+    def setup(self, level: MainLevel) -> None:
+        names = list(MONSTER_DATA.keys())
+
+        for i, position in enumerate(
+            free_positions_around(level, level.player.rect.center, self.count)
+        ):
+            level.spawn_enemy(names[i % len(names)], position)
+
+
+class _AttackArea(Sprite):
+    """Área de ataque invisível usada para cortar a grama.
+    """
+
+    def __init__(self, rect: Rect) -> None:
+        super().__init__()
+        self.rect = rect
+
+
+class GrassCutting(Scenario):
+    name = "grass_cutting"
+    description = "grama cortada em massa com partículas de folhas"
+
+    interval = 4
+    batch = 3
+
+    def setup(self, level: MainLevel) -> None:
+        center = level.player.rect.center
+        self.__grass = sorted(
+            (s for s in level.attackable_sprites
+             if getattr(s, "sprite_type", None) == "grass"),
+            key=lambda s: distance_sq(s.rect.center, center),
+        )
+
+    def step(self, level: MainLevel, frame: int) -> None:
+        level.attack_sprites.empty()
+
+        if frame % self.interval or not self.__grass:
+            return
+
+        for _ in range(min(self.batch, len(self.__grass))):
+            level.attack_sprites.add(
+                _AttackArea(self.__grass.pop(0).rect.copy()),
+            )
+
+
+class FlameCasting(Scenario):
+    name = "flame_casting"
+    description = "magia de fogo lançada continuamente"
+
+    interval = 10
+
+    def step(self, level: MainLevel, frame: int) -> None:
+        if frame % self.interval:
+            return
+
+        level.current_attack_type = "magic"
+        level.magic_player.flame(
+            player=level.player,
+            cost=0,
+            groups=[
+                level.visible_sprites,
+                level.updatable_sprites,
+                level.attack_sprites,
+            ],
+        )
+
+
+class SyntheticMap(Scenario):
+    """Player parado em um mapa gerado com a área multiplicada.
+    """
+
+    def __init__(self, scale: int, default: bool = True) -> None:
+        self.scale = scale
+        self.default = default
+        self.name = f"map_{scale}x"
+        self.description = f"mapa espelhado {scale}x maior que o original"
+
+    def map_path(self, workdir: str) -> str:
+        return generate_map(
+            f"{workdir}/{self.name}",
+            *scale_to_grid(self.scale),
+            mode="mirror",
+        )
+
+
+class LevelSwitch(Scenario):
+    """Player parado no mapa original enquanto um mapa maior é preparado
+    em segundo plano, com a troca feita assim que ele fica pronto.
+    """
+
+    name = "level_switch"
+    description = "troca em segundo plano para um mapa espelhado 4x maior"
+
+    scale = 4
+
+    # O próximo nível é pedido depois dos primeiros frames, que já são
+    # mais lentos no mapa original, e a troca no frame seguinte, com a
+    # leitura do mapa já em andamento em outra thread
+    preload_frame = 30
+    switch_frame = 31
+
+    target: Union[str, None] = None
+
+    def map_path(self, workdir: str) -> str:
+        self.target = generate_map(
+            f"{workdir}/{self.name}",
+            *scale_to_grid(self.scale),
+            mode="mirror",
+        )
+
+        return MAP_PATH
+
+    def switch_level(self,
+                     manager: LevelManager,
+                     frame: int,
+                     options: Dict[str, Any]) -> None:
+        if frame == self.preload_frame:
+            manager.preload(MainLevel, map_path=self.target, **options)
+        elif frame == self.switch_frame:
+            manager.switch()
+
+
+class Replay(Scenario):
+    name = "replay"
+    default = False
+    description = "sessão gravada com python -m zelda --record"
+
+    recording: Union[Recording, None] = None
+
+    def seed(self, default: int) -> int:
+        return self.recording.seed
+
+    def input_source(self) -> InputSource:
+        return ReplayInput(self.recording)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Idle(),
+        EnemyChase(),
+        GrassCutting(),
+        FlameCasting(),
+        SyntheticMap(4),
+        SyntheticMap(16),
+        SyntheticMap(64, default=False),
+        LevelSwitch(),
+        Replay(),
+    )
+}
+
+
+def distance_sq(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+
+
+def free_positions_around(level: MainLevel,
+                          center: Tuple[int, int],
+                          count: int) -> List[Tuple[int, int]]:
+    """Busca posições livres de obstáculos mais próximas de um ponto.
+
+    Args:
+        level (MainLevel): nível em que as posições serão buscadas
+        center (Tuple[int, int]): ponto de referência, em pixels
+        count (int): quantidade de posições desejadas
+
+    Returns:
+        List[Tuple[int, int]]: posições livres ordenadas pela distância
+    """
+    hitboxes = [s.hitbox for s in level.obstacle_sprites]
+    hitboxes.append(level.player.hitbox)
+
+    origin_x = center[0] // TILESIZE
+    origin_y = center[1] // TILESIZE
+    radius = 1
+    positions: List[Tuple[int, int]] = []
+
+    while len(positions) < count and radius < 200:
+        ring = [
+            (origin_x + dx, origin_y + dy)
+            for dx in range(-radius, radius + 1)
+            for dy in range(-radius, radius + 1)
+            if max(abs(dx), abs(dy)) == radius
+        ]
+
+        for cell_x, cell_y in ring:
+            rect = Rect(cell_x * TILESIZE, cell_y * TILESIZE,
+                        TILESIZE, TILESIZE)
+
+            if rect.collidelist(hitboxes) == -1:
+                positions.append(rect.topleft)
+                hitboxes.append(rect)
+
+        radius += 1
+
+    return positions[:count]
@@ -1,4 +1,48 @@
+from argparse import ArgumentParser
+
 from zelda.src.game import Game
 
-game = Game()
+parser = ArgumentParser(prog="python -m zelda")
+parser.add_argument("--seed", type=int, help="semente do gerador aleatório")
+parser.add_argument("--record", help="grava as entradas da sessão no arquivo")
+parser.add_argument("--replay", help="reproduz uma sessão gravada")
+parser.add_argument(
+    "--headless", action="store_true",
+    help="roda sem janela e sem áudio, útil para replays",
+)
+parser.add_argument(
+    "--dirty-rects", action="store_true",
+    help="atualiza apenas as áreas da tela que mudaram",
+)
+parser.add_argument(
+    "--save", help="salva o jogo automaticamente e continua do arquivo",
+)
+parser.add_argument(
+    "--stream",
+    help="transmite o estado das entidades para o arquivo ou pipe",
+)
+parser.add_argument(
+    "--pipelined", action="store_true",
+    help="desenha cada frame em outra thread enquanto simula o próximo",
+)
+parser.add_argument(
+    "--ai-workers", type=int,
+    help="processos que calculam a IA dos inimigos, 0 no processo atual",
+)
+args = parser.parse_args()
+
+if args.save and (args.record or args.replay):
+    parser.error("--save não pode ser usado com --record ou --replay")
+
+game = Game(
+    seed=args.seed,
+    record_path=args.record,
+    replay_path=args.replay,
+    headless=args.headless,
+    dirty_rects=args.dirty_rects,
+    save_path=args.save,
+    stream_path=args.stream,
+    pipelined=args.pipelined,
+    ai_workers=args.ai_workers,
+)
 game.run()
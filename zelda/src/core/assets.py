@@ -0,0 +1,585 @@
+import os
+from typing import Dict, Iterator, List, Set, Tuple, Union
+
+from pygame import RLEACCEL, Rect, Surface
+from pygame.font import Font
+from pygame.image import load as load_image
+from pygame.mask import from_surface as mask_from_surface
+from pygame.mask import from_threshold as mask_from_threshold
+from pygame.mixer import Sound
+from pygame.transform import flip as flip_surface
+
+from zelda.src.core.utils import import_csv
+
+# Formatos em que as imagens são guardadas, do mais rápido de desenhar
+# ao mais lento: sem transparência, com uma cor transparente (colorkey)
+# ou com transparência por pixel
+OPAQUE = "opaque"
+COLORKEY = "colorkey"
+ALPHA = "alpha"
+
+# Cor transparente das imagens guardadas com colorkey
+COLORKEY_COLOR = (255, 0, 255)
+
+# Caches dos assets já carregados no processo, indexados pelo caminho.
+# Os valores são compartilhados entre todos os níveis e não devem ser
+# modificados por quem os recebe.
+_folders: Dict[str, List[Surface]] = {}
+_named_folders: Dict[str, Dict[str, Surface]] = {}
+_animations: Dict[str, Dict[str, List[Surface]]] = {}
+_hidden_animations: Dict[str, Dict[str, List[Surface]]] = {}
+_hidden_surfaces: Dict[Tuple[int, int], Surface] = {}
+_surfaces: Dict[str, Surface] = {}
+_layouts: Dict[str, List[List[str]]] = {}
+_sounds: Dict[str, Sound] = {}
+_fonts: Dict[tuple, Font] = {}
+_tiles: Dict[Tuple[str, int, int], List[Tuple[Surface, Rect]]] = {}
+_reflected_folders: Dict[str, List[Surface]] = {}
+
+# Formato escolhido para cada imagem carregada, pelo caminho do arquivo
+_kinds: Dict[str, str] = {}
+
+# Imagens lidas do disco por prefetch, ainda não convertidas para o
+# formato da tela, e arquivos que já passaram pela conversão
+_decoded: Dict[str, Surface] = {}
+_loaded: Set[str] = set()
+
+
+def _load_image(path: str) -> Surface:
+    """Lê uma imagem do disco, reaproveitando a leitura feita por
+    prefetch quando houver.
+    """
+    _loaded.add(path)
+    surface = _decoded.pop(path, None)
+
+    return load_image(path) if surface is None else surface
+
+
+def classify_surface(surface: Surface) -> str:
+    """Define o formato mais rápido de desenhar que mantém os pixels de
+    uma imagem.
+
+    Args:
+        surface (Surface): imagem com transparência por pixel
+
+    Returns:
+        str:
+            OPAQUE, quando todos os pixels são opacos, COLORKEY, quando
+            os pixels são apenas opacos ou totalmente transparentes e a
+            cor transparente não aparece na imagem, ou ALPHA
+    """
+    width, height = surface.get_size()
+    opaque = mask_from_surface(surface, 254)
+
+    if opaque.count() == width * height:
+        return OPAQUE
+
+    if mask_from_surface(surface, 0).count() == opaque.count():
+        colorkey = mask_from_threshold(
+            surface, COLORKEY_COLOR, (1, 1, 1, 255),
+        )
+
+        if not colorkey.overlap_area(opaque, (0, 0)):
+            return COLORKEY
+
+    return ALPHA
+
+
+def optimize_surface(surface: Surface,
+                     kind: Union[str, None] = None) -> Surface:
+    """Converte uma imagem com transparência por pixel para o formato
+    mais rápido de desenhar.
+
+    As imagens opacas perdem o canal alpha, as com colorkey são
+    desenhadas sobre a cor transparente e comprimidas com RLEACCEL, e as
+    com transparência por pixel são comprimidas com RLEACCEL na própria
+    superfície recebida.
+
+    Args:
+        surface (Surface): imagem com transparência por pixel
+        kind (Union[str, None], optional):
+            formato da imagem, definido com classify_surface quando não
+            informado. None por padrão.
+
+    Returns:
+        Surface: imagem convertida
+    """
+    if kind is None:
+        kind = classify_surface(surface)
+
+    if kind == OPAQUE:
+        return surface.convert()
+
+    if kind == COLORKEY:
+        optimized = Surface(surface.get_size()).convert()
+        optimized.fill(COLORKEY_COLOR)
+        optimized.blit(surface, (0, 0))
+        optimized.set_colorkey(COLORKEY_COLOR, RLEACCEL)
+
+        return optimized
+
+    surface.set_alpha(255, RLEACCEL)
+
+    return surface
+
+
+def _load_optimized(path: str) -> Surface:
+    """Lê uma imagem e a converte para o formato mais rápido de
+    desenhar, guardando o formato escolhido.
+    """
+    surface = _load_image(path).convert_alpha()
+    _kinds[path] = classify_surface(surface)
+
+    return optimize_surface(surface, _kinds[path])
+
+
+def get_surface_kind(path: str) -> str:
+    """Retorna o formato escolhido para uma imagem já carregada.
+
+    Args:
+        path (str): caminho da imagem
+
+    Returns:
+        str: OPAQUE, COLORKEY ou ALPHA
+    """
+    return _kinds[path]
+
+
+def surface_kinds() -> Dict[str, str]:
+    """Retorna o formato escolhido para cada imagem já carregada.
+
+    Returns:
+        Dict[str, str]: formato pelo caminho da imagem
+    """
+    return dict(_kinds)
+
+
+def prefetch(path: str) -> None:
+    """Lê do disco e decodifica as imagens de um arquivo ou de uma
+    pasta, recursivamente, sem convertê-las.
+
+    Pode ser chamada fora da thread principal, já que a conversão para
+    o formato da tela, que depende do display, fica para quando a
+    imagem for pedida pelas outras funções deste módulo.
+
+    Args:
+        path (str): caminho da imagem ou da pasta
+    """
+    if os.path.isfile(path):
+        files = [path]
+    else:
+        files = [
+            f"{folder}/{name}"
+            for folder, _, names in os.walk(path)
+            for name in names
+        ]
+
+    for file in files:
+        if (
+            file.endswith(".png")
+            and file not in _loaded
+            and file not in _decoded
+        ):
+            _decoded[file] = load_image(file)
+
+
+def build_folder(path: str) -> Iterator[None]:
+    """Carrega as imagens de uma pasta, parando após cada imagem, para
+    que a conversão possa ser dividida entre vários frames.
+
+    Args:
+        path (str): caminho para a pasta com as imagens
+    """
+    if path in _folders:
+        return
+
+    surfaces = []
+
+    for _, __, names in os.walk(path):
+        for name in sorted(names):
+            surfaces.append(_load_optimized(f"{path}/{name}"))
+            yield
+
+    _folders[path] = surfaces
+
+
+def get_folder(path: str) -> List[Surface]:
+    """Retorna as imagens de uma pasta, carregando-as apenas na primeira
+    chamada.
+
+    Args:
+        path (str): caminho para a pasta com as imagens
+
+    Returns:
+        List[Surface]: superfícies ordenadas pelo nome do arquivo
+    """
+    for _ in build_folder(path):
+        pass
+
+    return _folders[path]
+
+
+def build_reflected_folder(path: str) -> Iterator[None]:
+    """Cria as imagens de uma pasta espelhadas em x, parando após cada
+    imagem.
+
+    Args:
+        path (str): caminho para a pasta com as imagens
+    """
+    if path in _reflected_folders:
+        return
+
+    yield from build_folder(path)
+
+    surfaces = []
+
+    # O espelhamento não mantém a compressão das imagens com
+    # transparência por pixel, por isso elas são convertidas de novo
+    for surface in _folders[path]:
+        surfaces.append(optimize_surface(flip_surface(surface, True, False)))
+        yield
+
+    _reflected_folders[path] = surfaces
+
+
+def get_reflected_folder(path: str) -> List[Surface]:
+    """Retorna as imagens de uma pasta espelhadas em x, criando-as apenas
+    na primeira chamada.
+
+    Args:
+        path (str): caminho para a pasta com as imagens
+
+    Returns:
+        List[Surface]: superfícies espelhadas, na ordem de get_folder
+    """
+    for _ in build_reflected_folder(path):
+        pass
+
+    return _reflected_folders[path]
+
+
+def build_named_folder(path: str) -> Iterator[None]:
+    """Carrega as imagens de uma pasta indexadas pelo nome do arquivo,
+    parando após cada imagem.
+
+    Args:
+        path (str): caminho para a pasta com as imagens
+    """
+    if path in _named_folders:
+        return
+
+    surfaces = {}
+
+    for _, __, names in os.walk(path):
+        for name in sorted(names):
+            surfaces[name.replace(".png", "")] = _load_optimized(
+                f"{path}/{name}",
+            )
+            yield
+
+    _named_folders[path] = surfaces
+
+
+def get_named_folder(path: str) -> Dict[str, Surface]:
+    """Retorna as imagens de uma pasta indexadas pelo nome do arquivo,
+    carregando-as apenas na primeira chamada.
+
+    Args:
+        path (str): caminho para a pasta com as imagens
+
+    Returns:
+        Dict[str, Surface]:
+            dicionário com o nome do arquivo, sem extensão, e a
+            superfície da imagem
+    """
+    for _ in build_named_folder(path):
+        pass
+
+    return _named_folders[path]
+
+
+def build_animations(path: str) -> Iterator[None]:
+    """Carrega as animações de uma entidade, parando após cada imagem.
+
+    Args:
+        path (str): pasta em que cada subpasta é uma animação
+    """
+    if path in _animations:
+        return
+
+    names = [
+        name for name in os.listdir(path)
+        if os.path.isdir(f"{path}/{name}")
+    ]
+
+    for name in names:
+        yield from build_folder(f"{path}/{name}")
+
+    _animations[path] = {
+        name: get_folder(f"{path}/{name}") for name in names
+    }
+
+
+def get_animations(path: str) -> Dict[str, List[Surface]]:
+    """Retorna as animações de uma entidade, uma por subpasta.
+
+    Args:
+        path (str): pasta em que cada subpasta é uma animação
+
+    Returns:
+        Dict[str, List[Surface]]:
+            dicionário com o nome da subpasta e os frames da animação
+    """
+    for _ in build_animations(path):
+        pass
+
+    return _animations[path]
+
+
+def _get_hidden_surface(size: Tuple[int, int]) -> Surface:
+    """Retorna uma superfície invisível, compartilhada por tamanho.
+
+    A superfície é toda preenchida com a cor transparente e comprimida
+    com RLEACCEL, de forma que desenhá-la praticamente não custa nada.
+    """
+    if size not in _hidden_surfaces:
+        surface = Surface(size)
+        surface.set_colorkey((0, 0, 0), RLEACCEL)
+        _hidden_surfaces[size] = surface
+
+    return _hidden_surfaces[size]
+
+
+def get_hidden_animations(path: str) -> Dict[str, List[Surface]]:
+    """Retorna as variantes invisíveis das animações de uma entidade,
+    usadas no flicker da invencibilidade no lugar de alterar a
+    transparência dos frames compartilhados.
+
+    Args:
+        path (str): pasta em que cada subpasta é uma animação
+
+    Returns:
+        Dict[str, List[Surface]]:
+            dicionário com o nome da subpasta e um frame invisível, do
+            mesmo tamanho, para cada frame da animação
+    """
+    if path not in _hidden_animations:
+        _hidden_animations[path] = {
+            name: [_get_hidden_surface(frame.get_size()) for frame in frames]
+            for name, frames in get_animations(path).items()
+        }
+
+    return _hidden_animations[path]
+
+
+def get_image(path: str, alpha: bool = True) -> Surface:
+    """Retorna uma imagem já convertida para o formato da tela.
+
+    Args:
+        path (str): caminho da imagem
+        alpha (bool, optional):
+            define se a imagem mantém a transparência, no formato mais
+            rápido de desenhar. True por padrão.
+
+    Returns:
+        Surface: superfície da imagem
+    """
+    if path not in _surfaces:
+        _surfaces[path] = (
+            _load_optimized(path) if alpha else _load_image(path).convert()
+        )
+
+    return _surfaces[path]
+
+
+def build_image_tiles(path: str,
+                      flip: int = 0,
+                      tile_size: int = 512) -> Iterator[None]:
+    """Divide uma imagem opaca em blocos convertidos para o formato da
+    tela, parando após cada bloco.
+
+    Cada bloco custa pouco para ser convertido ou espelhado, de forma
+    que imagens muito grandes podem ser preparadas aos poucos, entre
+    frames. As variações espelhadas são criadas a partir dos blocos já
+    convertidos da imagem original.
+
+    Args:
+        path (str): caminho da imagem
+        flip (int, optional):
+            soma de 1 (espelhado em x) e 2 (espelhado em y). 0 por
+            padrão.
+        tile_size (int, optional): lado de cada bloco. 512 por padrão.
+    """
+    key = (path, flip, tile_size)
+
+    if key in _tiles:
+        return
+
+    tiles = []
+
+    if flip:
+        yield from build_image_tiles(path, 0, tile_size)
+
+        base = _tiles[(path, 0, tile_size)]
+        width = max(rect.right for _, rect in base)
+        height = max(rect.bottom for _, rect in base)
+
+        for surface, rect in base:
+            rect = rect.copy()
+
+            # Posição do bloco na imagem espelhada
+            if flip & 1:
+                rect.x = width - rect.right
+
+            if flip & 2:
+                rect.y = height - rect.bottom
+
+            tiles.append((
+                flip_surface(surface, bool(flip & 1), bool(flip & 2)),
+                rect,
+            ))
+            yield
+    else:
+        image = _load_image(path)
+
+        for y in range(0, image.get_height(), tile_size):
+            for x in range(0, image.get_width(), tile_size):
+                rect = Rect(x, y, tile_size, tile_size).clip(image.get_rect())
+                tiles.append((image.subsurface(rect).convert(), rect))
+                yield
+
+    _tiles[key] = tiles
+
+
+def get_image_tiles(path: str,
+                    flip: int = 0,
+                    tile_size: int = 512) -> List[Tuple[Surface, Rect]]:
+    """Retorna os blocos de uma imagem opaca, criando-os caso ainda não
+    existam.
+
+    Args:
+        path (str): caminho da imagem
+        flip (int, optional):
+            soma de 1 (espelhado em x) e 2 (espelhado em y). 0 por
+            padrão.
+        tile_size (int, optional): lado de cada bloco. 512 por padrão.
+
+    Returns:
+        List[Tuple[Surface, Rect]]:
+            superfície de cada bloco e a posição dele na imagem
+    """
+    for _ in build_image_tiles(path, flip, tile_size):
+        pass
+
+    return _tiles[(path, flip, tile_size)]
+
+
+def get_layout(path: str) -> List[List[str]]:
+    """Retorna uma camada do mapa lida de um arquivo csv.
+
+    Args:
+        path (str): caminho para o arquivo csv
+
+    Returns:
+        List[List[str]]: matriz da camada
+    """
+    if path not in _layouts:
+        _layouts[path] = import_csv(path)
+
+    return _layouts[path]
+
+
+def get_sound(path: str) -> Sound:
+    """Retorna um som decodificado uma única vez por processo.
+
+    Args:
+        path (str): caminho do arquivo de áudio
+
+    Returns:
+        Sound: som compartilhado
+    """
+    if path not in _sounds:
+        _sounds[path] = Sound(path)
+
+    return _sounds[path]
+
+
+def get_font(path: str, size: int) -> Font:
+    """Retorna uma fonte carregada uma única vez por processo.
+
+    Args:
+        path (str): caminho do arquivo da fonte
+        size (int): tamanho da fonte
+
+    Returns:
+        Font: fonte compartilhada
+    """
+    if (path, size) not in _fonts:
+        _fonts[(path, size)] = Font(path, size)
+
+    return _fonts[(path, size)]
+
+
+def cached_surfaces() -> Iterator[Tuple[str, Surface]]:
+    """Itera sobre as superfícies dos caches, uma vez cada, junto com o
+    caminho de onde vieram.
+
+    As superfícies invisíveis, indexadas pelo tamanho, recebem um
+    caminho no formato 'hidden:LARGURAxALTURA'.
+
+    Yields:
+        Tuple[str, Surface]: caminho e superfície
+    """
+    seen = set()
+
+    def unseen(path: str, surfaces) -> Iterator[Tuple[str, Surface]]:
+        for surface in surfaces:
+            if id(surface) not in seen:
+                seen.add(id(surface))
+                yield path, surface
+
+    for path, frames in _folders.items():
+        yield from unseen(path, frames)
+
+    for path, named in _named_folders.items():
+        yield from unseen(path, named.values())
+
+    for path, frames in _reflected_folders.items():
+        yield from unseen(path, frames)
+
+    for path, surface in _surfaces.items():
+        yield from unseen(path, [surface])
+
+    for (path, *_), tiles in _tiles.items():
+        yield from unseen(path, (surface for surface, _ in tiles))
+
+    for (width, height), surface in _hidden_surfaces.items():
+        yield from unseen(f"hidden:{width}x{height}", [surface])
+
+
+def cached_sounds() -> Iterator[Tuple[str, Sound]]:
+    """Itera sobre os sons do cache, junto com o caminho do arquivo.
+    """
+    yield from _sounds.items()
+
+
+def clear() -> None:
+    """Descarta todos os assets carregados.
+    """
+    for cache in (
+        _folders,
+        _named_folders,
+        _animations,
+        _hidden_animations,
+        _hidden_surfaces,
+        _surfaces,
+        _layouts,
+        _sounds,
+        _fonts,
+        _tiles,
+        _reflected_folders,
+        _kinds,
+        _decoded,
+        _loaded,
+    ):
+        cache.clear()
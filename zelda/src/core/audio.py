@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Dict, List, Tuple
+
+from pygame import mixer
+from pygame.mixer import Channel, Sound
+
+from zelda.src.core.assets import get_sound
+from zelda.src.settings import SOUND_FRAME_BUDGET
+
+
+@dataclass(eq=False)
+class SoundEffect:
+    """Efeito sonoro tocado através do gerenciador de vozes.
+
+    O som decodificado é compartilhado entre todos os efeitos com o
+    mesmo arquivo, e o volume é aplicado no canal, sem alterar o som
+    compartilhado.
+
+    Args:
+        path (str): caminho do arquivo de áudio
+        volume (float): volume do efeito, entre 0 e 1
+        max_voices (int):
+            quantidade máxima de instâncias simultâneas do mesmo arquivo
+        priority (int):
+            prioridade do efeito, que pode interromper efeitos de
+            prioridade menor ou igual quando não há canais livres
+    """
+    path: str
+    volume: float = 1.0
+    max_voices: int = 2
+    priority: int = 0
+    sound: Sound = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sound = get_sound(self.path)
+
+    def play(self) -> bool:
+        """Toca o efeito, respeitando os limites do gerenciador.
+
+        Returns:
+            bool: define se o efeito começou a tocar
+        """
+        return play(self)
+
+
+# Canais do mixer e o efeito tocando em cada um, com a ordem em que
+# ele começou a tocar
+_channels: List[Channel] = []
+_voices: Dict[int, Tuple[SoundEffect, int]] = {}
+_order = count()
+_frame_plays = 0
+
+
+def _prune_voices() -> None:
+    """Descarta as vozes que já terminaram ou cujo canal foi usado por
+    um som tocado fora do gerenciador.
+    """
+    if len(_channels) != mixer.get_num_channels():
+        _channels[:] = [Channel(i) for i in range(mixer.get_num_channels())]
+        _voices.clear()
+
+    for index, (effect, _) in list(_voices.items()):
+        channel = _channels[index]
+
+        if not channel.get_busy() or channel.get_sound() is not effect.sound:
+            del _voices[index]
+
+
+def _find_channel(effect: SoundEffect) -> Tuple[int, bool]:
+    """Escolhe o canal para um efeito, roubando se necessário a voz de
+    menor prioridade e mais antiga.
+
+    Returns:
+        Tuple[int, bool]:
+            índice do canal, ou -1 caso nenhum esteja disponível, e se
+            uma voz precisou ser interrompida
+    """
+    for index, channel in enumerate(_channels):
+        if not channel.get_busy():
+            return index, False
+
+    candidates = [
+        (other.priority, order, index)
+        for index, (other, order) in _voices.items()
+        if other.priority <= effect.priority
+    ]
+
+    if not candidates:
+        return -1, False
+
+    return min(candidates)[2], True
+
+
+def play(effect: SoundEffect) -> bool:
+    """Toca um efeito sonoro se os limites permitirem.
+
+    O efeito é ignorado quando o orçamento de sons do frame acabou,
+    quando ele já atingiu o limite de instâncias simultâneas ou quando
+    todos os canais tocam efeitos de prioridade maior.
+
+    Args:
+        effect (SoundEffect): efeito tocado
+
+    Returns:
+        bool: define se o efeito começou a tocar
+    """
+    global _frame_plays
+
+    if not mixer.get_init() or _frame_plays >= SOUND_FRAME_BUDGET:
+        return False
+
+    _prune_voices()
+
+    voices = sum(
+        1 for other, _ in _voices.values() if other.sound is effect.sound
+    )
+
+    if voices >= effect.max_voices:
+        return False
+
+    index, stolen = _find_channel(effect)
+
+    if index < 0:
+        return False
+
+    channel = _channels[index]
+
+    if stolen:
+        channel.stop()
+
+    channel.play(effect.sound)
+    channel.set_volume(effect.volume)
+
+    _voices[index] = (effect, next(_order))
+    _frame_plays += 1
+
+    return True
+
+
+def next_frame() -> None:
+    """Renova o orçamento de sons para um novo frame.
+    """
+    global _frame_plays
+    _frame_plays = 0
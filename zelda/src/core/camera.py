@@ -1,11 +1,16 @@
-from typing import Union, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from pygame.image import load as load_image
 from pygame.sprite import Sprite, Group
 from pygame.math import Vector2
-from pygame import Surface
+from pygame import Rect, Surface
 
-from zelda.src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, BASE_PATH
+from zelda.src.core.assets import build_image_tiles, get_image_tiles
+from zelda.src.settings import (
+    FLOOR_IMAGE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    WATER_COLOR,
+)
 from zelda.src.elements.player import Player
 
 
@@ -17,40 +22,148 @@ class CameraGroup(Group):
     na tela em relação a posição do player, que está sempre no centro.
     """
 
-    def __init__(self, *sprites: Union[Sprite, Sequence[Sprite]]):
+    def __init__(self,
+                 *sprites: Union[Sprite, Sequence[Sprite]],
+                 floor_image: str = FLOOR_IMAGE,
+                 floor_chunks: Optional[List[List[str]]] = None,
+                 track_changes: bool = False,
+                 deferred: bool = False):
         """Inicializa a classe da câmera com o offset inicial, que por
         padrão é um Vector2D com x=0 e y=0.
+
+        Args:
+            floor_image (str, optional):
+                caminho para a imagem do chão. FLOOR_IMAGE por padrão.
+            floor_chunks (Optional[List[List[str]]], optional):
+                matriz indicando como a imagem do chão deve ser
+                repetida. Cada valor é a soma de 1 (espelhado em x) e 2
+                (espelhado em y). None por padrão, o que equivale a uma
+                única cópia da imagem.
+            track_changes (bool, optional):
+                define se a câmera compara cada frame com o anterior
+                para informar apenas as áreas alteradas. False por
+                padrão, o que considera a tela inteira alterada.
+            deferred (bool, optional):
+                define se a preparação do chão fica para as iterações
+                de loading, em vez de acontecer no construtor. False
+                por padrão.
         """
         super().__init__(*sprites)
 
         self.offset = Vector2()
-        self.floor_surface = load_image(
-            f"{BASE_PATH}/graphics/tilemap/ground.png").convert()
-        self.floor_rect = self.floor_surface.get_rect(topleft=(0, 0))
+        self.floor_chunks: List[Tuple[Surface, Rect]] = []
+        self.loading = self.__build_floor_chunks(
+            floor_image, floor_chunks or [["0"]],
+        )
 
-    def custom_draw(self, surface: Surface, player: Player) -> None:
-        """Desenha todos os sprites na tela.
+        if not deferred:
+            for _ in self.loading:
+                pass
+
+        # Estado do último frame desenhado, usado para encontrar as
+        # áreas alteradas quando track_changes está ativo
+        self.track_changes = track_changes
+        self.__last_offset: Optional[Vector2] = None
+        self.__last_frame: Dict[Sprite, Tuple[Surface, int, Rect]] = {}
+
+    def __build_floor_chunks(self,
+                             floor_image: str,
+                             layout: List[List[str]]) -> Iterator[None]:
+        """Monta os pedaços do chão a partir da imagem base.
+
+        A imagem é dividida em blocos, e as variações espelhadas são
+        criadas uma única vez por processo, um bloco por iteração, e
+        compartilhadas entre todos os pedaços que as utilizam.
+
+        Args:
+            floor_image (str): caminho para a imagem do chão
+            layout (List[List[str]]): matriz de espelhamento dos pedaços
+        """
+        for flip in sorted({int(value) for row in layout for value in row}):
+            yield from build_image_tiles(floor_image, flip)
+
+        base = get_image_tiles(floor_image)
+        width = max(rect.right for _, rect in base)
+        height = max(rect.bottom for _, rect in base)
+
+        for i, row in enumerate(layout):
+            for j, value in enumerate(row):
+                for tile, rect in get_image_tiles(floor_image, int(value)):
+                    self.floor_chunks.append(
+                        (tile, rect.move(j * width, i * height)),
+                    )
+
+    def __changed_areas(
+        self,
+        frame: Dict[Sprite, Tuple[Surface, int, Rect]],
+        view: Rect,
+    ) -> List[Rect]:
+        """Compara o frame desenhado com o anterior.
+
+        Com a câmera parada, apenas as posições antigas e novas dos
+        sprites que mudaram de imagem, transparência ou posição são
+        alteradas. Com a câmera em movimento a tela inteira muda.
+        """
+        last_frame, self.__last_frame = self.__last_frame, frame
+        last_offset = self.__last_offset
+        self.__last_offset = self.offset.copy()
+
+        if last_offset != self.offset:
+            return [Rect((0, 0), view.size)]
+
+        areas = []
+
+        for sprite in last_frame.keys() | frame.keys():
+            old = last_frame.get(sprite)
+            new = frame.get(sprite)
+
+            if old is None or new is None or (
+                old[0] is not new[0] or old[1:] != new[1:]
+            ):
+                areas.extend(state[2] for state in (old, new) if state)
+
+        return areas
 
-        Os sprites serão desenhados de forma que aqueles que estiverem
+    def render_commands(
+        self,
+        player: Player,
+        size: Tuple[int, int],
+    ) -> Tuple[List[Tuple[Surface, Tuple[int, int]]], List[Rect]]:
+        """Monta os blits de um frame sem desenhar nada.
+
+        Os sprites são ordenados de forma que aqueles que estiverem
         embaixo da tela serão desenhados por último, garantindo que
-        serão desenhados por cima dos anteriores.
+        serão desenhados por cima dos anteriores. Antes dos blits a
+        superfície deve ser preenchida com WATER_COLOR.
 
         Args:
-            surface (Surface):
-                superfície em que os sprites serão desenhados
             player (Player):
                 Instância do player que será considerado
+            size (Tuple[int, int]):
+                tamanho da superfície em que os sprites serão desenhados
+
+        Returns:
+            Tuple[List[Tuple[Surface, Tuple[int, int]]], List[Rect]]:
+                superfícies e posições dos blits, na ordem em que devem
+                acontecer, e áreas da superfície alteradas em relação ao
+                frame anterior, ou a superfície inteira caso
+                track_changes esteja desativado
         """
         # Cria o offset da camera em relação ao player para mantê-lo no
         # centro da tela sempre
         self.offset.x = player.rect.centerx - SCREEN_WIDTH // 2
         self.offset.y = player.rect.centery - SCREEN_HEIGHT // 2
+        offset_x, offset_y = int(self.offset.x), int(self.offset.y)
 
-        # Desenha o sprite do chão antes de qualquer outro sprite
-        surface.blit(
-            self.floor_surface,
-            self.floor_rect.topleft - self.offset,
-        )
+        # Desenha o chão antes de qualquer outro sprite, apenas os
+        # pedaços do chão que aparecem na tela
+        view = Rect(self.offset, size)
+        bounds = Rect((0, 0), size)
+        commands = [
+            (floor_surface, (floor_rect.x - offset_x, floor_rect.y - offset_y))
+            for floor_surface, floor_rect in self.floor_chunks
+            if floor_rect.colliderect(view)
+        ]
 
         # Ordena os sprites pela posição em y para garantir que aqueles
         # que estiverem abaixo serão desenhados por cima para uma falsa
@@ -60,8 +173,42 @@ class CameraGroup(Group):
             key=lambda s: s.rect.centery,
         )
 
+        frame = {}
+
         for sprite in ordered_sprites:
             offset_rect = sprite.rect.copy()
             offset_rect.center -= self.offset
+            commands.append((sprite.image, offset_rect.topleft))
+
+            if self.track_changes:
+                area = Rect(offset_rect.topleft, sprite.image.get_size())
+                frame[sprite] = (
+                    sprite.image, sprite.image.get_alpha(), area.clip(bounds),
+                )
+
+        if not self.track_changes:
+            return commands, [bounds]
+
+        return commands, self.__changed_areas(frame, view)
+
+    def custom_draw(self, surface: Surface, player: Player) -> List[Rect]:
+        """Desenha todos os sprites na tela.
+
+        Args:
+            surface (Surface):
+                superfície em que os sprites serão desenhados
+            player (Player):
+                Instância do player que será considerado
+
+        Returns:
+            List[Rect]:
+                áreas da superfície alteradas em relação ao frame
+                anterior, ou a superfície inteira caso track_changes
+                esteja desativado
+        """
+        commands, changed = self.render_commands(player, surface.get_size())
+
+        surface.fill(WATER_COLOR)
+        surface.blits(commands, False)
 
-            surface.blit(sprite.image, offset_rect)
+        return changed
@@ -0,0 +1,60 @@
+from typing import Optional
+
+from pygame.time import get_ticks as get_real_ticks
+
+# Quando definido, o tempo do jogo avança um passo fixo por frame em vez
+# de seguir o relógio real, o que torna timers e animações
+# determinísticos para gravação e replay
+_fixed_step: Optional[float] = None
+_fixed_ticks: float = 0.0
+
+
+def get_ticks() -> int:
+    """Retorna o tempo do jogo em milissegundos.
+
+    Returns:
+        int: tempo do relógio real ou do relógio de passo fixo
+    """
+    if _fixed_step is None:
+        return get_real_ticks()
+
+    return int(_fixed_ticks)
+
+
+def use_fixed_step(fps: int) -> None:
+    """Passa a contar o tempo em passos fixos de 1/fps segundos.
+
+    O relógio começa em um segundo, e não em zero, porque os timers
+    tratam o tempo inicial zero como timer nunca ativado.
+
+    Args:
+        fps (int): frames por segundo simulados
+    """
+    global _fixed_step, _fixed_ticks
+
+    _fixed_step = 1000 / fps
+    _fixed_ticks = 1000.0
+
+
+def is_fixed_step() -> bool:
+    """Indica se o relógio de passo fixo está em uso.
+    """
+    return _fixed_step is not None
+
+
+def use_real_time() -> None:
+    """Volta a utilizar o relógio real do pygame.
+    """
+    global _fixed_step
+
+    _fixed_step = None
+
+
+def advance() -> None:
+    """Avança o relógio de passo fixo em um frame. Não faz nada quando
+    o relógio real está em uso.
+    """
+    global _fixed_ticks
+
+    if _fixed_step is not None:
+        _fixed_ticks += _fixed_step
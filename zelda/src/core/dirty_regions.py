@@ -0,0 +1,88 @@
+from typing import Iterable, List
+
+from pygame import Rect
+
+
+class DirtyRegions:
+    """Acumula as áreas da superfície alteradas durante um frame.
+
+    As áreas coletadas podem ser passadas para pygame.display.update,
+    que então copia para a tela apenas os pixels que mudaram. Quando as
+    áreas são muitas ou cobrem boa parte da superfície, a superfície
+    inteira é enviada, o que é mais barato do que várias cópias.
+    """
+
+    def __init__(self,
+                 bounds: Rect,
+                 max_rects: int = 64,
+                 max_coverage: float = 0.5) -> None:
+        """Cria o acumulador vazio.
+
+        Args:
+            bounds (Rect): área total da superfície
+            max_rects (int, optional):
+                quantidade de áreas a partir da qual a superfície
+                inteira é enviada. 64 por padrão.
+            max_coverage (float, optional):
+                fração da superfície a partir da qual ela é enviada
+                inteira. 0.5 por padrão.
+        """
+        self.bounds = bounds
+        self.max_rects = max_rects
+        self.max_coverage = max_coverage
+
+        self.__rects: List[Rect] = []
+        self.__full = False
+
+    def __bool__(self) -> bool:
+        return self.__full or bool(self.__rects)
+
+    def add(self, rect: Rect) -> None:
+        """Marca uma área como alterada.
+
+        Args:
+            rect (Rect): área alterada, em coordenadas da superfície
+        """
+        if self.__full:
+            return
+
+        rect = rect.clip(self.bounds)
+
+        if rect.width and rect.height:
+            self.__rects.append(rect)
+
+    def add_all(self, rects: Iterable[Rect]) -> None:
+        """Marca várias áreas como alteradas.
+
+        Args:
+            rects (Iterable[Rect]): áreas alteradas
+        """
+        for rect in rects:
+            self.add(rect)
+
+    def invalidate(self) -> None:
+        """Marca a superfície inteira como alterada.
+        """
+        self.__full = True
+        self.__rects.clear()
+
+    def collect(self) -> List[Rect]:
+        """Retorna as áreas alteradas desde a última coleta e esvazia o
+        acumulador.
+
+        Returns:
+            List[Rect]:
+                áreas que precisam ser enviadas para a tela, vazia caso
+                nada tenha mudado
+        """
+        rects, self.__rects = self.__rects, []
+        full, self.__full = self.__full, False
+
+        if not full and len(rects) <= self.max_rects:
+            area = sum(rect.width * rect.height for rect in rects)
+            limit = self.bounds.width * self.bounds.height * self.max_coverage
+
+            if area <= limit:
+                return rects
+
+        return [self.bounds.copy()]
@@ -0,0 +1,349 @@
+import weakref
+from array import array
+from multiprocessing import current_process, get_context
+from multiprocessing.connection import Connection
+from typing import List, Sequence, Tuple
+
+from pygame.math import Vector2
+
+from zelda.src.core.snapshot import ENEMY_STATUSES
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover - plataformas sem shared_memory
+    SharedMemory = None
+
+# Lado das regiões do mapa usadas para dividir os inimigos entre os
+# workers, em pixels
+REGION_SIZE = 1024
+
+# Campos de cada inimigo no buffer compartilhado, em quantidade de
+# doubles. As entradas são escritas pelo processo principal e as saídas
+# pelos workers
+X, Y, CAN_ATTACK, ATTACK_RADIUS, NOTICE_RADIUS = range(5)
+DISTANCE, DIRECTION_X, DIRECTION_Y, STATUS = range(5, 9)
+STRIDE = 9
+
+# A posição do player ocupa os dois primeiros doubles do buffer
+HEADER = 2
+
+_ATTACK = ENEMY_STATUSES.index("attack")
+_MOVE = ENEMY_STATUSES.index("move")
+_IDLE = ENEMY_STATUSES.index("idle")
+
+
+def decide_status(distance: float,
+                  can_attack: bool,
+                  attack_radius: float,
+                  notice_radius: float) -> int:
+    """Decide o status de um inimigo pela distância até o player.
+
+    Args:
+        distance (float): distância até o player, em pixels
+        can_attack (bool): define se o inimigo pode atacar
+        attack_radius (float): distância a partir da qual ele ataca
+        notice_radius (float): distância a partir da qual ele persegue
+
+    Returns:
+        int: índice do status em ENEMY_STATUSES
+    """
+    if distance <= attack_radius and can_attack:
+        return _ATTACK
+
+    if distance <= notice_radius:
+        return _MOVE
+
+    return _IDLE
+
+
+def plan_enemies(data: memoryview, start: int, end: int) -> None:
+    """Calcula a distância, a direção e o status de um intervalo de
+    inimigos do buffer.
+
+    As contas são as mesmas feitas pelo Enemy, com Vector2, para que o
+    resultado seja idêntico em qualquer processo.
+
+    Args:
+        data (memoryview): buffer de doubles com o player e os inimigos
+        start (int): índice do primeiro inimigo
+        end (int): índice seguinte ao último inimigo
+    """
+    player_pos = Vector2(data[0], data[1])
+
+    for offset in range(HEADER + start * STRIDE, HEADER + end * STRIDE,
+                        STRIDE):
+        enemy_pos = Vector2(data[offset + X], data[offset + Y])
+        distance = enemy_pos.distance_to(player_pos)
+        direction = (
+            (player_pos - enemy_pos).normalize() if distance > 0
+            else Vector2()
+        )
+
+        data[offset + DISTANCE] = distance
+        data[offset + DIRECTION_X] = direction.x
+        data[offset + DIRECTION_Y] = direction.y
+        data[offset + STATUS] = decide_status(
+            distance,
+            bool(data[offset + CAN_ATTACK]),
+            data[offset + ATTACK_RADIUS],
+            data[offset + NOTICE_RADIUS],
+        )
+
+
+def _worker(connection: Connection) -> None:
+    """Loop de um processo worker. Cada mensagem traz o nome do bloco de
+    memória compartilhada e o intervalo de inimigos a calcular.
+    """
+    memory = None
+    data = None
+
+    while True:
+        message = connection.recv()
+
+        if message is None:
+            break
+
+        name, start, end = message
+
+        if memory is None or memory.name != name:
+            if memory is not None:
+                data.release()
+                memory.close()
+
+            memory = SharedMemory(name)
+            data = memory.buf.cast("d")
+
+        plan_enemies(data, start, end)
+        connection.send(end)
+
+    if memory is not None:
+        data.release()
+        memory.close()
+
+
+def _shutdown(processes: List,
+              connections: List[Connection],
+              memory: List,
+              views: List[memoryview]) -> None:
+    """Encerra os workers e libera a memória compartilhada.
+    """
+    for view in views:
+        view.release()
+
+    for connection in connections:
+        try:
+            connection.send(None)
+        except OSError:
+            pass
+
+    for process in processes:
+        process.join(1)
+
+        if process.is_alive():
+            process.terminate()
+
+    for block in memory:
+        block.close()
+        block.unlink()
+
+    processes.clear()
+    connections.clear()
+    memory.clear()
+    views.clear()
+
+
+class EnemyAI:
+    """Calcula em lote a distância, a direção e o status dos inimigos,
+    dividindo-os entre processos workers por região do mapa.
+
+    As posições dos inimigos e do player ficam em um bloco de memória
+    compartilhada, de onde os workers leem e onde escrevem o resultado.
+    Os inimigos são ordenados pela região do mapa em que estão, e cada
+    worker recebe um intervalo contínuo dessa ordem, ou seja, um
+    conjunto de regiões vizinhas.
+
+    Sem workers, quando eles não podem ser criados ou quando algum
+    deles para durante a sessão, o mesmo cálculo acontece no próprio
+    processo, com o mesmo resultado.
+    """
+
+    def __init__(self, workers: int = 0, capacity: int = 256) -> None:
+        """Cria os workers.
+
+        Args:
+            workers (int, optional):
+                quantidade de processos workers. 0 por padrão, o que
+                calcula tudo no próprio processo.
+            capacity (int, optional):
+                quantidade de inimigos que cabe no buffer inicial, que
+                cresce quando necessário. 256 por padrão.
+        """
+        self.__processes: List = []
+        self.__connections: List[Connection] = []
+        self.__memory: List = []
+        self.__views: List[memoryview] = []
+        self.__capacity = 0
+
+        # Processos daemon, como os de um multiprocessing.Pool, não
+        # podem criar outros processos
+        if (
+            workers > 0
+            and SharedMemory is not None
+            and not current_process().daemon
+        ):
+            try:
+                self.__start_workers(workers)
+            except OSError:
+                _shutdown(self.__processes, self.__connections,
+                          self.__memory, self.__views)
+
+        self.__finalizer = weakref.finalize(
+            self, _shutdown,
+            self.__processes, self.__connections, self.__memory,
+            self.__views,
+        )
+        self.__allocate(capacity)
+
+    @property
+    def workers(self) -> int:
+        """Quantidade de workers em execução, 0 quando o cálculo é feito
+        no próprio processo.
+        """
+        return len(self.__processes)
+
+    def __start_workers(self, workers: int) -> None:
+        context = get_context("spawn")
+
+        for _ in range(workers):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_worker, args=(worker_connection,), daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+
+            self.__processes.append(process)
+            self.__connections.append(connection)
+
+    def __allocate(self, capacity: int) -> None:
+        """Cria um buffer para a quantidade de inimigos informada.
+        """
+        size = HEADER + capacity * STRIDE
+
+        for view in self.__views:
+            view.release()
+
+        self.__views.clear()
+
+        if self.__processes:
+            for block in self.__memory:
+                block.close()
+                block.unlink()
+
+            self.__memory.clear()
+            self.__memory.append(SharedMemory(create=True, size=size * 8))
+            self.__views.append(self.__memory[0].buf.cast("d"))
+        else:
+            self.__views.append(memoryview(array("d", bytes(size * 8))))
+
+        self.__capacity = capacity
+
+    def plan(self,
+             enemies: Sequence,
+             player_pos: Tuple[float, float]) -> List[int]:
+        """Calcula a distância, a direção e o status dos inimigos em
+        relação ao player e entrega o resultado para cada um deles.
+
+        Args:
+            enemies (Sequence[Enemy]): inimigos calculados
+            player_pos (Tuple[float, float]): posição do player
+
+        Returns:
+            List[int]: quantidade de inimigos calculada por cada worker
+        """
+        if not enemies:
+            return []
+
+        if len(enemies) > self.__capacity:
+            self.__allocate(max(len(enemies), self.__capacity * 2))
+
+        ordered = sorted(enemies, key=lambda enemy: (
+            enemy.rect.centery // REGION_SIZE,
+            enemy.rect.centerx // REGION_SIZE,
+        ))
+
+        data = self.__views[0]
+        data[0], data[1] = player_pos
+
+        for index, enemy in enumerate(ordered):
+            offset = HEADER + index * STRIDE
+            data[offset + X], data[offset + Y] = enemy.rect.center
+            data[offset + CAN_ATTACK] = enemy.can_attack
+            data[offset + ATTACK_RADIUS] = enemy.attack_radius
+            data[offset + NOTICE_RADIUS] = enemy.notice_radius
+
+        if self.__processes:
+            try:
+                counts = self.__plan_in_workers(len(ordered))
+            except (EOFError, OSError):
+                # Um worker morreu: o cálculo volta para o próprio
+                # processo, com as entradas copiadas para o novo buffer
+                data = self.__fall_back(len(ordered))
+                plan_enemies(data, 0, len(ordered))
+                counts = [len(ordered)]
+        else:
+            plan_enemies(data, 0, len(ordered))
+            counts = [len(ordered)]
+
+        for index, enemy in enumerate(ordered):
+            offset = HEADER + index * STRIDE
+            enemy.set_plan(
+                data[offset + DISTANCE],
+                (data[offset + DIRECTION_X], data[offset + DIRECTION_Y]),
+                ENEMY_STATUSES[int(data[offset + STATUS])],
+            )
+
+        return counts
+
+    def __fall_back(self, total: int) -> memoryview:
+        """Encerra os workers e troca a memória compartilhada por um
+        buffer local, mantendo o player e os inimigos já escritos.
+
+        Args:
+            total (int): quantidade de inimigos escritos no buffer
+
+        Returns:
+            memoryview: novo buffer
+        """
+        size = HEADER + total * STRIDE
+        inputs = array("d", self.__views[0][:size])
+
+        _shutdown(self.__processes, self.__connections, self.__memory,
+                  self.__views)
+        self.__allocate(self.__capacity)
+
+        data = self.__views[0]
+        data[:size] = inputs
+
+        return data
+
+    def __plan_in_workers(self, total: int) -> List[int]:
+        """Divide os inimigos, já ordenados por região, em intervalos
+        contínuos, um por worker, e espera todos terminarem.
+        """
+        name = self.__memory[0].name
+        workers = len(self.__connections)
+        bounds = [total * worker // workers for worker in range(workers + 1)]
+
+        for worker, connection in enumerate(self.__connections):
+            connection.send((name, bounds[worker], bounds[worker + 1]))
+
+        for connection in self.__connections:
+            connection.recv()
+
+        return [end - start for start, end in zip(bounds, bounds[1:])]
+
+    def close(self) -> None:
+        """Encerra os workers e libera a memória compartilhada.
+        """
+        self.__finalizer()
@@ -0,0 +1,276 @@
+from abc import ABC, abstractmethod
+from struct import Struct
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from pygame.event import Event
+from pygame.key import get_pressed as get_pressed_keys
+from pygame import (
+    KEYDOWN,
+    K_UP,
+    K_DOWN,
+    K_LEFT,
+    K_RIGHT,
+    K_SPACE,
+    K_LCTRL,
+    K_q,
+    K_e,
+    K_m,
+)
+
+# Teclas lidas pelo jogo. A posição de cada tecla define o bit que ela
+# ocupa na máscara gravada por frame.
+TRACKED_KEYS: Tuple[int, ...] = (
+    K_UP,
+    K_DOWN,
+    K_LEFT,
+    K_RIGHT,
+    K_SPACE,
+    K_LCTRL,
+    K_q,
+    K_e,
+)
+
+KEY_BITS: Dict[int, int] = {key: 1 << i for i, key in enumerate(TRACKED_KEYS)}
+
+# Bit extra da máscara indicando que o menu foi aberto ou fechado
+MENU_TOGGLE_BIT: int = 1 << len(TRACKED_KEYS)
+
+
+class KeyState:
+    """Estado das teclas em um frame, representado por uma máscara.
+
+    Pode ser indexado pelo código da tecla, assim como o retorno de
+    pygame.key.get_pressed.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: int = 0) -> None:
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+def keys_to_mask(pressed_keys: Sequence[bool]) -> int:
+    """Converte o estado das teclas para a máscara de bits gravada.
+
+    Args:
+        pressed_keys (Sequence[bool]): estado indexado pelas teclas
+
+    Returns:
+        int: máscara com os bits das teclas pressionadas
+    """
+    mask = 0
+
+    for key, bit in KEY_BITS.items():
+        if pressed_keys[key]:
+            mask |= bit
+
+    return mask
+
+
+class InputSource(ABC):
+    """Fonte das entradas lidas pelo jogo a cada frame.
+
+    A fonte é avançada uma vez por frame com poll, e depois consultada
+    pelo player e pelos menus através de get_pressed.
+    """
+
+    menu_toggled: bool = False
+    finished: bool = False
+
+    @abstractmethod
+    def poll(self, events: Iterable[Event]) -> None:
+        """Avança a fonte para o próximo frame.
+
+        Args:
+            events (Iterable[Event]): eventos do pygame do frame atual
+        """
+        pass
+
+    @abstractmethod
+    def get_pressed(self) -> Sequence[bool]:
+        """Retorna o estado das teclas no frame atual.
+        """
+        pass
+
+    def close(self) -> None:
+        """Libera os recursos da fonte ao final da sessão.
+        """
+        pass
+
+
+class KeyboardInput(InputSource):
+    """Lê as entradas diretamente do teclado.
+    """
+
+    def __init__(self) -> None:
+        self.__pressed_keys: Sequence[bool] = KeyState()
+
+    def poll(self, events: Iterable[Event]) -> None:
+        self.menu_toggled = any(
+            event.type == KEYDOWN and event.key == K_m for event in events
+        )
+        self.__pressed_keys = get_pressed_keys()
+
+    def get_pressed(self) -> Sequence[bool]:
+        return self.__pressed_keys
+
+
+class ScriptedInput(InputSource):
+    """Entradas controladas por código, como por agentes ou cenários
+    de benchmark.
+    """
+
+    def __init__(self, mask: int = 0) -> None:
+        """Inicializa a fonte com as teclas já pressionadas.
+
+        Args:
+            mask (int, optional):
+                máscara das teclas pressionadas, que pode incluir
+                MENU_TOGGLE_BIT para abrir ou fechar o menu no próximo
+                frame. 0 por padrão.
+        """
+        self.mask = mask
+        self.__state = KeyState(mask)
+
+    def poll(self, events: Iterable[Event]) -> None:
+        self.menu_toggled = bool(self.mask & MENU_TOGGLE_BIT)
+        self.__state.mask = self.mask & ~MENU_TOGGLE_BIT
+
+        # A troca do menu é um evento, vale apenas para um frame
+        self.mask &= ~MENU_TOGGLE_BIT
+
+    def get_pressed(self) -> Sequence[bool]:
+        return self.__state
+
+
+class Recording:
+    """Sessão gravada, armazenada como sequências de máscaras iguais.
+
+    O formato do arquivo é um cabeçalho com a versão, a semente e o FPS
+    da sessão, seguido por pares (máscara, repetições) de 16 bits cada.
+    """
+
+    MAGIC = b"ZREC"
+    VERSION = 1
+
+    __HEADER = Struct("<4sHIHI")
+    __RUN = Struct("<HH")
+    __MAX_RUN = 0xFFFF
+
+    def __init__(self, seed: int, fps: int) -> None:
+        self.seed = seed
+        self.fps = fps
+        self.runs: List[List[int]] = []
+        self.frames = 0
+
+    def append(self, mask: int) -> None:
+        """Adiciona a máscara de um frame à gravação.
+        """
+        last_run = self.runs[-1] if self.runs else None
+
+        if last_run and last_run[0] == mask and last_run[1] < self.__MAX_RUN:
+            last_run[1] += 1
+        else:
+            self.runs.append([mask, 1])
+
+        self.frames += 1
+
+    def masks(self) -> Iterable[int]:
+        """Itera sobre as máscaras de cada frame, em ordem.
+        """
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as recording_file:
+            recording_file.write(self.__HEADER.pack(
+                self.MAGIC, self.VERSION, self.seed, self.fps, self.frames,
+            ))
+
+            for mask, count in self.runs:
+                recording_file.write(self.__RUN.pack(mask, count))
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        with open(path, "rb") as recording_file:
+            data = recording_file.read()
+
+        magic, version, seed, fps, frames = cls.__HEADER.unpack_from(data)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"{path} não é uma gravação válida")
+
+        recording = cls(seed, fps)
+
+        for mask, count in cls.__RUN.iter_unpack(data[cls.__HEADER.size:]):
+            recording.runs.append([mask, count])
+
+        recording.frames = frames
+
+        return recording
+
+
+class InputRecorder(InputSource):
+    """Grava as entradas de outra fonte enquanto repassa os valores.
+    """
+
+    def __init__(self,
+                 source: InputSource,
+                 path: str,
+                 seed: int,
+                 fps: int) -> None:
+        """Inicializa o gravador.
+
+        Args:
+            source (InputSource): fonte que será gravada
+            path (str): arquivo em que a gravação será salva
+            seed (int): semente utilizada pela sessão
+            fps (int): frames por segundo da sessão
+        """
+        self.__source = source
+        self.__path = path
+        self.recording = Recording(seed, fps)
+
+    def poll(self, events: Iterable[Event]) -> None:
+        self.__source.poll(events)
+        self.menu_toggled = self.__source.menu_toggled
+
+        mask = keys_to_mask(self.__source.get_pressed())
+
+        if self.menu_toggled:
+            mask |= MENU_TOGGLE_BIT
+
+        self.recording.append(mask)
+
+    def get_pressed(self) -> Sequence[bool]:
+        return self.__source.get_pressed()
+
+    def close(self) -> None:
+        self.recording.save(self.__path)
+
+
+class ReplayInput(InputSource):
+    """Reproduz uma sessão gravada, frame a frame.
+    """
+
+    def __init__(self, recording: Recording) -> None:
+        self.recording = recording
+        self.__masks = iter(recording.masks())
+        self.__state = KeyState()
+
+    def poll(self, events: Iterable[Event]) -> None:
+        mask = next(self.__masks, None)
+
+        if mask is None:
+            self.finished = True
+            mask = 0
+
+        self.menu_toggled = bool(mask & MENU_TOGGLE_BIT)
+        self.__state.mask = mask & ~MENU_TOGGLE_BIT
+
+    def get_pressed(self) -> Sequence[bool]:
+        return self.__state
@@ -0,0 +1,311 @@
+import os
+from argparse import ArgumentParser
+from csv import writer
+from math import isqrt
+from random import Random
+from typing import Dict, List, Set, Tuple, Union
+
+from pygame.image import load as load_image
+
+from zelda.src.core.utils import import_csv
+from zelda.src.settings import BASE_PATH, MAP_PATH, TILESIZE
+
+Layout = List[List[str]]
+
+EMPTY = "-1"
+PLAYER = "394"
+ENEMIES = ("390", "391", "392", "393")
+GRASS = ("8", "9", "10")
+
+# Camadas lidas pelo MainLevel, pelo sufixo do nome do arquivo
+LAYERS = ("FloorBlocks", "Grass", "Objects", "Entities")
+
+# Bits que indicam o espelhamento de um pedaço do mapa
+FLIP_X = 1
+FLIP_Y = 2
+
+MODES = ("tile", "mirror", "procedural")
+
+# Imagens dos objetos, na mesma ordem em que o MainLevel as indexa
+OBJECTS_PATH = f"{BASE_PATH}/graphics/objects"
+
+
+def scale_to_grid(scale: int) -> Tuple[int, int]:
+    """Converte um fator de área na grade de pedaços mais quadrada.
+
+    Args:
+        scale (int): quantas vezes a área do mapa original é repetida
+
+    Returns:
+        Tuple[int, int]: quantidade de colunas e de linhas de pedaços
+    """
+    rows = isqrt(scale)
+
+    while scale % rows:
+        rows -= 1
+
+    return scale // rows, rows
+
+
+def _flip_layout(layout: Layout, flip: int) -> Layout:
+    """Espelha uma camada de acordo com os bits FLIP_X e FLIP_Y.
+    """
+    rows = layout[::-1] if flip & FLIP_Y else layout
+    return [row[::-1] if flip & FLIP_X else list(row) for row in rows]
+
+
+def _object_footprints(path: str = OBJECTS_PATH) -> List[Tuple[int, int]]:
+    """Lê a largura e a altura, em tiles, de cada imagem de objeto.
+
+    Args:
+        path (str, optional): pasta das imagens. OBJECTS_PATH por padrão.
+
+    Returns:
+        List[Tuple[int, int]]: tamanho de cada objeto, pelo índice usado
+        na camada Objects
+    """
+    footprints = []
+
+    for name in sorted(os.listdir(path)):
+        if name.endswith(".png"):
+            width, height = load_image(f"{path}/{name}").get_size()
+            footprints.append((width // TILESIZE, height // TILESIZE))
+
+    return footprints
+
+
+def _flip_objects(layout: Layout,
+                  flip: int,
+                  footprints: List[Tuple[int, int]]) -> Layout:
+    """Espelha a camada de objetos mantendo cada objeto sobre as mesmas
+    células do chão espelhado.
+
+    Os objetos ocupam mais de um tile, a partir da célula da camada para
+    a direita e, como o Tile os posiciona um tile acima dela, da linha
+    anterior para baixo. Inverter apenas a célula deslocaria cada objeto
+    em relação ao chão e às barreiras, por isso ela é corrigida pelo
+    tamanho do objeto.
+    """
+    rows, columns = len(layout), len(layout[0])
+    flipped = [[EMPTY] * columns for _ in range(rows)]
+
+    for i, row in enumerate(layout):
+        for j, tile in enumerate(row):
+            if tile == EMPTY:
+                continue
+
+            width, height = footprints[int(tile)]
+            column = columns - j - width if flip & FLIP_X else j
+
+            # Linhas ocupadas: de i - 1 até i + height - 2
+            line = rows + 2 - i - height if flip & FLIP_Y else i
+
+            if 0 <= line < rows and 0 <= column < columns:
+                flipped[line][column] = tile
+
+    return flipped
+
+
+def _chunk_flips(columns: int, rows: int, mode: str, rng: Random) -> Layout:
+    """Define o espelhamento de cada pedaço da grade.
+
+    No modo mirror os pedaços vizinhos são espelhados entre si, de forma
+    que as bordas coincidem. No modo procedural o espelhamento de cada
+    pedaço é sorteado.
+    """
+    if mode == "tile":
+        return [["0"] * columns for _ in range(rows)]
+
+    if mode == "mirror":
+        return [
+            [str((FLIP_X if j % 2 else 0) | (FLIP_Y if i % 2 else 0))
+             for j in range(columns)]
+            for i in range(rows)
+        ]
+
+    return [
+        [str(rng.randrange(4)) for _ in range(columns)]
+        for _ in range(rows)
+    ]
+
+
+def _outside_cells(boundary: Layout) -> Set[Tuple[int, int]]:
+    """Encontra as células fora da ilha, alcançáveis a partir das bordas
+    do mapa sem atravessar as barreiras invisíveis.
+    """
+    rows, columns = len(boundary), len(boundary[0])
+    pending = [
+        (i, j) for i in range(rows) for j in range(columns)
+        if (i in (0, rows - 1) or j in (0, columns - 1))
+        and boundary[i][j] == EMPTY
+    ]
+    outside = set(pending)
+
+    while pending:
+        i, j = pending.pop()
+
+        for cell in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)):
+            if (
+                0 <= cell[0] < rows and 0 <= cell[1] < columns
+                and cell not in outside
+                and boundary[cell[0]][cell[1]] == EMPTY
+            ):
+                outside.add(cell)
+                pending.append(cell)
+
+    return outside
+
+
+def _redistribute(layers: Dict[str, Layout],
+                  grass_density: Union[float, None],
+                  enemy_density: Union[float, None],
+                  rng: Random) -> None:
+    """Redistribui a grama e os inimigos de um pedaço pelas células
+    livres da ilha, mantendo o player e os obstáculos no lugar.
+    """
+    if grass_density is None and enemy_density is None:
+        return
+
+    outside = _outside_cells(layers["FloorBlocks"])
+
+    for i, row in enumerate(layers["FloorBlocks"]):
+        for j, boundary in enumerate(row):
+            blocked = (
+                boundary != EMPTY
+                or layers["Objects"][i][j] != EMPTY
+                or (i, j) in outside
+            )
+            player = layers["Entities"][i][j] == PLAYER
+
+            if grass_density is not None:
+                layers["Grass"][i][j] = (
+                    rng.choice(GRASS)
+                    if not (blocked or player) and rng.random() < grass_density
+                    else EMPTY
+                )
+
+            if enemy_density is not None and not player:
+                free = not blocked and layers["Grass"][i][j] == EMPTY
+                layers["Entities"][i][j] = (
+                    rng.choice(ENEMIES)
+                    if free and rng.random() < enemy_density
+                    else EMPTY
+                )
+
+
+def generate_map(output_dir: str,
+                 columns: int,
+                 rows: int,
+                 mode: str = "tile",
+                 grass_density: Union[float, None] = None,
+                 enemy_density: Union[float, None] = None,
+                 seed: int = 0,
+                 source_path: str = MAP_PATH) -> str:
+    """Gera um mapa repetindo o mapa original em uma grade de pedaços.
+
+    Cada pedaço pode ser copiado, espelhado ou sorteado, e a grama e os
+    inimigos podem ser redistribuídos com densidades configuráveis. O
+    resultado tem as mesmas camadas do mapa original, além da camada
+    map_FloorChunks.csv que indica como a imagem do chão é repetida, e
+    pode ser carregado normalmente pelo MainLevel. Apenas o primeiro
+    pedaço mantém o player.
+
+    Args:
+        output_dir (str): pasta em que as camadas serão escritas
+        columns (int): quantidade de pedaços na horizontal
+        rows (int): quantidade de pedaços na vertical
+        mode (str, optional):
+            'tile' para copiar, 'mirror' para espelhar os vizinhos ou
+            'procedural' para sortear o espelhamento de cada pedaço.
+            'tile' por padrão.
+        grass_density (Union[float, None], optional):
+            probabilidade de uma célula livre receber grama. None por
+            padrão, o que mantém a grama original.
+        enemy_density (Union[float, None], optional):
+            probabilidade de uma célula livre receber um inimigo. None
+            por padrão, o que mantém os inimigos originais.
+        seed (int, optional): semente dos sorteios. 0 por padrão.
+        source_path (str, optional):
+            pasta do mapa usado como pedaço. MAP_PATH por padrão.
+
+    Returns:
+        str: pasta com o mapa gerado
+    """
+    if mode not in MODES:
+        raise ValueError(f"modo inválido: {mode}")
+
+    rng = Random(seed)
+    base = {layer: import_csv(f"{source_path}/map_{layer}.csv")
+            for layer in LAYERS}
+    flips = _chunk_flips(columns, rows, mode, rng)
+    footprints = _object_footprints() if mode != "tile" else []
+    output: Dict[str, Layout] = {layer: [] for layer in LAYERS}
+
+    for chunk_i in range(rows):
+        chunk_rows: Dict[str, Layout] = {layer: [] for layer in LAYERS}
+
+        for chunk_j in range(columns):
+            flip = int(flips[chunk_i][chunk_j])
+            chunk = {layer: _flip_layout(layout, flip)
+                     for layer, layout in base.items()}
+            chunk["Objects"] = _flip_objects(
+                base["Objects"], flip, footprints,
+            )
+
+            if chunk_i or chunk_j:
+                chunk["Entities"] = [
+                    [EMPTY if tile == PLAYER else tile for tile in row]
+                    for row in chunk["Entities"]
+                ]
+
+            _redistribute(chunk, grass_density, enemy_density, rng)
+
+            for layer, layout in chunk.items():
+                if not chunk_rows[layer]:
+                    chunk_rows[layer] = [[] for _ in layout]
+
+                for row, chunk_row in zip(chunk_rows[layer], layout):
+                    row.extend(chunk_row)
+
+        for layer in LAYERS:
+            output[layer].extend(chunk_rows[layer])
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    for layer, layout in output.items():
+        _write_csv(f"{output_dir}/map_{layer}.csv", layout)
+
+    _write_csv(f"{output_dir}/map_FloorChunks.csv", flips)
+
+    return output_dir
+
+
+def _write_csv(path: str, layout: Layout) -> None:
+    with open(path, "w", newline="") as csv_file:
+        writer(csv_file, delimiter=",").writerows(layout)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        prog="python -m zelda.src.core.map_generator",
+        description="Gera mapas maiores a partir do mapa original.",
+    )
+    parser.add_argument("output_dir")
+    parser.add_argument(
+        "--scale", type=int, default=4,
+        help="quantas vezes a área do mapa original é repetida",
+    )
+    parser.add_argument("--mode", choices=MODES, default="tile")
+    parser.add_argument("--grass-density", type=float)
+    parser.add_argument("--enemy-density", type=float)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_map(
+        args.output_dir,
+        *scale_to_grid(args.scale),
+        mode=args.mode,
+        grass_density=args.grass_density,
+        enemy_density=args.enemy_density,
+        seed=args.seed,
+    )
@@ -0,0 +1,360 @@
+import gc
+import os
+import tracemalloc
+from argparse import ArgumentParser
+from collections import Counter
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from random import Random
+from typing import Dict, Iterable, List, Tuple
+
+from pygame import Surface
+from pygame.image import tostring
+from pygame.sprite import AbstractGroup, Sprite
+
+from zelda.src.core.assets import cached_sounds, cached_surfaces
+
+# Categoria de cada asset, pelo trecho do caminho de onde ele veio
+CATEGORIES: Tuple[Tuple[str, str], ...] = (
+    ("floor", "/graphics/tilemap/"),
+    ("tiles", "/graphics/grass/"),
+    ("tiles", "/graphics/objects/"),
+    ("player", "/graphics/player/"),
+    ("monsters", "/graphics/monsters/"),
+    ("particles", "/graphics/particles/"),
+    ("weapons", "/graphics/weapons/"),
+    ("hidden", "hidden:"),
+)
+
+# Categoria das superfícies próprias de cada tipo de sprite
+SPRITE_CATEGORIES: Dict[str, str] = {
+    "Tile": "tiles",
+    "Player": "player",
+    "Enemy": "monsters",
+    "ParticleEffect": "particles",
+    "Weapon": "weapons",
+}
+
+
+def surface_bytes(surface: Surface) -> int:
+    """Calcula os bytes ocupados pelos pixels de uma superfície.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+def categorize(path: str) -> str:
+    """Define a categoria de um asset pelo caminho.
+
+    Args:
+        path (str): caminho do asset
+
+    Returns:
+        str: nome da categoria, ou 'other' quando nenhuma corresponde
+    """
+    # A barra final faz as pastas corresponderem aos trechos de CATEGORIES
+    path = path.replace(os.sep, "/") + "/"
+
+    for category, fragment in CATEGORIES:
+        if fragment in path or path.startswith(fragment):
+            return category
+
+    return "other"
+
+
+def _content_key(surface: Surface) -> Tuple[Tuple[int, int], bytes]:
+    """Resumo do conteúdo de uma superfície, usado para encontrar cópias
+    de uma mesma imagem.
+    """
+    digest = blake2b(tostring(surface, "RGBA"), digest_size=16).digest()
+    return surface.get_size(), digest
+
+
+@dataclass
+class MemoryReport:
+    """Memória ocupada pelos assets e sprites de um nível.
+
+    Args:
+        surfaces (Dict[str, int]): bytes de superfícies por categoria
+        shared (int):
+            bytes das superfícies dos caches de assets, carregadas uma
+            única vez e compartilhadas entre os sprites
+        owned (int):
+            bytes das superfícies que pertencem a um único sprite e cujo
+            conteúdo não se repete
+        duplicated (int):
+            bytes das superfícies que pertencem a um único sprite mas
+            repetem o conteúdo de outra superfície, e que poderiam ser
+            compartilhadas
+        groups (Dict[str, int]): quantidade de sprites por grupo
+        sounds (Dict[str, int]): bytes de cada som decodificado
+    """
+    surfaces: Dict[str, int] = field(default_factory=dict)
+    shared: int = 0
+    owned: int = 0
+    duplicated: int = 0
+    groups: Dict[str, int] = field(default_factory=dict)
+    sounds: Dict[str, int] = field(default_factory=dict)
+
+    def format(self) -> str:
+        """Formata o relatório como texto, com os tamanhos em KB.
+        """
+        lines = ["superfícies (KB)"]
+        lines += [
+            f"  {category:<16}{size / 1024:>12.1f}"
+            for category, size in sorted(self.surfaces.items())
+        ]
+        lines += [
+            f"  {'compartilhadas':<16}{self.shared / 1024:>12.1f}",
+            f"  {'próprias':<16}{self.owned / 1024:>12.1f}",
+            f"  {'duplicadas':<16}{self.duplicated / 1024:>12.1f}",
+            "sprites por grupo",
+        ]
+        lines += [
+            f"  {name:<16}{count:>12}"
+            for name, count in self.groups.items()
+        ]
+        lines.append("sons (KB)")
+        lines += [
+            f"  {os.path.basename(path):<16}{size / 1024:>12.1f}"
+            for path, size in sorted(self.sounds.items())
+        ]
+
+        return "\n".join(lines)
+
+
+def sprite_groups(level: object) -> Dict[str, AbstractGroup]:
+    """Encontra os grupos de sprites de um nível pelos atributos.
+
+    Args:
+        level (object): nível com os grupos
+
+    Returns:
+        Dict[str, AbstractGroup]: grupos pelo nome do atributo
+    """
+    return {
+        name: group for name, group in vars(level).items()
+        if isinstance(group, AbstractGroup)
+    }
+
+
+def measure_level(level: object) -> MemoryReport:
+    """Mede a memória dos assets carregados e dos sprites de um nível.
+
+    As superfícies dos caches de assets são contadas pela categoria do
+    caminho. As superfícies que não vêm dos caches são contadas pelo
+    tipo do sprite que as usa, e as da interface na categoria ui.
+
+    Args:
+        level (object): nível cujos grupos de sprites são medidos
+
+    Returns:
+        MemoryReport: relatório de memória
+    """
+    report = MemoryReport()
+    surfaces: Counter = Counter()
+    shared_ids = set()
+    contents = set()
+
+    for path, surface in cached_surfaces():
+        size = surface_bytes(surface)
+        surfaces[categorize(path)] += size
+        report.shared += size
+        shared_ids.add(id(surface))
+        contents.add(_content_key(surface))
+
+    groups = sprite_groups(level)
+    report.groups = {name: len(group) for name, group in groups.items()}
+
+    owned: Dict[int, Tuple[str, Surface]] = {}
+
+    for group in groups.values():
+        for sprite in group:
+            image = getattr(sprite, "image", None)
+
+            if image is not None and id(image) not in shared_ids:
+                category = SPRITE_CATEGORIES.get(
+                    type(sprite).__name__, "other",
+                )
+                owned[id(image)] = (category, image)
+
+    for name in ("ui", "upgrade_menu"):
+        if hasattr(level, name):
+            for surface in getattr(level, name).surfaces():
+                owned[id(surface)] = ("ui", surface)
+
+    for category, surface in owned.values():
+        size = surface_bytes(surface)
+        surfaces[category] += size
+        key = _content_key(surface)
+
+        if key in contents:
+            report.duplicated += size
+        else:
+            report.owned += size
+            contents.add(key)
+
+    report.surfaces = dict(surfaces)
+    report.sounds = {
+        path: len(sound.get_raw()) for path, sound in cached_sounds()
+    }
+
+    return report
+
+
+def orphan_sprites() -> Dict[str, int]:
+    """Conta os sprites que não pertencem a nenhum grupo mas continuam
+    referenciados, como sprites removidos do nível que ainda são
+    guardados por algum objeto.
+
+    Returns:
+        Dict[str, int]: quantidade de sprites por tipo
+    """
+    gc.collect()
+
+    return dict(Counter(
+        type(obj).__name__ for obj in gc.get_objects()
+        if isinstance(obj, Sprite) and not obj.groups()
+    ))
+
+
+class AllocationTracker:
+    """Compara as alocações de memória entre pontos de uma sessão com o
+    tracemalloc.
+    """
+
+    def __init__(self, frames: int = 1) -> None:
+        """Começa a rastrear as alocações, caso ainda não estejam sendo
+        rastreadas.
+
+        Args:
+            frames (int, optional):
+                quantidade de frames da pilha guardados por alocação.
+                1 por padrão.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+        self.snapshots: Dict[str, tracemalloc.Snapshot] = {}
+
+    def take(self, label: str) -> None:
+        """Guarda as alocações atuais com um nome.
+
+        Args:
+            label (str): nome do ponto da sessão
+        """
+        snapshot = tracemalloc.take_snapshot()
+        self.snapshots[label] = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+
+    def diff(self,
+             start: str,
+             end: str,
+             limit: int = 10) -> List[tracemalloc.StatisticDiff]:
+        """Compara dois pontos guardados com take.
+
+        Args:
+            start (str): nome do primeiro ponto
+            end (str): nome do segundo ponto
+            limit (int, optional):
+                quantidade de linhas retornadas, das que mais cresceram.
+                10 por padrão.
+
+        Returns:
+            List[tracemalloc.StatisticDiff]:
+                diferenças por linha de código em que a memória foi
+                alocada
+        """
+        statistics = self.snapshots[end].compare_to(
+            self.snapshots[start], "lineno",
+        )
+
+        return statistics[:limit]
+
+    @staticmethod
+    def stop() -> None:
+        tracemalloc.stop()
+
+
+def _format_diff(title: str,
+                 statistics: Iterable[tracemalloc.StatisticDiff]) -> str:
+    lines = [title]
+    lines += [f"  {statistic}" for statistic in statistics]
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+
+    from zelda.src.core import rng
+    from zelda.src.core.clock import advance, use_fixed_step
+    from zelda.src.core.input import KEY_BITS, ScriptedInput
+    from zelda.src.settings import FPS, MAP_PATH, SCREEN_HEIGHT, SCREEN_WIDTH
+
+    parser = ArgumentParser(
+        prog="python -m zelda.src.core.memory",
+        description="Mede a memória de um nível durante uma sessão.",
+    )
+    parser.add_argument("--map", default=MAP_PATH, help="pasta do mapa")
+    parser.add_argument(
+        "--frames", type=int, default=3600,
+        help="frames jogados com entradas aleatórias",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    from zelda.src.levels.main_level import MainLevel
+
+    tracker = AllocationTracker()
+
+    rng.seed(args.seed)
+    use_fixed_step(FPS)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    tracker.take("start")
+    input_source = ScriptedInput()
+    level = MainLevel(screen, map_path=args.map, input_source=input_source)
+    groups = {
+        name: len(group) for name, group in sprite_groups(level).items()
+    }
+    tracker.take("level")
+
+    keys = list(KEY_BITS.values())
+    random = Random(args.seed)
+
+    for frame in range(args.frames):
+        if frame % 15 == 0:
+            input_source.mask = sum(
+                key for key in keys if random.random() < 0.3
+            )
+
+        input_source.poll(())
+        level.run()
+        level.dirty_regions.collect()
+        advance()
+
+    tracker.take("session")
+    report = measure_level(level)
+
+    print(report.format())
+    print("variação de sprites por grupo")
+
+    for name, count in report.groups.items():
+        print(f"  {name:<16}{count - groups.get(name, 0):>+12}")
+
+    print(f"sprites fora de grupos: {orphan_sprites()}")
+    print(_format_diff(
+        "alocações na criação do nível",
+        tracker.diff("start", "level", args.top),
+    ))
+    print(_format_diff(
+        f"alocações após {args.frames} frames",
+        tracker.diff("level", "session", args.top),
+    ))
@@ -0,0 +1,99 @@
+from typing import List, Sequence
+
+from pygame import mixer
+
+
+class MusicPlayer:
+    """Toca a trilha sonora em streaming através do pygame.mixer.music.
+
+    As faixas são lidas do disco aos poucos durante a reprodução, em vez
+    de serem decodificadas inteiras na memória, e cada arquivo só é
+    aberto quando começa a tocar. A troca de playlist faz a música atual
+    sumir aos poucos antes da próxima surgir, já que o mixer só
+    reproduz uma música por vez.
+    """
+
+    def __init__(self, volume: float = 1.0, fade_ms: int = 1000) -> None:
+        """Cria o player sem nenhuma playlist.
+
+        Args:
+            volume (float, optional): volume da música. 1.0 por padrão.
+            fade_ms (int, optional):
+                duração, em milissegundos, das transições entre faixas.
+                1000 por padrão.
+        """
+        self.volume = volume
+        self.fade_ms = fade_ms
+
+        self.__playlist: List[str] = []
+        self.__pending: List[str] = []
+        self.__index = 0
+        self.__loop = True
+
+    def play(self, playlist: Sequence[str], loop: bool = True) -> None:
+        """Troca a playlist tocada, com transição caso já haja música.
+
+        Args:
+            playlist (Sequence[str]): caminhos das faixas, em ordem
+            loop (bool, optional):
+                define se a playlist recomeça ao terminar. True por
+                padrão.
+        """
+        playlist = list(playlist)
+
+        # Durante uma transição, compara com a playlist que vai tocar
+        if not mixer.get_init() or playlist == (
+            self.__pending or self.__playlist
+        ):
+            return
+
+        self.__loop = loop
+
+        # A playlist atual foi pedida de novo antes do fim da transição,
+        # então a troca pendente é cancelada
+        if playlist == self.__playlist:
+            self.__pending = []
+            return
+
+        self.__pending = playlist
+
+        if mixer.music.get_busy():
+            mixer.music.fadeout(self.fade_ms)
+        else:
+            self.update()
+
+    def stop(self) -> None:
+        """Encerra a música com uma transição.
+        """
+        self.__playlist = []
+        self.__pending = []
+
+        if mixer.get_init():
+            mixer.music.fadeout(self.fade_ms)
+
+    def update(self) -> None:
+        """Avança a playlist quando a faixa atual termina.
+
+        Deve ser chamado uma vez por frame.
+        """
+        if not mixer.get_init() or mixer.music.get_busy():
+            return
+
+        if self.__pending:
+            self.__playlist, self.__pending = self.__pending, []
+            self.__index = 0
+        elif not self.__playlist:
+            return
+        elif self.__index + 1 < len(self.__playlist) or self.__loop:
+            self.__index = (self.__index + 1) % len(self.__playlist)
+        else:
+            self.__playlist = []
+            return
+
+        # Uma playlist de uma única faixa é repetida pelo próprio mixer,
+        # sem intervalo entre as repetições
+        repeat = -1 if self.__loop and len(self.__playlist) == 1 else 0
+
+        mixer.music.load(self.__playlist[self.__index])
+        mixer.music.set_volume(self.volume)
+        mixer.music.play(loops=repeat, fade_ms=self.fade_ms)
@@ -1,10 +1,15 @@
-from random import choice
-from typing import List, Sequence, Tuple, Union
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
 
 from pygame.sprite import AbstractGroup, Sprite
 from pygame import Surface
 
-from zelda.src.core.utils import import_folder, reflect_images
+from zelda.src.core.rng import choice
+from zelda.src.core.assets import (
+    build_folder,
+    build_reflected_folder,
+    get_folder,
+    get_reflected_folder,
+)
 from zelda.src.settings import BASE_PATH
 
 
@@ -16,47 +21,63 @@ class AnimationPlayer:
     assim lentidão na execução do jogo.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, deferred: bool = False) -> None:
         """Inicializa a classe que executa os efeitos de partículas.
+
+        Args:
+            deferred (bool, optional):
+                define se as imagens dos efeitos devem ser carregadas aos
+                poucos, iterando sobre loading. False por padrão.
+        """
+        self.__frames: Dict[str, Any] = {}
+        self.loading = self.__build()
+
+        if not deferred:
+            for _ in self.loading:
+                pass
+
+    def __build(self) -> Iterator[None]:
+        """Carrega as imagens dos efeitos, uma imagem por iteração.
         """
         _path = f"{BASE_PATH}/graphics/particles"
 
-        self.__frames = {
+        folders = {
             # magic
-            "flame": import_folder(f"{_path}/flame/frames"),
-            "aura": import_folder(f"{_path}/aura"),
-            "heal": import_folder(f"{_path}/heal/frames"),
+            "flame": f"{_path}/flame/frames",
+            "aura": f"{_path}/aura",
+            "heal": f"{_path}/heal/frames",
 
             # attacks
-            "claw": import_folder(f"{_path}/claw"),
-            "slash": import_folder(f"{_path}/slash"),
-            "sparkle": import_folder(f"{_path}/sparkle"),
-            "leaf_attack": import_folder(f"{_path}/leaf_attack"),
-            "thunder": import_folder(f"{_path}/thunder"),
+            "claw": f"{_path}/claw",
+            "slash": f"{_path}/slash",
+            "sparkle": f"{_path}/sparkle",
+            "leaf_attack": f"{_path}/leaf_attack",
+            "thunder": f"{_path}/thunder",
 
             # monster deaths
-            "squid": import_folder(f"{_path}/smoke_orange"),
-            "raccoon": import_folder(f"{_path}/raccoon"),
-            "spirit": import_folder(f"{_path}/nova"),
-            "bamboo": import_folder(f"{_path}/bamboo"),
-
-            # leafs
-            "leaf": (
-                import_folder(f"{_path}/leaf1"),
-                import_folder(f"{_path}/leaf2"),
-                import_folder(f"{_path}/leaf3"),
-                import_folder(f"{_path}/leaf4"),
-                import_folder(f"{_path}/leaf5"),
-                import_folder(f"{_path}/leaf6"),
-                reflect_images(import_folder(f"{_path}/leaf1")),
-                reflect_images(import_folder(f"{_path}/leaf2")),
-                reflect_images(import_folder(f"{_path}/leaf3")),
-                reflect_images(import_folder(f"{_path}/leaf4")),
-                reflect_images(import_folder(f"{_path}/leaf5")),
-                reflect_images(import_folder(f"{_path}/leaf6")),
-            ),
+            "squid": f"{_path}/smoke_orange",
+            "raccoon": f"{_path}/raccoon",
+            "spirit": f"{_path}/nova",
+            "bamboo": f"{_path}/bamboo",
         }
 
+        # leafs
+        leaves = [f"{_path}/leaf{number}" for number in range(1, 7)]
+
+        for path in folders.values():
+            yield from build_folder(path)
+
+        for path in leaves:
+            yield from build_reflected_folder(path)
+
+        self.__frames = {
+            name: get_folder(path) for name, path in folders.items()
+        }
+        self.__frames["leaf"] = (
+            *(get_folder(path) for path in leaves),
+            *(get_reflected_folder(path) for path in leaves),
+        )
+
     def create_particles(
         self,
         name: str,
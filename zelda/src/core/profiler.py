@@ -0,0 +1,75 @@
+from collections import defaultdict
+from time import perf_counter
+from typing import Dict, List
+
+
+class _Section:
+    """Context manager que mede o tempo de uma etapa do frame.
+    """
+
+    def __init__(self, timings: List[float]) -> None:
+        self.__timings = timings
+        self.__start = 0.0
+
+    def __enter__(self) -> None:
+        self.__start = perf_counter()
+
+    def __exit__(self, *_) -> None:
+        self.__timings.append(perf_counter() - self.__start)
+
+
+class _NullSection:
+    """Context manager vazio utilizado quando o profiler está desligado.
+    """
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+class FrameProfiler:
+    """Classe para medir o tempo gasto em cada etapa de um frame.
+
+    O profiler fica desligado por padrão e, nesse caso, as seções não
+    fazem nenhuma medição, mantendo o custo no loop principal próximo
+    de zero.
+    """
+
+    __NULL_SECTION = _NullSection()
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Inicializa o profiler.
+
+        Args:
+            enabled (bool, optional):
+                define se as medições devem ser feitas. False por
+                padrão.
+        """
+        self.enabled = enabled
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.__sections: Dict[str, _Section] = {}
+
+    def section(self, name: str):
+        """Retorna o context manager que mede a etapa informada.
+
+        Args:
+            name (str): nome da etapa do frame
+
+        Returns:
+            context manager que acumula o tempo gasto na etapa
+        """
+        if not self.enabled:
+            return self.__NULL_SECTION
+
+        if name not in self.__sections:
+            self.__sections[name] = _Section(self.timings[name])
+
+        return self.__sections[name]
+
+    def reset(self) -> None:
+        """Descarta todas as medições feitas até o momento.
+        """
+        for timings in self.timings.values():
+            timings.clear()
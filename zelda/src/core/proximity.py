@@ -0,0 +1,136 @@
+from typing import List, Sequence, Tuple
+
+from pygame.math import Vector2
+
+from zelda.src.core.enemy_ai import decide_status
+from zelda.src.core.snapshot import ENEMY_STATUSES
+from zelda.src.core.spatial_grid import SpatialGrid
+
+# Lado das células do índice espacial, em pixels, menor do que os raios
+# de percepção dos inimigos para que uma busca cubra poucas células
+CELL_SIZE = 256
+
+
+class Proximity:
+    """Responde quais inimigos estão a até um raio de uma posição, com
+    um índice espacial e distâncias ao quadrado.
+
+    Também calcula, uma única vez por frame, a distância, a direção e o
+    status dos inimigos em relação ao player. Apenas os inimigos dentro
+    do maior raio de percepção, ou que ainda estavam perseguindo o
+    player, têm a distância real calculada. Os demais recebem o status
+    idle sem nenhuma raiz quadrada, de forma que o custo por inimigo é
+    constante.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE) -> None:
+        """Cria o índice vazio.
+
+        Args:
+            cell_size (int, optional):
+                lado das células do índice, em pixels. CELL_SIZE por
+                padrão.
+        """
+        self.__grid = SpatialGrid(cell_size)
+
+    def __len__(self) -> int:
+        return len(self.__grid)
+
+    def rebuild(self, enemies: Sequence) -> None:
+        """Indexa os inimigos pela posição atual, descartando o índice
+        anterior.
+
+        Args:
+            enemies (Sequence[Enemy]): inimigos indexados
+        """
+        self.__grid.clear()
+
+        for enemy in enemies:
+            self.__grid.insert(enemy, enemy.rect.center)
+
+    def within(self,
+               position: Tuple[float, float],
+               radius: float) -> List:
+        """Busca os inimigos indexados a até um raio de uma posição.
+
+        Args:
+            position (Tuple[float, float]): centro da busca, em pixels
+            radius (float): raio da busca, em pixels
+
+        Returns:
+            List[Enemy]: inimigos dentro do raio, agrupados por célula
+        """
+        x, y = position
+        limit = radius * radius
+        found = []
+
+        for enemy in self.__grid.query(position, radius):
+            dx = enemy.rect.centerx - x
+            dy = enemy.rect.centery - y
+
+            if dx * dx + dy * dy <= limit:
+                found.append(enemy)
+
+        return found
+
+    def plan(self,
+             enemies: Sequence,
+             player_pos: Tuple[float, float]) -> int:
+        """Calcula a distância, a direção e o status dos inimigos em
+        relação ao player e entrega o resultado para cada um deles, com
+        as mesmas contas feitas pelo Enemy.
+
+        Args:
+            enemies (Sequence[Enemy]): inimigos calculados
+            player_pos (Tuple[float, float]): posição do player
+
+        Returns:
+            int: quantidade de inimigos dentro do maior raio
+        """
+        if not enemies:
+            return 0
+
+        self.rebuild(enemies)
+
+        radius = max(
+            max(enemy.notice_radius, enemy.attack_radius)
+            for enemy in enemies
+        )
+        nearby = self.within(player_pos, radius)
+        player = Vector2(player_pos)
+
+        for enemy in nearby:
+            self.__plan_enemy(enemy, player)
+
+        marked = set(nearby)
+
+        for enemy in enemies:
+            if enemy in marked:
+                continue
+
+            # Fora do maior raio nenhum inimigo ataca ou persegue o
+            # player. Só quem estava perseguindo ainda dá um último
+            # passo na direção dele, antes de ficar parado
+            if enemy.status == "move":
+                self.__plan_enemy(enemy, player)
+            else:
+                enemy.set_plan(float("inf"), (0.0, 0.0), "idle")
+
+        return len(nearby)
+
+    @staticmethod
+    def __plan_enemy(enemy, player: Vector2) -> None:
+        """Calcula a distância real, a direção e o status de um inimigo.
+        """
+        enemy_pos = Vector2(enemy.rect.center)
+        distance = enemy_pos.distance_to(player)
+        direction = (
+            (player - enemy_pos).normalize() if distance > 0
+            else Vector2()
+        )
+        status = decide_status(
+            distance, enemy.can_attack,
+            enemy.attack_radius, enemy.notice_radius,
+        )
+
+        enemy.set_plan(distance, tuple(direction), ENEMY_STATUSES[status])
@@ -0,0 +1,125 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Tuple
+
+from zelda.src.settings import FPS
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """Parâmetros do trabalho não essencial em um nível de qualidade.
+
+    Args:
+        leaves (Tuple[int, int]):
+            intervalo da quantidade de folhas criadas por grama cortada
+        flames (int): quantidade de chamas criadas pela magia de fogo
+        far_enemy_interval (int):
+            a cada quantos frames os inimigos distantes do player
+            atualizam o status e a animação
+    """
+    leaves: Tuple[int, int]
+    flames: int
+    far_enemy_interval: int
+
+
+# Níveis de qualidade, do completo ao mais reduzido
+LEVELS: Tuple[QualityLevel, ...] = (
+    QualityLevel(leaves=(3, 6), flames=5, far_enemy_interval=1),
+    QualityLevel(leaves=(2, 4), flames=5, far_enemy_interval=2),
+    QualityLevel(leaves=(1, 3), flames=4, far_enemy_interval=3),
+    QualityLevel(leaves=(1, 2), flames=3, far_enemy_interval=4),
+)
+
+_level = 0
+
+
+def get() -> QualityLevel:
+    """Retorna os parâmetros do nível de qualidade atual.
+    """
+    return LEVELS[_level]
+
+
+def get_level() -> int:
+    """Retorna o nível de qualidade atual, sendo 0 a qualidade completa.
+    """
+    return _level
+
+
+def set_level(level: int) -> None:
+    """Define o nível de qualidade, limitado aos níveis existentes.
+
+    Args:
+        level (int): nível de qualidade, sendo 0 a qualidade completa
+    """
+    global _level
+    _level = min(max(level, 0), len(LEVELS) - 1)
+
+
+class QualityGovernor:
+    """Ajusta o nível de qualidade a partir do tempo dos frames.
+
+    Quando a média dos últimos frames passa do tempo de um frame no FPS
+    alvo, a qualidade é reduzida em um nível. Ela volta a subir quando a
+    média fica bem abaixo desse tempo. Depois de cada ajuste a janela é
+    esvaziada, para que o próximo ajuste considere apenas frames medidos
+    com o nível novo.
+    """
+
+    def __init__(self,
+                 target_fps: int = FPS,
+                 window: int = 60,
+                 degrade_ratio: float = 0.9,
+                 restore_ratio: float = 0.6) -> None:
+        """Cria o regulador na qualidade completa.
+
+        Args:
+            target_fps (int, optional): FPS que o jogo tenta manter.
+                FPS por padrão.
+            window (int, optional):
+                quantidade de frames considerados na média. 60 por
+                padrão.
+            degrade_ratio (float, optional):
+                fração do tempo de um frame a partir da qual a qualidade
+                é reduzida. 0.9 por padrão.
+            restore_ratio (float, optional):
+                fração do tempo de um frame abaixo da qual a qualidade
+                é restaurada. 0.6 por padrão.
+        """
+        frame_ms = 1000 / target_fps
+
+        self.degrade_ms = frame_ms * degrade_ratio
+        self.restore_ms = frame_ms * restore_ratio
+        self.__frame_times: Deque[float] = deque(maxlen=window)
+
+        set_level(0)
+
+    @property
+    def level(self) -> int:
+        """Nível de qualidade atual, sendo 0 a qualidade completa.
+        """
+        return get_level()
+
+    def record(self, frame_ms: float) -> None:
+        """Registra o tempo de trabalho de um frame e ajusta a qualidade
+        quando a janela está completa.
+
+        Args:
+            frame_ms (float):
+                tempo gasto no frame, em milissegundos, sem contar a
+                espera da limitação de FPS
+        """
+        self.__frame_times.append(frame_ms)
+
+        if len(self.__frame_times) < self.__frame_times.maxlen:
+            return
+
+        average = sum(self.__frame_times) / len(self.__frame_times)
+
+        if average > self.degrade_ms and self.level < len(LEVELS) - 1:
+            set_level(self.level + 1)
+        elif average < self.restore_ms and self.level > 0:
+            set_level(self.level - 1)
+        else:
+            return
+
+        self.__frame_times.clear()
@@ -0,0 +1,136 @@
+from threading import Condition, Thread
+from typing import NamedTuple, Tuple, Union
+
+from pygame import Rect, Surface
+from pygame.display import update as update_display
+
+# Desenho de uma superfície em uma posição da tela
+BlitCommand = Tuple[Surface, Tuple[int, int]]
+
+
+class RenderList(NamedTuple):
+    """Comandos de desenho de um frame, montados pela simulação e
+    executados pela thread de renderização.
+
+    As superfícies referenciadas não podem ser alteradas depois que a
+    lista é entregue, o que vale para os assets compartilhados. Uma
+    superfície que muda entre frames, como a da UI, deve ser copiada.
+
+    Args:
+        fill (Union[str, Tuple[int, int, int], None]):
+            cor com que a tela é preenchida antes dos blits, ou None
+            para desenhar sobre o conteúdo atual
+        blits (Tuple[BlitCommand, ...]): blits, na ordem em que ocorrem
+        present (Tuple[Rect, ...]): áreas enviadas para a janela
+    """
+    fill: Union[str, Tuple[int, int, int], None]
+    blits: Tuple[BlitCommand, ...]
+    present: Tuple[Rect, ...]
+
+
+class RenderThread:
+    """Compõe e apresenta os frames em uma thread de trabalho.
+
+    Enquanto a thread desenha e envia para a janela o frame N, a thread
+    principal simula o frame N + 1. Os blits e a atualização da janela
+    liberam o GIL, de forma que as duas etapas podem rodar ao mesmo
+    tempo em máquinas com mais de um núcleo. No máximo um frame fica em
+    composição: entregar o próximo espera o anterior terminar.
+
+    A thread principal só pode desenhar direto na tela depois de wait.
+    """
+
+    def __init__(self, surface: Surface) -> None:
+        """Inicia a thread de renderização.
+
+        Args:
+            surface (Surface): superfície da janela
+        """
+        self.surface = surface
+        self.frames = 0
+
+        # Áreas apresentadas pela última lista entregue
+        self.last_present: Tuple[Rect, ...] = ()
+
+        self.__condition = Condition()
+        self.__pending: Union[RenderList, None] = None
+        self.__busy = False
+        self.__running = True
+        self.__error: Union[BaseException, None] = None
+
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __idle(self) -> bool:
+        return self.__pending is None and not self.__busy
+
+    def __raise_error(self) -> None:
+        """Repassa para a thread principal o erro ocorrido na
+        renderização.
+        """
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def submit(self, render_list: RenderList) -> None:
+        """Entrega os comandos de um frame, esperando a composição do
+        frame anterior terminar.
+
+        Args:
+            render_list (RenderList): comandos do frame
+        """
+        with self.__condition:
+            self.__condition.wait_for(self.__idle)
+            self.__raise_error()
+
+            self.__pending = render_list
+            self.last_present = render_list.present
+            self.__condition.notify_all()
+
+    def wait(self) -> None:
+        """Espera o último frame entregue ser apresentado.
+        """
+        with self.__condition:
+            self.__condition.wait_for(self.__idle)
+            self.__raise_error()
+
+    def close(self) -> None:
+        """Apresenta o último frame entregue e encerra a thread.
+        """
+        with self.__condition:
+            self.__condition.wait_for(self.__idle)
+            self.__running = False
+            self.__condition.notify_all()
+
+        self.__thread.join()
+        self.__raise_error()
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: self.__pending is not None or not self.__running,
+                )
+
+                if self.__pending is None:
+                    return
+
+                render_list, self.__pending = self.__pending, None
+                self.__busy = True
+
+            try:
+                if render_list.fill is not None:
+                    self.surface.fill(render_list.fill)
+
+                self.surface.blits(render_list.blits, False)
+
+                if render_list.present:
+                    update_display(render_list.present)
+
+                self.frames += 1
+            except BaseException as error:
+                self.__error = error
+
+            with self.__condition:
+                self.__busy = False
+                self.__condition.notify_all()
@@ -0,0 +1,47 @@
+from random import Random
+from typing import Any, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Gerador compartilhado por todo o jogo. Usar sempre esse gerador, e
+# não o módulo random diretamente, garante que uma sessão possa ser
+# repetida exatamente a partir da mesma semente.
+_random = Random()
+
+
+def seed(value: int) -> None:
+    """Reinicia o gerador de números aleatórios do jogo.
+
+    Args:
+        value (int): semente utilizada pelo gerador
+    """
+    _random.seed(value)
+
+
+def get_state() -> Any:
+    """Retorna o estado atual do gerador, que pode ser restaurado com
+    set_state. Usado para manter um gerador por nível quando vários
+    níveis rodam no mesmo processo.
+    """
+    return _random.getstate()
+
+
+def set_state(state: Any) -> None:
+    """Restaura um estado retornado por get_state.
+
+    Args:
+        state (Any): estado do gerador
+    """
+    _random.setstate(state)
+
+
+def choice(sequence: Sequence[T]) -> T:
+    """Escolhe um elemento aleatório de uma sequência não vazia.
+    """
+    return _random.choice(sequence)
+
+
+def randint(start: int, end: int) -> int:
+    """Gera um inteiro aleatório no intervalo [start, end].
+    """
+    return _random.randint(start, end)
@@ -0,0 +1,91 @@
+from collections import deque
+from time import perf_counter
+from typing import Callable, Deque, Iterator, Union
+
+from zelda.src.core.clock import is_fixed_step
+from zelda.src.settings import FRAME_BUDGET_MS
+
+Task = Union[Iterator[None], Callable[[], None]]
+
+
+class FrameScheduler:
+    """Executa tarefas adiáveis dentro do tempo que sobra em cada frame.
+
+    Cada tarefa é um gerador que devolve o controle após cada etapa do
+    trabalho, ou uma função executada de uma só vez. As tarefas são
+    executadas alternadamente, uma etapa por vez, até o tempo do frame
+    acabar, e o restante fica para os frames seguintes. Pelo menos uma
+    etapa é executada por frame, para que nenhuma tarefa fique parada.
+
+    Com o relógio de passo fixo, usado em gravações e replays, o limite
+    passa a ser uma quantidade fixa de etapas por frame, para que o
+    resultado não dependa da velocidade da máquina.
+    """
+
+    def __init__(self,
+                 budget_ms: float = FRAME_BUDGET_MS,
+                 fixed_steps: int = 8) -> None:
+        """Cria o escalonador sem nenhuma tarefa.
+
+        Args:
+            budget_ms (float, optional):
+                tempo total do frame, em milissegundos, até o qual as
+                tarefas podem ser executadas. FRAME_BUDGET_MS por
+                padrão.
+            fixed_steps (int, optional):
+                etapas executadas por frame com o relógio de passo
+                fixo. 8 por padrão.
+        """
+        self.budget_ms = budget_ms
+        self.fixed_steps = fixed_steps
+
+        self.__tasks: Deque[Iterator[None]] = deque()
+
+    def __len__(self) -> int:
+        return len(self.__tasks)
+
+    def submit(self, task: Task) -> None:
+        """Adiciona uma tarefa ao fim da fila.
+
+        Args:
+            task (Task): gerador com as etapas da tarefa, ou função
+        """
+        if callable(task):
+            task = self.__single_step(task)
+
+        self.__tasks.append(task)
+
+    @staticmethod
+    def __single_step(function: Callable[[], None]) -> Iterator[None]:
+        function()
+        yield
+
+    def run(self, frame_start: float) -> None:
+        """Executa as tarefas até o tempo do frame acabar.
+
+        Args:
+            frame_start (float):
+                início do frame, medido com time.perf_counter
+        """
+        deadline = frame_start + self.budget_ms / 1000
+        steps = 0
+
+        while self.__tasks:
+            if steps and (
+                steps >= self.fixed_steps
+                if is_fixed_step()
+                else perf_counter() >= deadline
+            ):
+                break
+
+            task = self.__tasks.popleft()
+            steps += 1
+
+            try:
+                next(task)
+            except StopIteration:
+                # A tarefa já tinha terminado e nenhum trabalho foi feito
+                steps -= 1
+                continue
+
+            self.__tasks.append(task)
@@ -0,0 +1,302 @@
+import os
+from dataclasses import dataclass, field
+from struct import Struct
+from threading import Lock, Thread
+from typing import List, Tuple, Union
+
+from zelda.src.settings import MONSTER_DATA
+
+# Estado de um Timer: se está ativo, o tempo decorrido desde a ativação
+# e a duração, incluindo a extensão
+TimerState = Tuple[bool, int, float]
+
+# Status possíveis de um inimigo, na ordem em que são gravados
+ENEMY_STATUSES: Tuple[str, ...] = ("idle", "move", "attack")
+
+_MONSTERS: Tuple[str, ...] = tuple(MONSTER_DATA)
+
+
+@dataclass
+class PlayerRecord:
+    """Estado dinâmico do player.
+
+    Args:
+        position (Tuple[int, int]): centro da hitbox, em pixels
+        status (int): valor do PlayerState atual
+        frame_index (float): posição na animação atual
+        health (float): vida atual
+        energy (float): energia atual
+        exp (int): experiência acumulada
+        weapon_index (int): índice da arma selecionada
+        magic_index (int): índice da magia selecionada
+        stats (Tuple[float, ...]):
+            estatísticas, na ordem de PLAYER_MAX_STATS
+        cooldowns (Tuple[TimerState, ...]):
+            estado dos cooldowns, na ordem em que foram criados
+    """
+    position: Tuple[int, int]
+    status: int
+    frame_index: float
+    health: float
+    energy: float
+    exp: int
+    weapon_index: int
+    magic_index: int
+    stats: Tuple[float, ...]
+    cooldowns: Tuple[TimerState, ...]
+
+
+@dataclass
+class EnemyRecord:
+    """Estado dinâmico de um inimigo vivo.
+
+    Args:
+        monster_name (str): nome do monstro, chave de MONSTER_DATA
+        position (Tuple[int, int]): centro da hitbox, em pixels
+        status (str): status atual, um de ENEMY_STATUSES
+        frame_index (float): posição na animação atual
+        health (float): vida atual
+        direction (Tuple[float, float]): direção do movimento
+        can_attack (bool): define se o inimigo pode atacar
+        cooldowns (Tuple[TimerState, ...]):
+            estado dos cooldowns, na ordem em que foram criados
+    """
+    monster_name: str
+    position: Tuple[int, int]
+    status: str
+    frame_index: float
+    health: float
+    direction: Tuple[float, float]
+    can_attack: bool
+    cooldowns: Tuple[TimerState, ...]
+
+
+@dataclass
+class Snapshot:
+    """Estado dinâmico de um nível, salvo em um formato binário
+    versionado.
+
+    O mapa não faz parte do snapshot. Ele é referenciado por uma
+    impressão digital das camadas, e a grama cortada é gravada como um
+    bit por tufo de grama, na ordem em que eles aparecem no mapa.
+
+    Args:
+        map_id (int): impressão digital das camadas do mapa
+        player (PlayerRecord): estado do player
+        enemies (List[EnemyRecord]): estado dos inimigos vivos
+        killed_grass (bytes): bits dos tufos de grama cortados
+        upgrade_cost (Tuple[int, ...]):
+            custo dos upgrades, na ordem de PLAYER_MAX_STATS
+    """
+    map_id: int
+    player: PlayerRecord
+    enemies: List[EnemyRecord] = field(default_factory=list)
+    killed_grass: bytes = b""
+    upgrade_cost: Tuple[int, ...] = ()
+
+    MAGIC = b"ZSAV"
+    VERSION = 1
+
+    __HEADER = Struct("<4sHI")
+    __COUNT = Struct("<I")
+    __TIMER = Struct("<?id")
+    __PLAYER = Struct("<iiBdddiBB")
+    __ENEMY = Struct("<BiiBdddd?")
+    __STAT = Struct("<d")
+
+    @classmethod
+    def __pack_timers(cls, timers: Tuple[TimerState, ...]) -> bytes:
+        return bytes([len(timers)]) + b"".join(
+            cls.__TIMER.pack(*timer) for timer in timers
+        )
+
+    @classmethod
+    def __unpack_timers(cls,
+                        data: bytes,
+                        offset: int) -> Tuple[Tuple[TimerState, ...], int]:
+        count = data[offset]
+        offset += 1
+        timers = []
+
+        for _ in range(count):
+            timers.append(cls.__TIMER.unpack_from(data, offset))
+            offset += cls.__TIMER.size
+
+        return tuple(timers), offset
+
+    def to_bytes(self) -> bytes:
+        """Serializa o snapshot.
+
+        Returns:
+            bytes: snapshot no formato binário
+        """
+        player = self.player
+        chunks = [
+            self.__HEADER.pack(self.MAGIC, self.VERSION, self.map_id),
+            self.__PLAYER.pack(
+                *player.position, player.status, player.frame_index,
+                player.health, player.energy, player.exp,
+                player.weapon_index, player.magic_index,
+            ),
+            bytes([len(player.stats)]),
+            b"".join(self.__STAT.pack(stat) for stat in player.stats),
+            self.__pack_timers(player.cooldowns),
+            self.__COUNT.pack(len(self.enemies)),
+        ]
+
+        for enemy in self.enemies:
+            chunks.append(self.__ENEMY.pack(
+                _MONSTERS.index(enemy.monster_name), *enemy.position,
+                ENEMY_STATUSES.index(enemy.status), enemy.frame_index,
+                enemy.health, *enemy.direction, enemy.can_attack,
+            ))
+            chunks.append(self.__pack_timers(enemy.cooldowns))
+
+        chunks.append(self.__COUNT.pack(len(self.killed_grass)))
+        chunks.append(self.killed_grass)
+        chunks.append(bytes([len(self.upgrade_cost)]))
+        chunks.append(b"".join(
+            self.__COUNT.pack(cost) for cost in self.upgrade_cost
+        ))
+
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Snapshot":
+        """Lê um snapshot serializado com to_bytes.
+
+        Args:
+            data (bytes): snapshot no formato binário
+
+        Raises:
+            ValueError: caso os dados não sejam um snapshot válido
+
+        Returns:
+            Snapshot: snapshot lido
+        """
+        magic, version, map_id = cls.__HEADER.unpack_from(data)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("dados não são um snapshot válido")
+
+        offset = cls.__HEADER.size
+        (x, y, status, frame_index, health, energy, exp, weapon_index,
+         magic_index) = cls.__PLAYER.unpack_from(data, offset)
+        offset += cls.__PLAYER.size
+
+        stats = []
+
+        for _ in range(data[offset]):
+            stats.append(cls.__STAT.unpack_from(data, offset + 1)[0])
+            offset += cls.__STAT.size
+
+        cooldowns, offset = cls.__unpack_timers(data, offset + 1)
+        player = PlayerRecord(
+            (x, y), status, frame_index, health, energy, exp, weapon_index,
+            magic_index, tuple(stats), cooldowns,
+        )
+
+        (count,) = cls.__COUNT.unpack_from(data, offset)
+        offset += cls.__COUNT.size
+        enemies = []
+
+        for _ in range(count):
+            (monster, x, y, status, frame_index, health, direction_x,
+             direction_y, can_attack) = cls.__ENEMY.unpack_from(data, offset)
+            cooldowns, offset = cls.__unpack_timers(
+                data, offset + cls.__ENEMY.size,
+            )
+            enemies.append(EnemyRecord(
+                _MONSTERS[monster], (x, y), ENEMY_STATUSES[status],
+                frame_index, health, (direction_x, direction_y),
+                can_attack, cooldowns,
+            ))
+
+        (count,) = cls.__COUNT.unpack_from(data, offset)
+        offset += cls.__COUNT.size
+        killed_grass = bytes(data[offset:offset + count])
+        offset += count
+
+        upgrade_cost = []
+
+        for _ in range(data[offset]):
+            upgrade_cost.append(cls.__COUNT.unpack_from(data, offset + 1)[0])
+            offset += cls.__COUNT.size
+
+        return cls(map_id, player, enemies, killed_grass, tuple(upgrade_cost))
+
+    def save(self, path: str) -> None:
+        write_file(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        with open(path, "rb") as snapshot_file:
+            return cls.from_bytes(snapshot_file.read())
+
+
+def write_file(path: str, data: bytes) -> None:
+    """Escreve um arquivo de forma atômica, através de um arquivo
+    temporário, para que um snapshot nunca fique pela metade.
+
+    Args:
+        path (str): caminho do arquivo
+        data (bytes): conteúdo do arquivo
+    """
+    temporary_path = f"{path}.tmp"
+
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(data)
+
+    os.replace(temporary_path, path)
+
+
+class SnapshotWriter:
+    """Grava snapshots em uma thread de trabalho.
+
+    O snapshot é serializado na thread principal, o que é rápido, e
+    apenas a escrita no disco acontece em segundo plano. Caso novos
+    snapshots sejam pedidos enquanto um ainda está sendo escrito, apenas
+    o mais recente é gravado em seguida.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__pending: Union[Tuple[str, bytes], None] = None
+        self.__thread: Union[Thread, None] = None
+
+    def write(self, path: str, snapshot: Snapshot) -> None:
+        """Pede a gravação de um snapshot.
+
+        Args:
+            path (str): arquivo em que o snapshot será gravado
+            snapshot (Snapshot): snapshot gravado
+        """
+        data = snapshot.to_bytes()
+
+        with self.__lock:
+            self.__pending = (path, data)
+
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__run, daemon=True)
+                self.__thread.start()
+
+    def flush(self) -> None:
+        """Espera a gravação dos snapshots pendentes.
+        """
+        with self.__lock:
+            thread = self.__thread
+
+        if thread is not None:
+            thread.join()
+
+    def __run(self) -> None:
+        while True:
+            with self.__lock:
+                if self.__pending is None:
+                    self.__thread = None
+                    return
+
+                path, data = self.__pending
+                self.__pending = None
+
+            write_file(path, data)
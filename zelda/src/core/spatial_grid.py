@@ -0,0 +1,107 @@
+from collections import defaultdict
+from typing import Any, DefaultDict, Iterator, List, Tuple
+
+# Células vizinhas consultadas a partir de cada célula para formar os
+# pares, metade da vizinhança para que cada par apareça uma única vez
+_HALF_NEIGHBOURHOOD: Tuple[Tuple[int, int], ...] = (
+    (1, 0), (-1, 1), (0, 1), (1, 1),
+)
+
+
+class SpatialGrid:
+    """Grade uniforme que indexa objetos pela célula do seu centro.
+
+    Com células maiores do que o maior objeto, dois objetos que se
+    sobrepõem estão sempre na mesma célula ou em células vizinhas, de
+    forma que os pares candidatos a colisão são encontrados em tempo
+    próximo de linear, sem comparar todos os pares.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        """Cria a grade vazia.
+
+        Args:
+            cell_size (int): lado de cada célula, em pixels
+        """
+        self.cell_size = cell_size
+        self.__cells: DefaultDict[Tuple[int, int], List[Any]] = (
+            defaultdict(list)
+        )
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.__cells.values())
+
+    def cell(self, position: Tuple[float, float]) -> Tuple[int, int]:
+        """Retorna a célula que contém uma posição.
+
+        Args:
+            position (Tuple[float, float]): posição, em pixels
+
+        Returns:
+            Tuple[int, int]: coluna e linha da célula
+        """
+        return (
+            int(position[0] // self.cell_size),
+            int(position[1] // self.cell_size),
+        )
+
+    def insert(self, item: Any, position: Tuple[float, float]) -> None:
+        """Adiciona um objeto na célula de uma posição.
+
+        Args:
+            item (Any): objeto indexado
+            position (Tuple[float, float]): centro do objeto, em pixels
+        """
+        self.__cells[self.cell(position)].append(item)
+
+    def clear(self) -> None:
+        self.__cells.clear()
+
+    def pairs(self) -> Iterator[Tuple[Any, Any]]:
+        """Itera sobre os pares de objetos na mesma célula ou em células
+        vizinhas, cada par uma única vez, na ordem de inserção.
+
+        Yields:
+            Tuple[Any, Any]: par candidato
+        """
+        cells = self.__cells
+
+        for (column, row), items in cells.items():
+            for index, item in enumerate(items):
+                for other in items[index + 1:]:
+                    yield item, other
+
+            for offset_column, offset_row in _HALF_NEIGHBOURHOOD:
+                neighbours = cells.get(
+                    (column + offset_column, row + offset_row),
+                )
+
+                if neighbours:
+                    for item in items:
+                        for other in neighbours:
+                            yield item, other
+
+    def query(self,
+              position: Tuple[float, float],
+              radius: float) -> Iterator[Any]:
+        """Itera sobre os objetos das células que podem estar a até um
+        raio de uma posição. Os objetos ainda precisam ser filtrados
+        pela distância real.
+
+        Args:
+            position (Tuple[float, float]): centro da busca, em pixels
+            radius (float): raio da busca, em pixels
+
+        Yields:
+            Any: objeto candidato
+        """
+        first_column, first_row = self.cell(
+            (position[0] - radius, position[1] - radius),
+        )
+        last_column, last_row = self.cell(
+            (position[0] + radius, position[1] + radius),
+        )
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                yield from self.__cells.get((column, row), ())
@@ -0,0 +1,337 @@
+from struct import Struct
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from zelda.src.settings import MONSTER_DATA
+
+# Tipos de entidade, na ordem em que são gravados: o player seguido dos
+# monstros de MONSTER_DATA
+KINDS: Tuple[str, ...] = ("player",) + tuple(MONSTER_DATA)
+
+# A vida é gravada como inteiro, em décimos
+HEALTH_SCALE = 10
+
+# Bits que indicam os campos presentes na atualização de uma entidade
+NEW = 1
+POSITION = 2
+STATUS = 4
+HEALTH = 8
+FRAME = 16
+
+
+class EntityState(NamedTuple):
+    """Estado visível de uma entidade em um frame.
+
+    Args:
+        entity_id (int): identificador único da entidade
+        kind (int): índice do tipo da entidade em KINDS
+        x (int): posição horizontal do centro da hitbox, em pixels
+        y (int): posição vertical do centro da hitbox, em pixels
+        status (int): código do status da entidade
+        health (float): vida atual
+        frame (int): frame atual da animação
+    """
+    entity_id: int
+    kind: int
+    x: int
+    y: int
+    status: int
+    health: float
+    frame: int
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """Escreve um inteiro não negativo com 7 bits por byte.
+    """
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def _write_signed(buffer: bytearray, value: int) -> None:
+    """Escreve um inteiro com sinal em zigzag, para que valores
+    pequenos e negativos também ocupem poucos bytes.
+    """
+    _write_varint(buffer, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if byte < 0x80:
+            return value, offset
+
+
+def _read_signed(data: bytes, offset: int) -> Tuple[int, int]:
+    value, offset = _read_varint(data, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+# Estado de uma entidade como é comparado e gravado, com a vida já
+# convertida para inteiro
+_Encoded = Tuple[int, int, int, int, int, int]
+
+
+class StateEncoder:
+    """Codifica o estado das entidades frame a frame, gravando apenas o
+    que mudou desde o frame anterior.
+
+    Cada mensagem traz as entidades novas ou alteradas, com um byte de
+    bits indicando os campos presentes e as posições e a vida como
+    diferenças em relação ao último valor enviado, seguidas das
+    entidades removidas. Um frame sem mudanças ocupa dois bytes.
+    """
+
+    def __init__(self) -> None:
+        self.__last: Dict[int, _Encoded] = {}
+
+    def keyframe(self) -> None:
+        """Faz a próxima mensagem conter o estado completo de todas as
+        entidades, para que um espectador possa começar a partir dela.
+        """
+        self.__last.clear()
+
+    def encode(self, entities: Iterable[EntityState]) -> bytes:
+        """Codifica o estado das entidades em um frame.
+
+        Args:
+            entities (Iterable[EntityState]): entidades presentes
+
+        Returns:
+            bytes: mensagem com as mudanças desde o frame anterior
+        """
+        updates = bytearray()
+        count = 0
+        current: Dict[int, _Encoded] = {}
+
+        for entity in entities:
+            encoded = (
+                entity.kind, entity.x, entity.y, entity.status,
+                round(entity.health * HEALTH_SCALE), entity.frame,
+            )
+            current[entity.entity_id] = encoded
+            last = self.__last.get(entity.entity_id)
+
+            if last == encoded:
+                continue
+
+            if last is None:
+                flags = NEW | POSITION | STATUS | HEALTH | FRAME
+                last = (encoded[0], 0, 0, 0, 0, 0)
+            else:
+                flags = (
+                    (POSITION if last[1:3] != encoded[1:3] else 0)
+                    | (STATUS if last[3] != encoded[3] else 0)
+                    | (HEALTH if last[4] != encoded[4] else 0)
+                    | (FRAME if last[5] != encoded[5] else 0)
+                )
+
+            _write_varint(updates, entity.entity_id)
+            updates.append(flags)
+
+            if flags & NEW:
+                _write_varint(updates, encoded[0])
+
+            if flags & POSITION:
+                _write_signed(updates, encoded[1] - last[1])
+                _write_signed(updates, encoded[2] - last[2])
+
+            if flags & STATUS:
+                _write_varint(updates, encoded[3])
+
+            if flags & HEALTH:
+                _write_signed(updates, encoded[4] - last[4])
+
+            if flags & FRAME:
+                _write_varint(updates, encoded[5])
+
+            count += 1
+
+        removed = [
+            entity_id for entity_id in self.__last
+            if entity_id not in current
+        ]
+        self.__last = current
+
+        message = bytearray()
+        _write_varint(message, count)
+        message += updates
+        _write_varint(message, len(removed))
+
+        for entity_id in removed:
+            _write_varint(message, entity_id)
+
+        return bytes(message)
+
+
+class StateDecoder:
+    """Reconstrói o estado das entidades a partir das mensagens do
+    StateEncoder.
+    """
+
+    def __init__(self) -> None:
+        self.entities: Dict[int, EntityState] = {}
+
+    def decode(self, message: bytes) -> Dict[int, EntityState]:
+        """Aplica uma mensagem ao estado atual.
+
+        Args:
+            message (bytes): mensagem gerada por StateEncoder.encode
+
+        Returns:
+            Dict[int, EntityState]: entidades presentes, por identificador
+        """
+        count, offset = _read_varint(message, 0)
+
+        for _ in range(count):
+            entity_id, offset = _read_varint(message, offset)
+            flags = message[offset]
+            offset += 1
+
+            if flags & NEW:
+                kind, offset = _read_varint(message, offset)
+                entity = EntityState(entity_id, kind, 0, 0, 0, 0.0, 0)
+            else:
+                entity = self.entities[entity_id]
+
+            x, y, status = entity.x, entity.y, entity.status
+            health = round(entity.health * HEALTH_SCALE)
+            frame = entity.frame
+
+            if flags & POSITION:
+                dx, offset = _read_signed(message, offset)
+                dy, offset = _read_signed(message, offset)
+                x, y = x + dx, y + dy
+
+            if flags & STATUS:
+                status, offset = _read_varint(message, offset)
+
+            if flags & HEALTH:
+                delta, offset = _read_signed(message, offset)
+                health += delta
+
+            if flags & FRAME:
+                frame, offset = _read_varint(message, offset)
+
+            self.entities[entity_id] = EntityState(
+                entity_id, entity.kind, x, y, status,
+                health / HEALTH_SCALE, frame,
+            )
+
+        count, offset = _read_varint(message, offset)
+
+        for _ in range(count):
+            entity_id, offset = _read_varint(message, offset)
+            self.entities.pop(entity_id, None)
+
+        return self.entities
+
+
+class StateStreamWriter:
+    """Grava as mensagens do StateEncoder em um arquivo, pipe ou socket.
+
+    O stream começa com um cabeçalho com a versão e o FPS, seguido por
+    uma mensagem por frame, precedida pelo seu tamanho.
+    """
+
+    MAGIC = b"ZSTR"
+    VERSION = 1
+
+    HEADER = Struct("<4sHH")
+
+    def __init__(self, stream: BinaryIO, fps: int) -> None:
+        """Escreve o cabeçalho do stream.
+
+        Args:
+            stream (BinaryIO): destino das mensagens
+            fps (int): frames por segundo do jogo
+        """
+        self.stream = stream
+        self.encoder = StateEncoder()
+
+        self.stream.write(self.HEADER.pack(self.MAGIC, self.VERSION, fps))
+
+    def write(self, entities: Iterable[EntityState]) -> int:
+        """Grava as mudanças de um frame.
+
+        Args:
+            entities (Iterable[EntityState]): entidades presentes
+
+        Returns:
+            int: quantidade de bytes gravados
+        """
+        message = self.encoder.encode(entities)
+        frame = bytearray()
+
+        _write_varint(frame, len(message))
+        frame += message
+
+        self.stream.write(frame)
+        self.stream.flush()
+
+        return len(frame)
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+class StateStreamReader:
+    """Lê um stream gravado pelo StateStreamWriter, frame a frame.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """Lê o cabeçalho do stream.
+
+        Args:
+            stream (BinaryIO): origem das mensagens
+
+        Raises:
+            ValueError: caso o stream não tenha sido gravado pelo
+                StateStreamWriter
+        """
+        self.stream = stream
+        self.decoder = StateDecoder()
+
+        header = stream.read(StateStreamWriter.HEADER.size)
+        magic, version, self.fps = StateStreamWriter.HEADER.unpack(header)
+
+        if (
+            magic != StateStreamWriter.MAGIC
+            or version != StateStreamWriter.VERSION
+        ):
+            raise ValueError("o stream não é um stream de estado válido")
+
+    def __iter__(self) -> Iterator[List[EntityState]]:
+        """Itera sobre os frames do stream até ele terminar.
+
+        Yields:
+            List[EntityState]: entidades presentes em cada frame
+        """
+        while True:
+            length = shift = 0
+
+            while True:
+                byte = self.stream.read(1)
+
+                if not byte:
+                    return
+
+                length |= (byte[0] & 0x7F) << shift
+                shift += 7
+
+                if byte[0] < 0x80:
+                    break
+
+            message = self.stream.read(length)
+
+            if len(message) < length:
+                return
+
+            yield list(self.decoder.decode(message).values())
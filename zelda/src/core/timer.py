@@ -1,6 +1,6 @@
-from typing import Callable
+from typing import Callable, Tuple
 
-from pygame.time import get_ticks
+from zelda.src.core.clock import get_ticks
 
 
 class Timer:
@@ -53,6 +53,33 @@ class Timer:
         """
         self.__extended_duration = self.duration + extend_time
 
+    def get_state(self) -> Tuple[bool, int, float]:
+        """Retorna o estado do timer, relativo ao tempo atual, para que
+        ele possa ser restaurado depois com set_state.
+
+        Returns:
+            Tuple[bool, int, float]:
+                se o timer está ativo, o tempo decorrido desde a
+                ativação e a duração, incluindo a extensão
+        """
+        elapsed = get_ticks() - self.start_time if self.active else 0
+        return self.active, elapsed, self.__extended_duration
+
+    def set_state(self,
+                  active: bool,
+                  elapsed: int,
+                  extended_duration: float) -> None:
+        """Restaura um estado retornado por get_state.
+
+        Args:
+            active (bool): se o timer está ativo
+            elapsed (int): tempo decorrido desde a ativação
+            extended_duration (float): duração, incluindo a extensão
+        """
+        self.active = active
+        self.start_time = get_ticks() - elapsed if active else 0
+        self.__extended_duration = extended_duration
+
     def update(self) -> None:
         """Atualiza o timer.
 
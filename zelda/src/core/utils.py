@@ -1,6 +1,6 @@
 from os import walk
 from csv import reader
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Union
 
 from pygame.transform import flip as flip_surface
 from pygame.image import load as load_image
@@ -24,7 +24,9 @@ def import_csv(path: str) -> List[List[str]]:
 
 def import_folder(
     path: str,
-    get_dict: bool = False
+    get_dict: bool = False,
+    load: Callable[[str], Surface] = load_image,
+    convert_alpha: bool = True,
 ) -> Union[Dict[str, Surface], List[Surface]]:
     """Importa os assets presentes em uma pasta.
 
@@ -34,6 +36,13 @@ def import_folder(
         get_dict (bool, optional):
             define se o retorno da função será como uma lista ou como um
             dicionário. False por padrão.
+        load (Callable[[str], Surface], optional):
+            função que lê cada imagem a partir do caminho. load_image
+            por padrão.
+        convert_alpha (bool, optional):
+            define se as imagens lidas são convertidas com convert_alpha,
+            o que pode ser desligado quando load já devolve as imagens
+            convertidas. True por padrão.
 
     Returns:
         Union[Dict[str, Surface], List[Surface]]:
@@ -58,10 +67,12 @@ def import_folder(
 
     for _, __, img_files in walk(path):
         for image in sorted(img_files):
+            surface = load(f"{path}/{image}")
+
             handle_add(
                 surfaces,
                 image.replace(".png", ""),
-                load_image(f"{path}/{image}").convert_alpha()
+                surface.convert_alpha() if convert_alpha else surface
             )
 
     return surfaces
@@ -1,17 +1,24 @@
-import os
 from typing import Callable, Dict, List, Tuple, Union
 from collections import defaultdict
+from itertools import count
 
-from pygame.mixer import Sound
 from pygame.sprite import AbstractGroup
 from pygame.math import Vector2
 
-from zelda.src.settings import MONSTER_DATA, BASE_PATH
-from zelda.src.core.utils import import_folder
+from zelda.src.settings import MONSTER_DATA, BASE_PATH, FAR_ENEMY_DISTANCE
+from zelda.src.core import quality
+from zelda.src.core.assets import get_animations, get_hidden_animations
+from zelda.src.core.audio import SoundEffect
+from zelda.src.core.enemy_ai import decide_status
+from zelda.src.core.snapshot import ENEMY_STATUSES, EnemyRecord
+from zelda.src.core.state_stream import KINDS, EntityState
 from zelda.src.elements.entity import Entity
 from zelda.src.elements.player import Player
 from zelda.src.core.timer import Timer
 
+# Distância até o player, direção normalizada e status de um inimigo
+_Plan = Tuple[float, Tuple[float, float], str]
+
 
 class Enemy(Entity):
     """Sprite que representa um inimigo.
@@ -30,6 +37,10 @@ class Enemy(Entity):
     attack_radius: int
     notice_radius: int
 
+    # Distribui os frames de atualização dos inimigos distantes, para
+    # que eles não sejam atualizados todos no mesmo frame
+    __update_offsets = count()
+
     def __init__(self,
                  position: Tuple[float, float],
                  groups: Union[List[AbstractGroup], AbstractGroup],
@@ -63,6 +74,13 @@ class Enemy(Entity):
         self.__inflict_damage_on_player = inflict_damage_on_player
         self.__trigger_death_particles = trigger_death_particles
 
+        # Distância, direção e status calculados em lote pelo EnemyAI
+        # ou pelo Proximity, válidos apenas para o próximo update
+        self.__plan: Union[_Plan, None] = None
+
+        # Interação com o player, usada já no status inicial
+        self.can_attack = True
+
         # Estatísticas
         self.__dict__.update(MONSTER_DATA[monster_name])
 
@@ -75,18 +93,25 @@ class Enemy(Entity):
         self.hitbox = self.rect.copy().inflate((0, -10))
 
         # Interação com o player
-        self.can_attack = True
+        self.__frame = next(self.__update_offsets)
+        self.__kind = KINDS.index(monster_name)
 
-        # Sons
+        # Sons, compartilhados entre todos os inimigos e limitados a
+        # poucas vozes simultâneas em lutas com muitos inimigos
         self.sounds = {
-            "death": Sound(f"{BASE_PATH}/audio/death.wav"),
-            "hit": Sound(f"{BASE_PATH}/audio/hit.wav"),
-            "attack": Sound(self.attack_sound),
+            "death": SoundEffect(
+                f"{BASE_PATH}/audio/death.wav",
+                volume=0.05, max_voices=3, priority=2,
+            ),
+            "hit": SoundEffect(
+                f"{BASE_PATH}/audio/hit.wav",
+                volume=0.05, max_voices=3, priority=2,
+            ),
+            "attack": SoundEffect(
+                self.attack_sound, volume=0.05, max_voices=3, priority=1,
+            ),
         }
 
-        for sound in self.sounds.values():
-            sound.set_volume(0.05)
-
     @property
     def alive(self) -> bool:
         """Propriedade para indicar se o inimigo está vivo.
@@ -101,33 +126,29 @@ class Enemy(Entity):
         presentes no pasta graphics/monsters/{monster_name} e gera um
         dicionário de animações.
         """
-        assets_path = f"{BASE_PATH}/graphics/monsters/{self.monster_name}"
-
-        _dirs = [name for name in os.listdir(assets_path)
-                 if os.path.isdir(f"{assets_path}/{name}")]
-
-        self._animations = defaultdict(list)
+        path = f"{BASE_PATH}/graphics/monsters/{self.monster_name}"
 
-        for name in _dirs:
-            self._animations[name] = import_folder(f"{assets_path}/{name}")
+        self._animations = defaultdict(list, get_animations(path))
+        self._hidden_animations = defaultdict(
+            list, get_hidden_animations(path),
+        )
 
     def _get_status(self) -> None:
         """Atualiza o status do inimigo de acordo com a ação executada.
         """
-        distance, _ = self.__get_player_distance_direction()
-
-        if (
-            distance <= self.attack_radius
-            and self.can_attack
-        ):
-            if self.status != "attack":
-                self._frame_index = 0
-
-            self.status = "attack"
-        elif distance <= self.notice_radius:
-            self.status = "move"
+        if self.__plan is not None:
+            status = self.__plan[2]
         else:
-            self.status = "idle"
+            distance, _ = self.__get_player_distance_direction()
+            status = ENEMY_STATUSES[decide_status(
+                distance, self.can_attack,
+                self.attack_radius, self.notice_radius,
+            )]
+
+        if status == "attack" and self.status != "attack":
+            self._frame_index = 0
+
+        self.status = status
 
     def _create_cooldowns(self) -> Dict[str, Timer]:
         """Cria os cooldowns necessários para o inimigo
@@ -162,20 +183,21 @@ class Enemy(Entity):
 
         self._flicker()
 
-    def __get_direction(self,
-                        player_pos: Vector2,
-                        enemy_pos: Vector2) -> Vector2:
+    @staticmethod
+    def __get_direction(player_pos: Vector2,
+                        enemy_pos: Vector2,
+                        distance: float) -> Vector2:
         """Gera o vetor de direção normalizada entre o inimigo e o
         player.
 
         Args:
             player_pos (Vector2): posição do player
             enemy_pos (Vector2): posição do inimigo
+            distance (float): distância já calculada entre os dois
 
         Returns:
             Vector2: vetor de direção do inimigo para o player
         """
-        distance = self.__get_distance(player_pos, enemy_pos)
         direction = Vector2()
 
         if distance > 0:
@@ -203,6 +225,9 @@ class Enemy(Entity):
         Returns:
             Tuple[float, Vector2]: tupla com a distância e a direção
         """
+        if self.__plan is not None:
+            return self.__plan[0], Vector2(self.__plan[1])
+
         player_pos = self.__get_player_pos()
 
         if not player_pos or not hasattr(self, "rect"):
@@ -210,10 +235,11 @@ class Enemy(Entity):
 
         player_pos = Vector2(player_pos)
         enemy_pos = Vector2(self.rect.center)
+        distance = self.__get_distance(player_pos, enemy_pos)
 
         return (
-            self.__get_distance(player_pos, enemy_pos),
-            self.__get_direction(player_pos, enemy_pos),
+            distance,
+            self.__get_direction(player_pos, enemy_pos, distance),
         )
 
     def __reset_attack(self) -> None:
@@ -260,12 +286,103 @@ class Enemy(Entity):
 
             self.sounds["hit"].play()
 
+    def get_state(self) -> EnemyRecord:
+        """Retorna o estado dinâmico do inimigo.
+
+        Returns:
+            EnemyRecord: estado que pode ser restaurado com set_state
+        """
+        return EnemyRecord(
+            monster_name=self.monster_name,
+            position=self.hitbox.center,
+            status=self.status,
+            frame_index=self._frame_index,
+            health=self.health,
+            direction=tuple(self.direction),
+            can_attack=self.can_attack,
+            cooldowns=self._get_cooldown_states(),
+        )
+
+    def set_state(self, state: EnemyRecord) -> None:
+        """Restaura um estado retornado por get_state.
+
+        Args:
+            state (EnemyRecord): estado do inimigo
+        """
+        self.health = state.health
+        self.status = state.status
+        self._frame_index = state.frame_index
+        self.direction = Vector2(state.direction)
+        self.can_attack = state.can_attack
+        self._set_cooldown_states(state.cooldowns)
+        self._place(state.position)
+
+    def get_stream_state(self) -> EntityState:
+        """Retorna o estado visível do inimigo para o stream de estado.
+        """
+        return EntityState(
+            self.entity_id, self.__kind, *self.hitbox.center,
+            ENEMY_STATUSES.index(self.status), self.health,
+            int(self._frame_index),
+        )
+
+    def set_plan(self,
+                 distance: float,
+                 direction: Tuple[float, float],
+                 status: str) -> None:
+        """Recebe a distância, a direção e o status calculados pelo
+        EnemyAI ou pelo Proximity, usados no lugar dos calculados pelo
+        inimigo no próximo update.
+
+        Args:
+            distance (float): distância até o player
+            direction (Tuple[float, float]):
+                direção normalizada até o player
+            status (str): status decidido, um de ENEMY_STATUSES
+        """
+        self.__plan = (distance, direction, status)
+
+    def __update_interval(self) -> int:
+        """Define a cada quantos frames o inimigo deve ser atualizado.
+
+        Com a qualidade reduzida, os inimigos parados e distantes do
+        player atualizam o status e a animação com menos frequência.
+
+        Returns:
+            int: intervalo, em frames, entre as atualizações
+        """
+        interval = quality.get().far_enemy_interval
+        player_pos = self.__get_player_pos()
+
+        if interval == 1 or self.status != "idle" or not player_pos:
+            return 1
+
+        dx = player_pos[0] - self.hitbox.centerx
+        dy = player_pos[1] - self.hitbox.centery
+
+        if dx * dx + dy * dy < FAR_ENEMY_DISTANCE * FAR_ENEMY_DISTANCE:
+            return 1
+
+        return interval
+
     def update(self) -> None:
         """Atualiza o sprite dos inimigos
         """
+        interval = self.__update_interval()
+        self.__frame += 1
+
+        if self.__frame % interval:
+            self.__plan = None
+            self._update_cooldowns()
+            return
+
         self.__actions()
         self.__hit_reaction()
-        super().update()
+        self._get_status()
+        self.__plan = None
+        self._update_cooldowns()
+        self._move(self.speed)
+        self._animate(self.animation_speed * interval)
 
         self.__check_death()
 
@@ -1,14 +1,19 @@
 from abc import ABC, abstractmethod
+from itertools import count
 from typing import Callable, Dict, List, Tuple, Union, Sequence
 from math import sin
 
 from pygame import Rect, Surface
-from pygame.time import get_ticks as get_time_ticks
 from pygame.sprite import AbstractGroup, Sprite
 from pygame.math import Vector2
 
+from zelda.src.core.clock import get_ticks as get_time_ticks
+from zelda.src.core.snapshot import TimerState
 from zelda.src.core.timer import Timer
 
+# Identificadores únicos das entidades, usados no stream de estado
+_entity_ids = count()
+
 
 class Entity(ABC, Sprite):
     """Classe que representa uma entidade no jogo.
@@ -22,6 +27,7 @@ class Entity(ABC, Sprite):
     speed: int
     animation_speed: float
     _animations: Dict[str, Sequence[Surface]]
+    _hidden_animations: Dict[str, Sequence[Surface]]
 
     def __init__(self,
                  position: Tuple[float, float],
@@ -42,6 +48,7 @@ class Entity(ABC, Sprite):
         super().__init__(groups)
 
         # Setup
+        self.entity_id = next(_entity_ids)
         self._import_assets()
         self._handle_collisions = handle_collisions
 
@@ -80,6 +87,30 @@ class Entity(ABC, Sprite):
         for cooldown in self._cooldowns.values():
             cooldown.update()
 
+    def _get_cooldown_states(self) -> Tuple[TimerState, ...]:
+        """Retorna o estado de todos os cooldowns, na ordem em que foram
+        criados.
+        """
+        return tuple(timer.get_state() for timer in self._cooldowns.values())
+
+    def _set_cooldown_states(self, states: Sequence[TimerState]) -> None:
+        """Restaura o estado dos cooldowns retornado por
+        _get_cooldown_states.
+        """
+        for timer, state in zip(self._cooldowns.values(), states):
+            timer.set_state(*state)
+
+    def _place(self, position: Tuple[int, int]) -> None:
+        """Posiciona a entidade pelo centro da hitbox, com a imagem do
+        frame atual da animação.
+
+        Args:
+            position (Tuple[int, int]): centro da hitbox, em pixels
+        """
+        self.hitbox.center = position
+        self.image = self._animations[self.status][int(self._frame_index)]
+        self.rect = self.image.get_rect(center=position)
+
     def _move(self, speed: int) -> None:
         """Método para movimentar a entidade na tela.
         """
@@ -99,6 +130,30 @@ class Entity(ABC, Sprite):
         self.rect.centery = self.hitbox.centery
         self._handle_collisions(self, "vertical")
 
+    def push(self, offset_x: int, offset_y: int) -> None:
+        """Desloca a entidade sem atravessar obstáculos, usado para
+        separar entidades sobrepostas.
+
+        Args:
+            offset_x (int): deslocamento horizontal, em pixels
+            offset_y (int): deslocamento vertical, em pixels
+        """
+        # As colisões são resolvidas de acordo com o sentido da direção
+        direction = self.direction
+        self.direction = Vector2(offset_x, offset_y)
+
+        if offset_x:
+            self.hitbox.centerx += offset_x
+            self.rect.centerx = self.hitbox.centerx
+            self._handle_collisions(self, "horizontal")
+
+        if offset_y:
+            self.hitbox.centery += offset_y
+            self.rect.centery = self.hitbox.centery
+            self._handle_collisions(self, "vertical")
+
+        self.direction = direction
+
     @staticmethod
     def _weave_value() -> int:
         """Método estático para gerar a oscilação utilizada no flicker.
@@ -120,12 +175,15 @@ class Entity(ABC, Sprite):
     def _flicker(self) -> None:
         """Gera o efeito de piscar o sprite enquanto a invencibilidade
         está ativada.
+
+        Nos frames em que o sprite some, a imagem é trocada pela
+        variante invisível do frame atual, sem alterar os frames
+        compartilhados entre as entidades.
         """
-        if self._cooldowns["invincibility"].active:
-            alpha = self._weave_value()
-            self.image.set_alpha(alpha)
-        else:
-            self.image.set_alpha(255)
+        if self._cooldowns["invincibility"].active and not self._weave_value():
+            self.image = self._hidden_animations[self.status][
+                int(self._frame_index)
+            ]
 
     def update(self) -> None:
         self._get_status()
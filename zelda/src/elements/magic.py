@@ -1,12 +1,14 @@
-from random import randint
-from typing import Union, List
+from typing import Iterator, Union, List
 
 from pygame.math import Vector2
 from pygame.sprite import AbstractGroup
-from pygame.mixer import Sound
 
+from zelda.src.core import quality
+from zelda.src.core.audio import SoundEffect
+from zelda.src.core.rng import randint
+from zelda.src.core.scheduler import FrameScheduler
 from zelda.src.settings import TILESIZE, BASE_PATH
-from zelda.src.elements.player import Player
+from zelda.src.elements.player import MOVEMENTS, Player
 from zelda.src.core.particle_effect import AnimationPlayer
 
 
@@ -18,20 +20,27 @@ class MagicPlayer:
     da vida e energia do player ao utilizar magia.
     """
 
-    def __init__(self, animation_player: AnimationPlayer) -> None:
+    def __init__(self,
+                 animation_player: AnimationPlayer,
+                 scheduler: Union[FrameScheduler, None] = None) -> None:
         """Inicializa a classe MagicPlayer.
 
         Args:
             animation_player (AnimationPlayer):
                 player responsável por executar as animações das partículas
+            scheduler (Union[FrameScheduler, None], optional):
+                escalonador que distribui a criação das partículas entre
+                frames. None por padrão, o que cria todas de uma vez.
         """
         self.__animation_player = animation_player
+        self.__scheduler = scheduler
 
-        self.__heal_sound = Sound(f"{BASE_PATH}/audio/heal.wav")
-        self.__flame_sound = Sound(f"{BASE_PATH}/audio/flame.wav")
-
-        self.__heal_sound.set_volume(0.3)
-        self.__flame_sound.set_volume(0.2)
+        self.__heal_sound = SoundEffect(
+            f"{BASE_PATH}/audio/heal.wav", volume=0.3, priority=3,
+        )
+        self.__flame_sound = SoundEffect(
+            f"{BASE_PATH}/audio/flame.wav", volume=0.2, priority=3,
+        )
 
     def heal(self,
              player: Player,
@@ -86,24 +95,50 @@ class MagicPlayer:
         if player.energy >= cost:
             player.energy -= cost
 
-            status = player.status.split("_")[0]
-            axis = "y" if status in ["up", "down"] else "x"
-            direction = -1 if status in ["up", "left"] else 1
+            flames = self.__create_flames(player, groups)
 
-            for i in range(1, 6):
-                flame_offset = Vector2(
-                    randint(-TILESIZE // 3, TILESIZE // 3),
-                    randint(-TILESIZE // 3, TILESIZE // 3))
+            if self.__scheduler:
+                self.__scheduler.submit(flames)
+            else:
+                for _ in flames:
+                    pass
 
-                setattr(
-                    flame_offset,
-                    axis,
-                    getattr(flame_offset, axis) + direction * i * TILESIZE)
+            self.__flame_sound.play()
 
-                self.__animation_player.create_particles(
-                    name="flame",
-                    position=player.rect.center + flame_offset,
-                    groups=groups,
-                )
+    def __create_flames(
+        self,
+        player: Player,
+        groups: Union[List[AbstractGroup], AbstractGroup],
+    ) -> Iterator[None]:
+        """Cria as chamas à frente do player, uma por iteração.
 
-            self.__flame_sound.play()
+        A posição e a direção são as do momento em que a magia foi
+        lançada, mesmo que as chamas sejam criadas em frames seguintes.
+        """
+        movement = MOVEMENTS[player.status.direction]
+        axis = movement.axis
+        direction = movement.direction
+        center = Vector2(player.rect.center)
+
+        # Com menos chamas o espaço entre elas aumenta, mantendo o
+        # alcance da qualidade completa
+        flames = quality.get().flames
+        spacing = TILESIZE * quality.LEVELS[0].flames / flames
+
+        for i in range(1, flames + 1):
+            flame_offset = Vector2(
+                randint(-TILESIZE // 3, TILESIZE // 3),
+                randint(-TILESIZE // 3, TILESIZE // 3))
+
+            setattr(
+                flame_offset,
+                axis,
+                getattr(flame_offset, axis) + direction * i * spacing)
+
+            self.__animation_player.create_particles(
+                name="flame",
+                position=center + flame_offset,
+                groups=groups,
+            )
+
+            yield
@@ -0,0 +1,258 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pygame import BLEND_RGB_MULT, Rect, Surface
+from pygame.transform import flip as flip_surface, smoothscale
+
+from zelda.src.core.assets import get_image_tiles, get_layout
+from zelda.src.settings import (
+    FLOOR_IMAGE,
+    MINIMAP_BOUNDARY_SHADE,
+    MINIMAP_CELL,
+    MINIMAP_ENEMY_COLOR,
+    MINIMAP_GRASS_COLOR,
+    MINIMAP_HEIGHT,
+    MINIMAP_OBJECT_COLOR,
+    MINIMAP_PLAYER_COLOR,
+    MINIMAP_WIDTH,
+    TILESIZE,
+)
+
+# Célula do minimapa, pela coluna e linha do tile no mapa
+Cell = Tuple[int, int]
+
+
+class Minimap:
+    """Minimapa do nível, centralizado no player.
+
+    A imagem base, com o chão reduzido e as camadas do mapa, é montada
+    uma única vez. A cada frame, apenas as células que mudaram são
+    alteradas: a grama cortada é corrigida na imagem base, e os
+    marcadores do player e dos inimigos são apagados e desenhados na
+    janela visível. A janela inteira só é copiada da base quando o
+    player se desloca, o que custa o mesmo em qualquer tamanho de mapa.
+    """
+
+    def __init__(self,
+                 map_path: str,
+                 floor_chunks: Optional[List[List[str]]] = None,
+                 floor_image: str = FLOOR_IMAGE,
+                 deferred: bool = False) -> None:
+        """Prepara o minimapa de um mapa.
+
+        Args:
+            map_path (str): pasta com os arquivos csv do mapa
+            floor_chunks (Optional[List[List[str]]], optional):
+                matriz de espelhamento do chão. None por padrão, o que
+                usa a imagem do chão uma única vez.
+            floor_image (str, optional):
+                caminho para a imagem do chão. FLOOR_IMAGE por padrão.
+            deferred (bool, optional):
+                define se a imagem base deve ser montada aos poucos,
+                iterando sobre loading. False por padrão.
+        """
+        self.__layouts = {
+            "boundary": get_layout(f"{map_path}/map_FloorBlocks.csv"),
+            "object": get_layout(f"{map_path}/map_Objects.csv"),
+            "grass": get_layout(f"{map_path}/map_Grass.csv"),
+        }
+        rows = len(self.__layouts["boundary"])
+        columns = len(self.__layouts["boundary"][0])
+        size = (columns * MINIMAP_CELL, rows * MINIMAP_CELL)
+
+        # Chão reduzido e imagem base, com as camadas do mapa
+        self.__ground = Surface(size).convert()
+        self.base = Surface(size).convert()
+        self.__killed_grass: Set[Cell] = set()
+
+        # Janela visível, com os marcadores do último frame
+        self.surface = Surface((
+            min(MINIMAP_WIDTH, size[0]),
+            min(MINIMAP_HEIGHT, size[1]),
+        )).convert()
+        self.__origin: Optional[Tuple[int, int]] = None
+        self.__markers: Dict[Cell, str] = {}
+
+        # Incrementado sempre que a janela visível muda
+        self.version = 0
+
+        self.loading = self.__build(floor_image, floor_chunks or [["0"]])
+
+        if not deferred:
+            for _ in self.loading:
+                pass
+
+    def __build(self,
+                floor_image: str,
+                floor_chunks: List[List[str]]) -> Iterator[None]:
+        """Monta a imagem base, um bloco do chão ou uma linha do mapa por
+        iteração.
+        """
+        tiles = get_image_tiles(floor_image)
+        ground = Surface((
+            max(rect.right for _, rect in tiles) * MINIMAP_CELL // TILESIZE,
+            max(rect.bottom for _, rect in tiles) * MINIMAP_CELL // TILESIZE,
+        )).convert()
+
+        for tile, rect in tiles:
+            ground.blit(
+                smoothscale(tile, (
+                    rect.width * MINIMAP_CELL // TILESIZE,
+                    rect.height * MINIMAP_CELL // TILESIZE,
+                )),
+                (
+                    rect.x * MINIMAP_CELL // TILESIZE,
+                    rect.y * MINIMAP_CELL // TILESIZE,
+                ),
+            )
+            yield
+
+        for i, row in enumerate(floor_chunks):
+            for j, value in enumerate(row):
+                flip = int(value)
+                self.__ground.blit(
+                    flip_surface(ground, bool(flip & 1), bool(flip & 2)),
+                    (j * ground.get_width(), i * ground.get_height()),
+                )
+
+            yield
+
+        self.base.blit(self.__ground, (0, 0))
+        yield
+
+        layers = list(self.__layouts.values())
+
+        for row, cells in enumerate(zip(*layers)):
+            for column, tiles in enumerate(zip(*cells)):
+                if tiles != ("-1", "-1", "-1"):
+                    self.__paint_cell((column, row))
+
+            yield
+
+    @staticmethod
+    def __cell_rect(cell: Cell) -> Rect:
+        return Rect(
+            cell[0] * MINIMAP_CELL, cell[1] * MINIMAP_CELL,
+            MINIMAP_CELL, MINIMAP_CELL,
+        )
+
+    def __paint_cell(self, cell: Cell) -> None:
+        """Desenha uma célula da imagem base a partir do chão e das
+        camadas do mapa.
+        """
+        column, row = cell
+        rect = self.__cell_rect(cell)
+        self.base.blit(self.__ground, rect, rect)
+
+        if self.__layouts["boundary"][row][column] != "-1":
+            self.base.fill(
+                MINIMAP_BOUNDARY_SHADE, rect, special_flags=BLEND_RGB_MULT,
+            )
+
+        if self.__layouts["object"][row][column] != "-1":
+            self.base.fill(MINIMAP_OBJECT_COLOR, rect)
+        elif (
+            self.__layouts["grass"][row][column] != "-1"
+            and cell not in self.__killed_grass
+        ):
+            self.base.fill(MINIMAP_GRASS_COLOR, rect)
+
+    def set_grass(self, position: Tuple[int, int], alive: bool) -> None:
+        """Atualiza a célula de um tufo de grama cortado ou restaurado.
+
+        Args:
+            position (Tuple[int, int]): canto superior esquerdo do tile
+            alive (bool): define se a grama ainda existe
+        """
+        cell = (position[0] // TILESIZE, position[1] // TILESIZE)
+
+        if alive:
+            self.__killed_grass.discard(cell)
+        else:
+            self.__killed_grass.add(cell)
+
+        self.__paint_cell(cell)
+
+        if self.__origin is not None:
+            self.__restore_cell(cell)
+
+            if cell in self.__markers:
+                self.__draw_marker(cell, self.__markers[cell])
+
+    def __window_rect(self, cell: Cell) -> Rect:
+        """Posição de uma célula na janela visível.
+        """
+        return self.__cell_rect(cell).move(
+            -self.__origin[0], -self.__origin[1],
+        )
+
+    def __restore_cell(self, cell: Cell) -> None:
+        """Copia uma célula da imagem base para a janela visível.
+        """
+        rect = self.__window_rect(cell)
+
+        if self.surface.get_rect().colliderect(rect):
+            self.surface.blit(self.base, rect, self.__cell_rect(cell))
+            self.version += 1
+
+    def __draw_marker(self, cell: Cell, color: str) -> None:
+        self.surface.fill(color, self.__window_rect(cell))
+        self.version += 1
+
+    def update(self,
+               player_pos: Tuple[int, int],
+               enemy_positions: Iterable[Tuple[int, int]]) -> None:
+        """Move a janela visível para o player e atualiza os marcadores
+        que mudaram desde o último frame.
+
+        Args:
+            player_pos (Tuple[int, int]): posição do player, em pixels
+            enemy_positions (Iterable[Tuple[int, int]]):
+                posições dos inimigos, em pixels
+        """
+        width, height = self.surface.get_size()
+        origin = (
+            min(
+                max(player_pos[0] * MINIMAP_CELL // TILESIZE - width // 2, 0),
+                self.base.get_width() - width,
+            ),
+            min(
+                max(player_pos[1] * MINIMAP_CELL // TILESIZE - height // 2, 0),
+                self.base.get_height() - height,
+            ),
+        )
+        view = Rect(origin, (width, height))
+
+        markers = {}
+
+        for x, y in enemy_positions:
+            cell = (x // TILESIZE, y // TILESIZE)
+
+            if view.colliderect(self.__cell_rect(cell)):
+                markers[cell] = MINIMAP_ENEMY_COLOR
+
+        markers[
+            player_pos[0] // TILESIZE, player_pos[1] // TILESIZE
+        ] = MINIMAP_PLAYER_COLOR
+
+        if origin != self.__origin:
+            self.__origin = origin
+            self.surface.blit(self.base, (0, 0), view)
+            self.version += 1
+
+            for cell, color in markers.items():
+                self.__draw_marker(cell, color)
+        else:
+            for cell in self.__markers.keys() - markers.keys():
+                self.__restore_cell(cell)
+
+            for cell, color in markers.items():
+                if self.__markers.get(cell) != color:
+                    self.__draw_marker(cell, color)
+
+        self.__markers = markers
+
+    def surfaces(self) -> List[Surface]:
+        """Retorna as superfícies mantidas pelo minimapa, usado na
+        medição de memória.
+        """
+        return [self.base, self.__ground, self.surface]
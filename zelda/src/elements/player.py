@@ -1,13 +1,11 @@
-import os
 from dataclasses import dataclass
-from collections import defaultdict
-from typing import Callable, Dict, List, Tuple, Union, Any
+from enum import IntEnum
+from typing import Callable, Dict, List, Sequence, Tuple, Union, Any
 
 from pygame.math import Vector2
-from pygame.mixer import Sound
 from pygame.sprite import AbstractGroup
-from pygame.key import get_pressed as get_pressed_keys
 from pygame import (
+    Surface,
     K_UP,
     K_DOWN,
     K_LEFT,
@@ -18,7 +16,11 @@ from pygame import (
     K_e
 )
 
-from zelda.src.core.utils import import_folder
+from zelda.src.core.assets import get_animations, get_hidden_animations
+from zelda.src.core.audio import SoundEffect
+from zelda.src.core.input import InputSource
+from zelda.src.core.snapshot import PlayerRecord
+from zelda.src.core.state_stream import EntityState
 from zelda.src.elements.entity import Entity
 from zelda.src.core.timer import Timer
 from zelda.src.settings import (
@@ -30,6 +32,88 @@ from zelda.src.settings import (
 )
 
 
+class Direction(IntEnum):
+    """Direção para a qual o player está virado.
+    """
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+    @property
+    def label(self) -> str:
+        """Nome da direção usado nas pastas de imagens, como 'up'.
+        """
+        return _DIRECTION_LABELS[self]
+
+
+class Action(IntEnum):
+    """Ação executada pelo player.
+    """
+    MOVE = 0
+    IDLE = 1
+    ATTACK = 2
+
+
+class PlayerState(IntEnum):
+    """Estado do player, combinando a direção e a ação.
+
+    O valor de cada estado é direção * 3 + ação, o que permite usá-lo
+    como índice das tabelas de animação e trocar a ação sem montar
+    strings.
+    """
+    UP = 0
+    UP_IDLE = 1
+    UP_ATTACK = 2
+    DOWN = 3
+    DOWN_IDLE = 4
+    DOWN_ATTACK = 5
+    LEFT = 6
+    LEFT_IDLE = 7
+    LEFT_ATTACK = 8
+    RIGHT = 9
+    RIGHT_IDLE = 10
+    RIGHT_ATTACK = 11
+
+    @property
+    def direction(self) -> Direction:
+        """Direção do estado.
+        """
+        return _STATE_DIRECTIONS[self]
+
+    @property
+    def action(self) -> Action:
+        """Ação do estado.
+        """
+        return _STATE_ACTIONS[self]
+
+    @property
+    def animation(self) -> str:
+        """Nome da pasta com as imagens do estado, como 'up_idle'.
+        """
+        return _STATE_ANIMATIONS[self]
+
+    def with_action(self, action: Action) -> "PlayerState":
+        """Retorna o estado com a mesma direção e outra ação.
+
+        Args:
+            action (Action): nova ação
+
+        Returns:
+            PlayerState: estado correspondente
+        """
+        return _STATES[self - self % len(Action) + action]
+
+
+_DIRECTION_LABELS = tuple(direction.name.lower() for direction in Direction)
+_STATES = tuple(PlayerState)
+_STATE_DIRECTIONS = tuple(
+    Direction(state // len(Action)) for state in PlayerState
+)
+_STATE_ACTIONS = tuple(Action(state % len(Action)) for state in PlayerState)
+_STATE_ANIMATIONS = tuple(state.name.lower() for state in PlayerState)
+
+
 @dataclass
 class Movement:
     """Classe para representar um movimento possível do player.
@@ -38,12 +122,21 @@ class Movement:
         key (int): código da tecla mapeada no movimento
         axis (str): eixo do movimento do player, 'x' ou 'y'
         direction (int): direção do movimento no eixo
-        status (str): nome do movimento, 'up', 'down', 'left' ou 'right'
+        status (PlayerState): estado do player durante o movimento
     """
     key: int
     axis: str
     direction: int
-    status: str
+    status: PlayerState
+
+
+# Movimentos possíveis do player, indexados pela direção
+MOVEMENTS: Tuple[Movement, ...] = (
+    Movement(key=K_UP, axis="y", direction=-1, status=PlayerState.UP),
+    Movement(key=K_DOWN, axis="y", direction=1, status=PlayerState.DOWN),
+    Movement(key=K_LEFT, axis="x", direction=-1, status=PlayerState.LEFT),
+    Movement(key=K_RIGHT, axis="x", direction=1, status=PlayerState.RIGHT),
+)
 
 
 class Player(Entity):
@@ -51,14 +144,14 @@ class Player(Entity):
 
     Essa classe lida com as animações e captura de entradas feitas pelo
     usuário para o player.
+
+    O status do player é um PlayerState, e as animações ficam em tabelas
+    indexadas por ele, montadas a partir das pastas de cada estado.
     """
 
-    __ALLOWED_MOVEMENTS: List[Movement] = [
-        Movement(key=K_UP, axis="y", direction=-1, status="up"),
-        Movement(key=K_DOWN, axis="y", direction=1, status="down"),
-        Movement(key=K_LEFT, axis="x", direction=-1, status="left"),
-        Movement(key=K_RIGHT, axis="x", direction=1, status="right"),
-    ]
+    status: PlayerState
+    _animations: Sequence[Sequence[Surface]]
+    _hidden_animations: Sequence[Sequence[Surface]]
 
     def __init__(self,
                  position: Tuple[float, float],
@@ -66,7 +159,8 @@ class Player(Entity):
                  handle_collisions: Callable[["Entity", str], None],
                  create_attack: Callable,
                  destroy_attack: Callable,
-                 create_magic: Callable) -> None:
+                 create_magic: Callable,
+                 input_source: InputSource) -> None:
         """Faz o setup básico do player
 
         Args:
@@ -84,9 +178,12 @@ class Player(Entity):
                 função para destruir o ataque previamente criado
             create_magic (Callable):
                 O mesmo que create_attack só que para magias
+            input_source (InputSource):
+                fonte das entradas que controlam o player
         """
         self.__create_attack = create_attack
         self.__destroy_attack = destroy_attack
+        self.__input_source = input_source
 
         super().__init__(position, groups, handle_collisions)
 
@@ -120,8 +217,9 @@ class Player(Entity):
         self.exp = 100
 
         # Sons
-        self.__weapon_attack_sound = Sound(f"{BASE_PATH}/audio/sword.wav")
-        self.__weapon_attack_sound.set_volume(0.1)
+        self.__weapon_attack_sound = SoundEffect(
+            f"{BASE_PATH}/audio/sword.wav", volume=0.1, priority=3,
+        )
 
     @property
     def health(self) -> float:
@@ -152,28 +250,30 @@ class Player(Entity):
         """importa todos os assets do player presentes na pasta
         graphics/player e gera um dicionário de animações.
         """
-        assets_path = f"{BASE_PATH}/graphics/player"
-
-        _dirs = [name for name in os.listdir(assets_path)
-                 if os.path.isdir(f"{assets_path}/{name}")]
-
-        self._animations = defaultdict(list)
-
-        for name in _dirs:
-            self._animations[name] = import_folder(f"{assets_path}/{name}")
+        path = f"{BASE_PATH}/graphics/player"
+        animations = get_animations(path)
+        hidden_animations = get_hidden_animations(path)
+
+        self._animations = tuple(
+            animations.get(state.animation, []) for state in PlayerState
+        )
+        self._hidden_animations = tuple(
+            hidden_animations.get(state.animation, [])
+            for state in PlayerState
+        )
 
     def __handle_inputs(self) -> None:
         """Captura as entradas do usuário para o player
         """
         self.direction = Vector2()
-        pressed_keys = get_pressed_keys()
+        pressed_keys = self.__input_source.get_pressed()
 
         if (
             not self._cooldowns["attack"].active
             and not self._cooldowns["magic"].active
         ):
             # Seta a direção e o status de acordo com a tecla pressionada
-            for movement in self.__ALLOWED_MOVEMENTS:
+            for movement in MOVEMENTS:
                 if pressed_keys[movement.key]:
                     setattr(self.direction, movement.axis, movement.direction)
                     self.status = movement.status
@@ -225,18 +325,15 @@ class Player(Entity):
         """Atualiza o status do player de acordo com a ação executada.
         """
         if not hasattr(self, "status"):
-            self.status = "down_idle"
-
-        if self.direction.magnitude() == 0:
-            self.status = self.status.split("_")[0]
-            self.status = f"{self.status}_idle"
+            self.status = PlayerState.DOWN_IDLE
 
         if (
             self._cooldowns["attack"].active
             or self._cooldowns["magic"].active
         ):
-            self.status = self.status.split("_")[0]
-            self.status = f"{self.status}_attack"
+            self.status = self.status.with_action(Action.ATTACK)
+        elif not self.direction:
+            self.status = self.status.with_action(Action.IDLE)
 
     def _create_cooldowns(self) -> Dict[str, Timer]:
         """Cria os cooldowns necessários para o player
@@ -305,6 +402,56 @@ class Player(Entity):
 
         return changed
 
+    def get_state(self) -> PlayerRecord:
+        """Retorna o estado dinâmico do player.
+
+        Returns:
+            PlayerRecord: estado que pode ser restaurado com set_state
+        """
+        return PlayerRecord(
+            position=self.hitbox.center,
+            status=self.status,
+            frame_index=self._frame_index,
+            health=self.__health,
+            energy=self.energy,
+            exp=self.exp,
+            weapon_index=self.weapon_index,
+            magic_index=self.magic_index,
+            stats=tuple(self.__stats[name] for name in PLAYER_MAX_STATS),
+            cooldowns=self._get_cooldown_states(),
+        )
+
+    def set_state(self, state: PlayerRecord) -> None:
+        """Restaura um estado retornado por get_state.
+
+        Args:
+            state (PlayerRecord): estado do player
+        """
+        self.__stats.update(zip(PLAYER_MAX_STATS, state.stats))
+        self.__health = state.health
+        self.energy = state.energy
+        self.exp = state.exp
+        self.speed = self.__stats["speed"]
+
+        self.weapon_index = state.weapon_index
+        self.weapon = list(WEAPON_DATA.keys())[self.weapon_index]
+        self.magic_index = state.magic_index
+        self.magic = list(MAGIC_DATA.keys())[self.magic_index]
+
+        self.status = PlayerState(state.status)
+        self._frame_index = state.frame_index
+        self.direction = Vector2()
+        self._set_cooldown_states(state.cooldowns)
+        self._place(state.position)
+
+    def get_stream_state(self) -> EntityState:
+        """Retorna o estado visível do player para o stream de estado.
+        """
+        return EntityState(
+            self.entity_id, 0, *self.hitbox.center, self.status,
+            self.__health, int(self._frame_index),
+        )
+
     def receive_damage(self, damage: float) -> None:
         """Computa o dano total infligido oo player.
 
@@ -30,7 +30,6 @@ class Tile(Sprite):
 
         # Gráfico
         self.image = surface
-        self.image = self.image.convert_alpha()
         self.rect = self.image.get_rect(topleft=position)
 
         # Corrige o posicionamento do sprite para imagens maiores do que
@@ -1,11 +1,11 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from pygame.image import load as load_image
 from pygame.draw import rect as draw_rect
 from pygame.display import get_surface
-from pygame import Rect, Surface
-from pygame.font import Font
+from pygame import RLEACCEL, Rect, Surface
 
+from zelda.src.core.assets import get_font, get_image
+from zelda.src.elements.minimap import Minimap
 from zelda.src.elements.player import Player
 from zelda.src.settings import (
     BASE_PATH,
@@ -31,25 +31,51 @@ class UI:
 
     Essa classe é responsável por desenhar as barras de vida e energia,
     além da experiência do player e por fim as caixas de seleção da
-    arma e da magia.
+    arma e da magia, e o minimapa, quando existir.
+
+    Os elementos são desenhados em uma superfície em cache, e cada um
+    só é redesenhado quando o valor que ele exibe muda. No caso comum a
+    UI custa apenas uma cópia dessa superfície para a tela por frame.
     """
 
-    def __init__(self) -> None:
+    # Cor que representa as áreas transparentes da superfície em cache
+    __COLORKEY: Tuple[int, int, int] = (255, 0, 255)
+
+    def __init__(self,
+                 weapon_graphics: Dict[str, Dict[str, Surface]],
+                 minimap: Optional[Minimap] = None) -> None:
         """Faz o setup da UI do jogo.
+
+        Args:
+            weapon_graphics (Dict[str, Dict[str, Surface]]):
+                imagens de todas as armas, das quais são usados os
+                ícones full
+            minimap (Optional[Minimap], optional):
+                minimapa exibido no canto superior direito. None por
+                padrão.
         """
         # Setup geral
         self.screen = get_surface()
-        self.font = Font(UI_FONT, UI_FONT_SIZE)
+        self.font = get_font(UI_FONT, UI_FONT_SIZE)
+        self.minimap = minimap
+
+        # Cache da UI, com o último estado e a área ocupada por cada
+        # elemento, na ordem em que eles são desenhados. Criado direto no
+        # formato da tela, sem a cópia feita por convert
+        self.surface = Surface(self.screen.get_size(), 0, self.screen)
+        self.surface.fill(self.__COLORKEY)
+        self.surface.set_colorkey(self.__COLORKEY, RLEACCEL)
+        self.__states: Dict[str, Any] = {}
+        self.__rects: Dict[str, Rect] = {}
 
         # Setup das barras
         self.health_bar_rect = Rect(10, 10, UI_HEALTH_BAR_WIDTH, UI_BAR_HEIGHT)
         self.energy_bar_rect = Rect(10, 34, UI_ENERGY_BAR_WIDTH, UI_BAR_HEIGHT)
 
         # Setup das armas
-        self.__weapon_graphics = self.__load_graphics(
-            prefix="graphics/weapons",
-            data=WEAPON_DATA,
-        )
+        self.__weapon_graphics = [
+            weapon_graphics[weapon]["full"] for weapon in WEAPON_DATA
+        ]
 
         self.__magic_graphics = self.__load_graphics(
             prefix="graphics/particles",
@@ -69,37 +95,50 @@ class UI:
             List[Surface]: lista de superfícies a partir das imagens
         """
         return [
-            load_image(f"{BASE_PATH}/{prefix}/{item['graphic']}")
+            get_image(f"{BASE_PATH}/{prefix}/{item['graphic']}")
             for item in data.values()
         ]
 
+    @staticmethod
+    def __bar_width(current: float, max_amount: float, bg_rect: Rect) -> int:
+        """Calcula a largura, em pixels, da parte preenchida da barra.
+        """
+        return round(bg_rect.width * current / max_amount)
+
     def show_bar(self,
                  current: float,
                  max_amount: float,
                  bg_rect: Rect,
-                 color: str) -> None:
-        """Desenha na tela as barras de stats do player.
+                 color: str) -> Rect:
+        """Desenha as barras de stats do player.
 
         Args:
             current (float): valor atual da barra
             max_amount (float): valor máximo da barra
             bg_rect (Rect): coordenadas onde a barra será desenhada
             color (str): cor da barra
+
+        Returns:
+            Rect: coordenadas onde a barra foi desenhada
         """
-        draw_rect(self.screen, UI_BG_COLOR, bg_rect, border_radius=5)
+        draw_rect(self.surface, UI_BG_COLOR, bg_rect, border_radius=5)
 
-        health_percentage = current / max_amount
         current_rect = bg_rect.copy()
-        current_rect.width = round(bg_rect.width * health_percentage)
+        current_rect.width = self.__bar_width(current, max_amount, bg_rect)
 
-        draw_rect(self.screen, color, current_rect, border_radius=5)
-        draw_rect(self.screen, UI_BORDER_COLOR, bg_rect, 4, 5)
+        draw_rect(self.surface, color, current_rect, border_radius=5)
+        draw_rect(self.surface, UI_BORDER_COLOR, bg_rect, 4, 5)
+
+        return bg_rect
 
-    def show_exp(self, exp: float) -> None:
-        """Desenha na tela a informação de experiência do player
+    def show_exp(self, exp: float) -> Rect:
+        """Desenha a informação de experiência do player
 
         Args:
             exp (float): experiência atual do player
+
+        Returns:
+            Rect: coordenadas onde a caixa de experiência foi desenhada
         """
         padding = 20
 
@@ -108,22 +147,25 @@ class UI:
         x = self.screen.get_width() - padding
         y = self.screen.get_height() - padding
         text_rect = text_surf.get_rect(bottomright=(x, y))
+        bg_rect = text_rect.inflate(20, 20)
 
         draw_rect(
-            self.screen,
+            self.surface,
             UI_BG_COLOR,
-            text_rect.inflate(20, 20),
+            bg_rect,
             border_radius=5,
         )
-        self.screen.blit(text_surf, text_rect)
+        self.surface.blit(text_surf, text_rect)
         draw_rect(
-            self.screen,
+            self.surface,
             UI_BORDER_COLOR,
-            text_rect.inflate(20, 20),
+            bg_rect,
             border_radius=5,
             width=4,
         )
 
+        return bg_rect
+
     def show_selection_box(self,
                            left: int,
                            top: int,
@@ -142,9 +184,9 @@ class UI:
         """
         bg_rect = Rect(left, top, UI_ITEM_BOX_SIZE, UI_ITEM_BOX_SIZE)
 
-        draw_rect(self.screen, UI_BG_COLOR, bg_rect, border_radius=5)
+        draw_rect(self.surface, UI_BG_COLOR, bg_rect, border_radius=5)
         draw_rect(
-            surface=self.screen,
+            surface=self.surface,
             color=UI_BORDER_COLOR_ACTIVE if highlight else UI_BORDER_COLOR,
             rect=bg_rect,
             width=4,
@@ -158,8 +200,8 @@ class UI:
                      top: int,
                      index: int,
                      highlight_box: bool,
-                     graphics: List[Surface]) -> None:
-        """Mostra na tela uma caixa de seleção.
+                     graphics: List[Surface]) -> Rect:
+        """Mostra uma caixa de seleção.
 
         Args:
             left (int): posição x do overlay
@@ -169,6 +211,9 @@ class UI:
             graphics (List[Surface]):
                 lista de superfícies gráficas que devem ser consideradas
                 no overlay
+
+        Returns:
+            Rect: coordenadas onde a caixa foi desenhada
         """
         bg_rect = self.show_selection_box(
             left=left,
@@ -179,42 +224,164 @@ class UI:
         _surf = graphics[index]
         _rect = _surf.get_rect(center=bg_rect.center)
 
-        self.screen.blit(_surf, _rect)
+        self.surface.blit(_surf, _rect)
 
-    def display(self, player: Player) -> None:
-        """Constrói toda a UI do game utilizando as informações do
-        player.
+        return bg_rect
+
+    def show_minimap(self) -> Rect:
+        """Desenha a janela visível do minimapa, com uma borda.
+
+        Returns:
+            Rect: coordenadas onde o minimapa foi desenhado
+        """
+        padding = 14
+        map_rect = self.minimap.surface.get_rect(
+            topright=(self.screen.get_width() - padding, padding),
+        )
+        bg_rect = map_rect.inflate(8, 8)
+
+        self.surface.blit(self.minimap.surface, map_rect)
+        draw_rect(self.surface, UI_BORDER_COLOR, bg_rect, 4, 5)
+
+        return bg_rect
+
+    def __widgets(
+        self,
+        player: Player,
+    ) -> Dict[str, Tuple[Any, Callable[[], Rect]]]:
+        """Monta os elementos da UI, na ordem em que são desenhados.
+
+        Returns:
+            Dict[str, Tuple[Any, Callable[[], Rect]]]:
+                dicionário com o nome de cada elemento, o valor exibido
+                por ele e a função que o desenha
+        """
+        health = player.health, player.get_stats("health")
+        energy = player.energy, player.get_stats("energy")
+
+        widgets = {
+            "health": (
+                self.__bar_width(*health, self.health_bar_rect),
+                lambda: self.show_bar(
+                    *health, self.health_bar_rect, UI_HEALTH_COLOR,
+                ),
+            ),
+            "energy": (
+                self.__bar_width(*energy, self.energy_bar_rect),
+                lambda: self.show_bar(
+                    *energy, self.energy_bar_rect, UI_ENERGY_COLOR,
+                ),
+            ),
+            "exp": (
+                int(player.exp),
+                lambda: self.show_exp(player.exp),
+            ),
+            "weapon": (
+                (player.weapon_index, player.switching_weapon),
+                lambda: self.show_overlay(
+                    left=10,
+                    top=self.screen.get_height() - UI_ITEM_BOX_SIZE - 10,
+                    index=player.weapon_index,
+                    highlight_box=player.switching_weapon,
+                    graphics=self.__weapon_graphics,
+                ),
+            ),
+            "magic": (
+                (player.magic_index, player.switching_magic),
+                lambda: self.show_overlay(
+                    left=80,
+                    top=self.screen.get_height() - UI_ITEM_BOX_SIZE - 5,
+                    index=player.magic_index,
+                    highlight_box=player.switching_magic,
+                    graphics=self.__magic_graphics,
+                ),
+            ),
+        }
+
+        # O minimapa só é copiado para o cache quando a janela muda
+        if self.minimap is not None:
+            widgets["minimap"] = (self.minimap.version, self.show_minimap)
+
+        return widgets
+
+    def refresh(self, player: Player) -> List[Rect]:
+        """Redesenha no cache apenas os elementos cujo valor mudou.
+
+        A área antiga de cada elemento alterado é limpa antes, e os
+        elementos que se sobrepõem a ela também são redesenhados, na
+        ordem original, para manter a sobreposição correta.
 
         Args:
             player (Player): instância do player
+
+        Returns:
+            List[Rect]: áreas da tela alteradas pelo redesenho
         """
-        self.show_bar(
-            current=player.health,
-            max_amount=player.get_stats("health"),
-            bg_rect=self.health_bar_rect,
-            color=UI_HEALTH_COLOR,
-        )
+        widgets = self.__widgets(player)
+        changed = [
+            name for name, (state, _) in widgets.items()
+            if self.__states.get(name, self) != state
+        ]
 
-        self.show_bar(
-            current=player.energy,
-            max_amount=player.get_stats("energy"),
-            bg_rect=self.energy_bar_rect,
-            color=UI_ENERGY_COLOR,
-        )
+        if not changed:
+            return []
 
-        self.show_exp(player.exp)
+        cleared = [self.__rects[name] for name in changed
+                   if name in self.__rects]
 
-        self.show_overlay(
-            left=10,
-            top=self.screen.get_height() - UI_ITEM_BOX_SIZE - 10,
-            index=player.weapon_index,
-            highlight_box=player.switching_weapon,
-            graphics=self.__weapon_graphics,
-        )
-        self.show_overlay(
-            left=80,
-            top=self.screen.get_height() - UI_ITEM_BOX_SIZE - 5,
-            index=player.magic_index,
-            highlight_box=player.switching_magic,
-            graphics=self.__magic_graphics,
-        )
+        for rect in cleared:
+            self.surface.fill(self.__COLORKEY, rect)
+
+        dirty = list(cleared)
+
+        for name, (state, draw) in widgets.items():
+            rect = self.__rects.get(name)
+
+            if name in changed or rect and rect.collidelist(dirty) != -1:
+                self.__states[name] = state
+                self.__rects[name] = draw()
+                dirty.append(self.__rects[name])
+
+        return dirty
+
+    def copy_widgets(self) -> List[Tuple[Surface, Tuple[int, int]]]:
+        """Copia as áreas da superfície em cache ocupadas pelos
+        elementos, para que elas sejam desenhadas em outra thread
+        enquanto a superfície continua sendo alterada.
+
+        Returns:
+            List[Tuple[Surface, Tuple[int, int]]]:
+                cópia de cada elemento e a posição dela na tela
+        """
+        widgets = []
+
+        for rect in self.__rects.values():
+            widget = self.surface.subsurface(rect).copy()
+            widget.set_colorkey(self.__COLORKEY, RLEACCEL)
+            widgets.append((widget, rect.topleft))
+
+        return widgets
+
+    def surfaces(self) -> List[Surface]:
+        """Retorna as superfícies mantidas pela UI, usado na medição de
+        memória.
+        """
+        if self.minimap is None:
+            return [self.surface]
+
+        return [self.surface, *self.minimap.surfaces()]
+
+    def display(self, player: Player) -> List[Rect]:
+        """Constrói toda a UI do game utilizando as informações do
+        player.
+
+        Args:
+            player (Player): instância do player
+
+        Returns:
+            List[Rect]: áreas da UI que mudaram desde o último frame
+        """
+        dirty = self.refresh(player)
+        self.screen.blit(self.surface, (0, 0))
+
+        return dirty
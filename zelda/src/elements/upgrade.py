@@ -1,11 +1,14 @@
+from typing import Dict, List, Tuple, Union
+
 from pygame import K_RIGHT, K_LEFT, K_SPACE, Rect, Surface
 from pygame.display import get_surface as get_display_surface
 from pygame.draw import rect as draw_rect
 from pygame.draw import line as draw_line
 from pygame.font import Font
-from pygame.key import get_pressed as get_pressed_keys
 from pygame.math import Vector2
 
+from zelda.src.core.assets import get_font
+from zelda.src.core.input import InputSource
 from zelda.src.core.timer import Timer
 from zelda.src.elements.player import Player
 from zelda.src.settings import (
@@ -25,13 +28,14 @@ from zelda.src.settings import (
 
 class UpgradeMenu:
 
-    def __init__(self, player: Player) -> None:
+    def __init__(self, player: Player, input_source: InputSource) -> None:
         self.screen = get_display_surface()
         self.player = player
+        self.input_source = input_source
 
         self.select_index = 0
         self.options = list(PLAYER_MAX_STATS.keys())
-        self.font = Font(UI_FONT, UI_FONT_SIZE)
+        self.font = get_font(UI_FONT, UI_FONT_SIZE)
         self.selection_cooldown = Timer(300)
 
         self.box_height = self.screen.get_height() * 0.8
@@ -41,7 +45,7 @@ class UpgradeMenu:
 
     def __input(self) -> None:
         if not self.selection_cooldown.active:
-            keys = get_pressed_keys()
+            keys = self.input_source.get_pressed()
 
             if keys[K_RIGHT] and self.select_index < len(self.options) - 1:
                 self.selection_cooldown.activate()
@@ -82,17 +86,46 @@ class UpgradeMenu:
                 font=self.font,
             ))
 
-    def display(self) -> None:
+    def invalidate(self, areas: Union[List[Rect], None] = None) -> None:
+        """Força o redesenho dos itens no próximo frame.
+
+        Args:
+            areas (Union[List[Rect], None], optional):
+                áreas da tela que foram sobrescritas, apenas os itens
+                que as tocam são redesenhados. None por padrão, o que
+                redesenha todos os itens.
+        """
+        for item in self.item_list:
+            if areas is None or item.rect.collidelist(areas) != -1:
+                item.invalidate()
+
+    def surfaces(self) -> List[Surface]:
+        """Retorna as superfícies renderizadas pelos itens, usado na
+        medição de memória.
+        """
+        return [
+            surface for item in self.item_list for surface in item.surfaces()
+        ]
+
+    def display(self) -> List[Rect]:
+        """Processa as entradas do menu e desenha os itens que mudaram
+        desde o último frame.
+
+        Returns:
+            List[Rect]: áreas da tela redesenhadas
+        """
         self.__input()
         self.selection_cooldown.update()
 
+        dirty = []
+
         for index, item in enumerate(self.item_list):
             name = self.options[index]
             value = self.player.get_stats(name)
             max_value = PLAYER_MAX_STATS[name]
             cost = UPGRADE_COST[name]
 
-            item.display(
+            rect = item.display(
                 screen=self.screen,
                 selection_num=self.select_index,
                 name=name,
@@ -101,8 +134,19 @@ class UpgradeMenu:
                 cost=cost,
             )
 
+            if rect:
+                dirty.append(rect)
+
+        return dirty
+
 
 class Item:
+    """Item do menu de upgrade.
+
+    Cada estado do item, formado pelo valor, custo e seleção, é
+    renderizado uma única vez em uma superfície própria, e o item só é
+    copiado para a tela quando o estado muda.
+    """
 
     def __init__(self,
                  left: int,
@@ -115,23 +159,37 @@ class Item:
         self.index = index
         self.font = font
 
+        self.__renders: Dict[Tuple[int, int, bool], Surface] = {}
+        self.__state: Union[Tuple[int, int, bool], None] = None
+
+    def invalidate(self) -> None:
+        """Força o redesenho do item na próxima chamada de display.
+        """
+        self.__state = None
+
+    def surfaces(self) -> List[Surface]:
+        """Retorna as renderizações do item guardadas em cache.
+        """
+        return list(self.__renders.values())
+
     def display_names(self,
                       screen: Surface,
                       name: str,
                       cost: int,
                       selected: bool) -> None:
         color = TEXT_COLOR if not selected else TEXT_COLOR_SELECTED
+        rect = screen.get_rect()
 
         offset = Vector2(0, 20)
 
         title_surf = self.font.render(name, False, color)
         title_rect = title_surf.get_rect(
-            midtop=Vector2(self.rect.midtop) + offset,
+            midtop=Vector2(rect.midtop) + offset,
         )
 
         cost_surf = self.font.render(str(cost), False, color)
         cost_rect = cost_surf.get_rect(
-            midbottom=Vector2(self.rect.midbottom) - offset,
+            midbottom=Vector2(rect.midbottom) - offset,
         )
 
         screen.blit(title_surf, title_rect)
@@ -143,9 +201,10 @@ class Item:
                     max_value: int,
                     selected: bool) -> None:
         offset = Vector2(0, 60)
+        rect = screen.get_rect()
 
-        top = Vector2(self.rect.midtop) + offset
-        bottom = Vector2(self.rect.midbottom) - offset
+        top = Vector2(rect.midtop) + offset
+        bottom = Vector2(rect.midbottom) - offset
         color = BAR_COLOR if not selected else BAR_COLOR_SELECTED
 
         full_height = bottom.y - top.y
@@ -157,26 +216,59 @@ class Item:
         draw_line(screen, color, top, bottom, 5)
         draw_rect(screen, color, slider_rect)
 
-    def display(self,
-                screen: Surface,
-                selection_num: int,
-                name: str,
-                value: int,
-                max_value: int,
-                cost: int) -> None:
-        selected = self.index == selection_num
+    def render(self,
+               name: str,
+               value: int,
+               max_value: int,
+               cost: int,
+               selected: bool) -> Surface:
+        """Renderiza o item em uma superfície do tamanho do item.
+        """
+        surface = Surface(self.rect.size).convert()
 
         draw_rect(
-            surface=screen,
+            surface=surface,
             color=UI_BG_COLOR if not selected else UPGRADE_BG_COLOR_SELECTED,
-            rect=self.rect,
+            rect=surface.get_rect(),
         )
         draw_rect(
-            surface=screen,
+            surface=surface,
             color=UI_BORDER_COLOR,
-            rect=self.rect,
+            rect=surface.get_rect(),
             width=4,
         )
 
-        self.display_names(screen, name, cost, selected)
-        self.display_bar(screen, value, max_value, selected)
+        self.display_names(surface, name, cost, selected)
+        self.display_bar(surface, value, max_value, selected)
+
+        return surface
+
+    def display(self,
+                screen: Surface,
+                selection_num: int,
+                name: str,
+                value: int,
+                max_value: int,
+                cost: int) -> Union[Rect, None]:
+        """Copia o item para a tela caso o estado dele tenha mudado.
+
+        Returns:
+            Union[Rect, None]:
+                área redesenhada, ou None caso o item não tenha mudado
+        """
+        state = (value, cost, self.index == selection_num)
+
+        if state == self.__state:
+            return None
+
+        if state not in self.__renders:
+            self.__renders[state] = self.render(
+                name=name,
+                value=value,
+                max_value=max_value,
+                cost=cost,
+                selected=state[2],
+            )
+
+        self.__state = state
+        return screen.blit(self.__renders[state], self.rect)
@@ -1,11 +1,38 @@
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterator, List, Tuple, Union
 
+from pygame import Surface
 from pygame.sprite import AbstractGroup, Sprite
-from pygame.image import load as load_image
 from pygame.math import Vector2
 
-from zelda.src.elements.player import Player
-from zelda.src.settings import BASE_PATH
+from zelda.src.core.assets import build_named_folder, get_named_folder
+from zelda.src.elements.player import Direction, Player
+from zelda.src.settings import BASE_PATH, WEAPON_DATA
+
+
+def build_weapon_graphics() -> Iterator[None]:
+    """Carrega as imagens de todas as armas, parando após cada imagem,
+    para que load_weapon_graphics não precise ler nada do disco.
+    """
+    for weapon in WEAPON_DATA:
+        yield from build_named_folder(f"{BASE_PATH}/graphics/weapons/{weapon}")
+
+
+def load_weapon_graphics() -> Dict[str, Dict[str, Surface]]:
+    """Carrega as imagens de todas as armas, uma por direção além do
+    ícone full usado na UI.
+
+    As imagens são carregadas uma única vez por processo, de forma que
+    criar uma arma durante o jogo não lê nada do disco.
+
+    Returns:
+        Dict[str, Dict[str, Surface]]:
+            dicionário com o nome da arma e as imagens dela, indexadas
+            por 'up', 'down', 'left', 'right' e 'full'
+    """
+    return {
+        weapon: get_named_folder(f"{BASE_PATH}/graphics/weapons/{weapon}")
+        for weapon in WEAPON_DATA
+    }
 
 
 class Weapon(Sprite):
@@ -18,7 +45,8 @@ class Weapon(Sprite):
 
     def __init__(self,
                  player: Player,
-                 groups: Union[AbstractGroup, List[AbstractGroup]]):
+                 groups: Union[AbstractGroup, List[AbstractGroup]],
+                 graphics: Dict[str, Dict[str, Surface]]):
         """Inicializa o sprite da arma selecionada pelo player.
 
         Args:
@@ -26,28 +54,30 @@ class Weapon(Sprite):
                 instância do player.
             groups (Union[AbstractGroup, List[AbstractGroup]]):
                 grupos que o sprite deve estar.
+            graphics (Dict[str, Dict[str, Surface]]):
+                imagens de todas as armas, como retornadas por
+                load_weapon_graphics.
         """
         super().__init__(groups)
 
-        direction = player.status.split("_", 1)[0]
+        direction = player.status.direction
         position = self.__get_weapon_position(direction, player)
 
         # Gráficos
-        self.image = load_image(
-            self.__get_asset_path(direction, player.weapon)
-        ).convert_alpha()
+        self.image = graphics[player.weapon][direction.label]
 
         self.rect = self.image.get_rect(**position)
 
     @staticmethod
     def __get_weapon_position(
-        direction: str,
+        direction: Direction,
         player: Player,
     ) -> Dict[str, Tuple[float, float]]:
         """Gera a posição da arma referente ao posicionamento do player.
 
         Args:
-            direction (str): direção que a arma deve ser posicionada.
+            direction (Direction):
+                direção que a arma deve ser posicionada.
             player (Player): instancia do player.
 
         Returns:
@@ -58,26 +88,13 @@ class Weapon(Sprite):
         y_offset = Vector2(0, 16)
         x_offset = Vector2(-10, 0)
 
-        if direction == "right":
+        if direction == Direction.RIGHT:
             return {"midleft": player.rect.midright + y_offset}
 
-        if direction == "left":
+        if direction == Direction.LEFT:
             return {"midright": player.rect.midleft + y_offset}
 
-        if direction == "up":
+        if direction == Direction.UP:
             return {"midbottom": player.rect.midtop + x_offset}
 
         return {"midtop": player.rect.midbottom + x_offset}
-
-    @staticmethod
-    def __get_asset_path(direction: str, weapon: str) -> str:
-        """Monta o caminho para os assets da arma selecionada.
-
-        Args:
-            direction (str): direção que a arma deve ser posicionada.
-            weapon (str): arma selecionada.
-
-        Returns:
-            str: caminho para a imagem correta da arma.
-        """
-        return f"{BASE_PATH}/graphics/weapons/{weapon}/{direction}.png"
@@ -0,0 +1,393 @@
+import os
+from heapq import nsmallest
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Sequence, Union
+
+import pygame
+
+from zelda.src.core import rng
+from zelda.src.core.clock import advance as advance_game_clock
+from zelda.src.core.clock import use_fixed_step
+from zelda.src.core.input import MENU_TOGGLE_BIT, ScriptedInput
+from zelda.src.elements.enemy import Enemy
+from zelda.src.levels.main_level import MainLevel
+from zelda.src.settings import FPS, MAP_PATH, SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Quantidade de inimigos mais próximos descritos em cada observação
+NEAREST_ENEMIES: int = 8
+
+# Valores do player: posição x e y, vida, energia, experiência, arma,
+# magia e quantidade de inimigos vivos
+PLAYER_FEATURES: int = 8
+
+# Valores de cada inimigo próximo: distância em x e y e vida
+ENEMY_FEATURES: int = 3
+
+OBSERVATION_SIZE: int = PLAYER_FEATURES + NEAREST_ENEMIES * ENEMY_FEATURES
+
+_ACTION_BYTES = 2
+_OBSERVATION_BYTES = 4
+
+
+def _write_observation(level: MainLevel,
+                       observations: memoryview,
+                       index: int) -> None:
+    """Escreve a observação de um nível no array compartilhado.
+
+    Args:
+        level (MainLevel): nível observado
+        observations (memoryview): array de observações de todos os níveis
+        index (int): posição do nível no lote
+    """
+    player = level.player
+    px, py = player.rect.center
+    offset = index * OBSERVATION_SIZE
+
+    enemies = [
+        sprite for sprite in level.attackable_sprites
+        if isinstance(sprite, Enemy)
+    ]
+
+    values = (
+        px, py, player.health, player.energy, player.exp,
+        player.weapon_index, player.magic_index, len(enemies),
+    )
+
+    for i, value in enumerate(values):
+        observations[offset + i] = value
+
+    nearest = nsmallest(
+        NEAREST_ENEMIES,
+        enemies,
+        key=lambda e: (e.rect.centerx - px) ** 2 + (e.rect.centery - py) ** 2,
+    )
+
+    offset += PLAYER_FEATURES
+
+    for i in range(NEAREST_ENEMIES):
+        if i < len(nearest):
+            enemy = nearest[i]
+            values = (
+                enemy.rect.centerx - px,
+                enemy.rect.centery - py,
+                enemy.health,
+            )
+        else:
+            values = (0.0, 0.0, 0.0)
+
+        for j, value in enumerate(values):
+            observations[offset + i * ENEMY_FEATURES + j] = value
+
+
+def _worker(connection: Connection,
+            env_indices: Sequence[int],
+            actions_name: str,
+            observations_name: str,
+            num_envs: int,
+            seed: int,
+            map_path: str,
+            render: bool) -> None:
+    """Loop de um processo de trabalho, que executa vários níveis.
+
+    Os assets e as camadas do mapa são carregados uma única vez por
+    processo e compartilhados entre todos os níveis dele, inclusive
+    quando um nível é reiniciado.
+
+    Cada nível tem o próprio estado do gerador aleatório, iniciado com
+    seed + índice do nível, que é restaurado antes de cada passo dele.
+    Assim o resultado de um nível não depende de quais outros níveis
+    rodam no mesmo processo.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    actions_memory = SharedMemory(name=actions_name)
+    observations_memory = SharedMemory(name=observations_name)
+    actions = actions_memory.buf[:num_envs * _ACTION_BYTES].cast("H")
+    observations = observations_memory.buf[
+        :num_envs * OBSERVATION_SIZE * _OBSERVATION_BYTES
+    ].cast("f")
+
+    levels: List[MainLevel] = []
+    states: List[Any] = []
+
+    def reset() -> None:
+        levels.clear()
+        states.clear()
+
+        # Todos os níveis são reiniciados juntos, então o relógio volta
+        # ao início e cada episódio repete o primeiro
+        use_fixed_step(FPS)
+
+        for index in env_indices:
+            rng.seed(seed + index)
+            levels.append(MainLevel(
+                screen,
+                map_path=map_path,
+                input_source=ScriptedInput(),
+            ))
+            states.append(rng.get_state())
+            _write_observation(levels[-1], observations, index)
+
+    try:
+        while True:
+            command = connection.recv()
+
+            if command == "reset":
+                reset()
+            elif command == "step":
+                for position, (index, level) in enumerate(
+                    zip(env_indices, levels),
+                ):
+                    level.input_source.mask = (
+                        actions[index] & ~MENU_TOGGLE_BIT
+                    )
+                    level.input_source.poll(())
+                    rng.set_state(states[position])
+
+                    if render:
+                        level.run()
+                    else:
+                        level.update()
+
+                    states[position] = rng.get_state()
+                    _write_observation(level, observations, index)
+
+                advance_game_clock()
+
+            connection.send(None)
+
+            if command == "close":
+                break
+    finally:
+        actions.release()
+        observations.release()
+        actions_memory.close()
+        observations_memory.close()
+        pygame.quit()
+
+
+class BatchedEnv:
+    """Executa vários MainLevel headless em processos de trabalho.
+
+    Cada passo recebe uma ação por nível, uma máscara de teclas como as
+    definidas em zelda.src.core.input, e devolve as observações de todos
+    os níveis. Ações e observações trafegam por memória compartilhada,
+    sem serialização, e os processos só trocam mensagens curtas de
+    sincronização.
+
+    As observações são um memoryview de floats com OBSERVATION_SIZE
+    valores por nível, sobrescrito a cada passo.
+    """
+
+    def __init__(self,
+                 num_envs: int,
+                 num_workers: Union[int, None] = None,
+                 seed: int = 0,
+                 map_path: str = MAP_PATH,
+                 render: bool = False) -> None:
+        """Inicia os processos de trabalho e monta os níveis.
+
+        Args:
+            num_envs (int): quantidade de níveis simultâneos
+            num_workers (Union[int, None], optional):
+                quantidade de processos. None por padrão, o que usa um
+                processo por núcleo, limitado a num_envs.
+            seed (int, optional):
+                semente base, cada nível usa seed + índice do nível,
+                independente do processo em que roda. 0 por padrão.
+            map_path (str, optional):
+                pasta do mapa utilizado. MAP_PATH por padrão.
+            render (bool, optional):
+                define se os níveis também são desenhados a cada passo.
+                False por padrão.
+        """
+        num_workers = min(num_envs, num_workers or os.cpu_count() or 1)
+
+        self.num_envs = num_envs
+        self.__actions_memory = SharedMemory(
+            create=True, size=num_envs * _ACTION_BYTES,
+        )
+        self.__observations_memory = SharedMemory(
+            create=True,
+            size=num_envs * OBSERVATION_SIZE * _OBSERVATION_BYTES,
+        )
+        self.__actions = self.__actions_memory.buf[
+            :num_envs * _ACTION_BYTES
+        ].cast("H")
+        self.observations = self.__observations_memory.buf[
+            :num_envs * OBSERVATION_SIZE * _OBSERVATION_BYTES
+        ].cast("f")
+
+        context = get_context("spawn")
+        self.__connections: List[Connection] = []
+        self.__workers = []
+
+        for worker_index in range(num_workers):
+            parent_connection, child_connection = context.Pipe()
+            env_indices = list(range(num_envs))[worker_index::num_workers]
+
+            worker = context.Process(
+                target=_worker,
+                args=(
+                    child_connection,
+                    env_indices,
+                    self.__actions_memory.name,
+                    self.__observations_memory.name,
+                    num_envs,
+                    seed,
+                    map_path,
+                    render,
+                ),
+                daemon=True,
+            )
+            worker.start()
+
+            # Fecha a ponta do processo filho no processo principal, para
+            # que a morte do filho seja percebida como fim da conexão
+            child_connection.close()
+
+            self.__connections.append(parent_connection)
+            self.__workers.append(worker)
+
+        self.reset()
+
+    def __broadcast(self, command: str) -> None:
+        """Envia um comando a todos os processos e aguarda a conclusão.
+        """
+        for connection in self.__connections:
+            connection.send(command)
+
+        for connection in self.__connections:
+            connection.recv()
+
+    def observation(self, index: int) -> memoryview:
+        """Retorna a observação de um único nível, sem cópia.
+
+        Args:
+            index (int): posição do nível no lote
+        """
+        start = index * OBSERVATION_SIZE
+        return self.observations[start:start + OBSERVATION_SIZE]
+
+    def reset(self) -> memoryview:
+        """Reinicia todos os níveis a partir dos assets já carregados,
+        com as mesmas sementes, de forma que o episódio se repete.
+
+        Returns:
+            memoryview: observações iniciais de todos os níveis
+        """
+        self.__broadcast("reset")
+        return self.observations
+
+    def step(self, actions: Sequence[int]) -> memoryview:
+        """Avança todos os níveis em um frame.
+
+        Args:
+            actions (Sequence[int]): máscara de teclas de cada nível
+
+        Returns:
+            memoryview: observações de todos os níveis após o passo
+        """
+        for index, action in enumerate(actions):
+            self.__actions[index] = action
+
+        self.__broadcast("step")
+        return self.observations
+
+    def close(self) -> None:
+        """Encerra os processos e libera a memória compartilhada.
+        """
+        self.__broadcast("close")
+
+        for worker in self.__workers:
+            worker.join()
+
+        self.__actions.release()
+        self.observations.release()
+
+        for memory in (self.__actions_memory, self.__observations_memory):
+            memory.close()
+            memory.unlink()
+
+    def __enter__(self) -> "BatchedEnv":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def _observe_session(num_envs: int,
+                     num_workers: int,
+                     actions: Sequence[Sequence[int]],
+                     seed: int,
+                     map_path: str) -> List[List[float]]:
+    """Executa uma sequência de ações e guarda as observações de cada
+    passo, incluindo as iniciais e as seguintes a um reset no meio da
+    sessão.
+    """
+    history = []
+
+    with BatchedEnv(num_envs, num_workers, seed, map_path) as env:
+        history.append(env.observations.tolist())
+
+        for step, step_actions in enumerate(actions):
+            if step == len(actions) // 2:
+                history.append(env.reset().tolist())
+
+            history.append(env.step(step_actions).tolist())
+
+    return history
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    from random import Random
+
+    from zelda.src.core.input import KEY_BITS
+
+    parser = ArgumentParser(
+        prog="python -m zelda.src.env.batched_env",
+        description=(
+            "Confere se as observações de cada nível são as mesmas com "
+            "um único processo e com vários."
+        ),
+    )
+    parser.add_argument("--envs", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--map", default=MAP_PATH, help="pasta do mapa")
+    args = parser.parse_args()
+
+    keys = list(KEY_BITS.values())
+    random = Random(args.seed)
+    session = []
+
+    for step in range(args.steps):
+        if step % 15 == 0:
+            step_actions = [
+                sum(key for key in keys if random.random() < 0.3)
+                for _ in range(args.envs)
+            ]
+
+        session.append(step_actions)
+
+    reference = _observe_session(
+        args.envs, 1, session, args.seed, args.map,
+    )
+    observed = _observe_session(
+        args.envs, args.workers, session, args.seed, args.map,
+    )
+    mismatches = sum(a != b for a, b in zip(reference, observed))
+
+    print(
+        f"{len(reference)} passos, {mismatches} diferentes entre 1 e "
+        f"{args.workers} processos"
+    )
+    raise SystemExit(1 if mismatches else 0)
@@ -1,16 +1,32 @@
+import os
 import sys
+from typing import Union
 
 import pygame
-from pygame.mixer import Sound
 
+from zelda.src.core import rng
+from zelda.src.core.clock import advance as advance_game_clock
+from zelda.src.core.clock import is_fixed_step, use_fixed_step
+from zelda.src.core.input import (
+    InputRecorder,
+    InputSource,
+    KeyboardInput,
+    Recording,
+    ReplayInput,
+)
+from zelda.src.core.music import MusicPlayer
+from zelda.src.core.quality import QualityGovernor
+from zelda.src.core.render_thread import RenderThread
+from zelda.src.core.snapshot import Snapshot, SnapshotWriter
+from zelda.src.core.state_stream import StateStreamWriter
+from zelda.src.levels.level_manager import LevelManager
 from zelda.src.levels.main_level import MainLevel
 from zelda.src.settings import (
-    BASE_PATH,
+    AUTOSAVE_INTERVAL,
     GAME_TITLE,
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     FPS,
-    WATER_COLOR,
 )
 
 
@@ -22,36 +38,179 @@ class Game:
     definidos para o jogo.
     """
 
-    def __init__(self) -> None:
+    def __init__(self,
+                 seed: Union[int, None] = None,
+                 record_path: Union[str, None] = None,
+                 replay_path: Union[str, None] = None,
+                 headless: bool = False,
+                 dirty_rects: bool = False,
+                 save_path: Union[str, None] = None,
+                 stream_path: Union[str, None] = None,
+                 pipelined: bool = False,
+                 ai_workers: Union[int, None] = None) -> None:
         """Monta a tela principal do jogo e inicializa o clock para a
         limitação de frames por segundo.
+
+        Ao gravar ou reproduzir uma sessão o tempo do jogo passa a
+        avançar em passos fixos por frame, para que o replay seja
+        idêntico à sessão gravada.
+
+        Args:
+            seed (Union[int, None], optional):
+                semente do gerador aleatório. None por padrão.
+            record_path (Union[str, None], optional):
+                arquivo em que as entradas da sessão serão gravadas.
+                None por padrão.
+            replay_path (Union[str, None], optional):
+                gravação que deve ser reproduzida no lugar do teclado.
+                None por padrão.
+            headless (bool, optional):
+                roda sem janela, sem áudio e sem limite de frames.
+                False por padrão.
+            dirty_rects (bool, optional):
+                envia para a tela apenas as áreas que mudaram em cada
+                frame, em vez da tela inteira. False por padrão.
+            save_path (Union[str, None], optional):
+                arquivo em que o jogo é salvo automaticamente e do qual
+                ele continua, caso exista. None por padrão.
+            stream_path (Union[str, None], optional):
+                arquivo, ou pipe nomeado, em que o estado das entidades
+                é transmitido a cada frame para um espectador. None por
+                padrão.
+            pipelined (bool, optional):
+                desenha e apresenta cada frame em uma thread de
+                renderização enquanto o próximo frame é simulado. False
+                por padrão.
+            ai_workers (Union[int, None], optional):
+                quantidade de processos que calculam a IA dos inimigos,
+                sendo 0 o cálculo em lote no próprio processo. None por
+                padrão, o que mantém o cálculo em cada inimigo.
         """
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        self.frame_limit = 0 if headless else FPS
+        self.input_source = self.__create_input_source(
+            seed, record_path, replay_path,
+        )
+
         pygame.init()
 
         # Setup geral
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
-        self.current_level = MainLevel(self.screen)
+
+        # A qualidade só é ajustada com o relógio real, já que ela
+        # depende da velocidade da máquina e tornaria o replay diferente
+        # da sessão gravada
+        self.quality_governor = (
+            None if is_fixed_step() else QualityGovernor(target_fps=FPS)
+        )
+        self.level_manager = LevelManager(self.screen, MainLevel(
+            self.screen,
+            input_source=self.input_source,
+            dirty_rects=dirty_rects,
+            ai_workers=ai_workers,
+        ))
+
+        # Salvamento automático
+        self.save_path = save_path
+        self.snapshot_writer = SnapshotWriter()
+        self.__last_save = pygame.time.get_ticks()
+
+        if save_path and os.path.exists(save_path):
+            self.level_manager.current.restore(Snapshot.load(save_path))
+
+        # Stream de estado para espectadores
+        self.state_stream = (
+            StateStreamWriter(open(stream_path, "wb"), FPS)
+            if stream_path else None
+        )
+
+        # Composição e apresentação dos frames em paralelo à simulação
+        self.render_thread = RenderThread(self.screen) if pipelined else None
 
         # Título da janela
         pygame.display.set_caption(GAME_TITLE)
 
         # Som
-        main_sound = Sound(f"{BASE_PATH}/audio/main.ogg")
-        main_sound.set_volume(0.1)
-        main_sound.play(loops=-1)
+        self.music_player = MusicPlayer(volume=0.1)
+        self.music_player.play(self.level_manager.current.music)
+
+    @staticmethod
+    def __create_input_source(seed: Union[int, None],
+                              record_path: Union[str, None],
+                              replay_path: Union[str, None]) -> InputSource:
+        """Cria a fonte de entradas e prepara o gerador aleatório e o
+        relógio do jogo de acordo com o modo de execução.
+        """
+        if replay_path:
+            recording = Recording.load(replay_path)
+            rng.seed(recording.seed)
+            use_fixed_step(recording.fps)
+
+            return ReplayInput(recording)
+
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+
+        rng.seed(seed)
+
+        if record_path:
+            use_fixed_step(FPS)
+
+            return InputRecorder(KeyboardInput(), record_path, seed, FPS)
+
+        return KeyboardInput()
+
+    def __autosave(self, force: bool = False) -> None:
+        """Salva o nível atual em segundo plano quando o intervalo de
+        salvamento passou, ou imediatamente caso force seja True.
+        """
+        now = pygame.time.get_ticks()
+
+        if not self.save_path:
+            return
+
+        if force or now - self.__last_save >= AUTOSAVE_INTERVAL:
+            self.snapshot_writer.write(
+                self.save_path, self.level_manager.current.snapshot(),
+            )
+            self.__last_save = now
+
+    def __quit(self) -> None:
+        self.__autosave(force=True)
+        self.snapshot_writer.flush()
+        self.input_source.close()
+
+        if self.render_thread:
+            self.render_thread.close()
+
+        self.level_manager.current.close()
+
+        if self.state_stream:
+            self.state_stream.close()
+
+        pygame.quit()
+        sys.exit()
 
     def __handle_events(self) -> None:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+
+        for event in events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                self.__quit()
+
+            # A janela pode perder o conteúdo enquanto o jogo está
+            # pausado e nenhum frame novo é enviado para a tela
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.level_manager.current.invalidate()
 
-            if (
-                event.type == pygame.KEYDOWN
-                and event.key == pygame.K_m
-            ):
-                self.current_level.toggle_menu()
+        self.input_source.poll(events)
+
+        if self.input_source.menu_toggled:
+            self.level_manager.current.toggle_menu()
 
     def run(self) -> None:
         """Roda o loop principal necessário para trabalhar com pygame.
@@ -63,9 +222,34 @@ class Game:
         while True:
             self.__handle_events()
 
-            self.screen.fill(WATER_COLOR)
-            self.current_level.run()
+            if self.input_source.finished:
+                self.__quit()
+
+            if self.render_thread:
+                self.level_manager.current.run_pipelined(self.render_thread)
+            else:
+                self.level_manager.current.run()
+
+            if self.state_stream:
+                self.state_stream.write(
+                    self.level_manager.current.entity_states(),
+                )
+
+            if self.level_manager.update():
+                self.music_player.play(self.level_manager.current.music)
+
+            self.music_player.update()
+            self.__autosave()
+
+            # No modo pipelined as áreas alteradas são enviadas para a
+            # janela pela thread de renderização
+            dirty_rects = self.level_manager.current.dirty_regions.collect()
+
+            if dirty_rects and not self.render_thread:
+                pygame.display.update(dirty_rects)
 
-            pygame.display.update()
+            advance_game_clock()
+            self.clock.tick(self.frame_limit)
 
-            self.clock.tick(FPS)
+            if self.quality_governor:
+                self.quality_governor.record(self.clock.get_rawtime())
@@ -1,7 +1,11 @@
 from abc import ABCMeta, abstractmethod
+from typing import Any, Iterator, Sequence
 
 from pygame import Surface
 
+from zelda.src.core.dirty_regions import DirtyRegions
+from zelda.src.core.render_thread import RenderList, RenderThread
+
 
 class AbstractLevel(metaclass=ABCMeta):
     """Classe abstrata que define o básico de um nível.
@@ -14,6 +18,10 @@ class AbstractLevel(metaclass=ABCMeta):
     interações do player com o mapa.
     """
 
+    # Faixas tocadas enquanto o nível está ativo, abertas apenas quando
+    # o nível começa
+    music: Sequence[str] = ()
+
     def __init__(self, screen: Surface) -> None:
         """Setup básico para um nível do jogo.
 
@@ -26,8 +34,50 @@ class AbstractLevel(metaclass=ABCMeta):
         """
         self.display_surface = screen
 
+        # Áreas da superfície alteradas desde o último envio para a tela
+        self.dirty_regions = DirtyRegions(screen.get_rect())
+
+        # Etapas restantes da montagem do nível, que podem ser
+        # executadas aos poucos, entre frames
+        self.loading: Iterator[None] = iter(())
+
+    @staticmethod
+    def prepare(**kwargs: Any) -> None:
+        """Carrega os dados e assets do nível que não dependem do
+        display, podendo ser executado fora da thread principal.
+
+        Args:
+            kwargs (Any): os mesmos argumentos passados ao construtor
+        """
+        pass
+
     @abstractmethod
     def run(self) -> None:
         """Atualiza e desenha os elementos presentes no nível
         """
         pass
+
+    def close(self) -> None:
+        """Libera os recursos do nível que não são liberados com ele,
+        como processos e threads.
+        """
+        pass
+
+    def run_pipelined(self, render_thread: RenderThread) -> None:
+        """Roda um frame com a apresentação feita pela thread de
+        renderização.
+
+        Por padrão o nível espera a thread terminar o frame anterior e
+        desenha direto na tela, deixando para a thread apenas o envio
+        das áreas alteradas para a janela. Níveis que montam os comandos
+        de desenho podem sobrescrever este método para simular o próximo
+        frame enquanto a thread desenha o atual.
+
+        Args:
+            render_thread (RenderThread): thread de renderização
+        """
+        render_thread.wait()
+        self.run()
+        render_thread.submit(
+            RenderList(None, (), tuple(self.dirty_regions.collect())),
+        )
@@ -0,0 +1,136 @@
+from threading import Thread
+from time import perf_counter
+from typing import Any, Dict, Type, Union
+
+from pygame import Surface
+
+from zelda.src.levels.abstract_level import AbstractLevel
+
+# Valor devolvido por next quando a montagem do nível termina
+_DONE = object()
+
+
+class LevelManager:
+    """Gerencia o nível atual e prepara o próximo sem travar o jogo.
+
+    A leitura do mapa e a decodificação dos assets do próximo nível
+    acontecem em uma thread de trabalho. A conversão das imagens e a
+    criação dos sprites precisam da thread principal e são divididas
+    entre vários frames, respeitando um tempo máximo por frame. A troca
+    de nível acontece apenas quando o próximo nível está completo.
+
+    Os níveis gerenciados devem aceitar o argumento deferred no
+    construtor, deixando a criação dos sprites para o iterador loading.
+    """
+
+    def __init__(self,
+                 screen: Surface,
+                 level: AbstractLevel,
+                 frame_budget_ms: float = 4.0) -> None:
+        """Inicia o gerenciador com o nível atual.
+
+        Args:
+            screen (Surface): superfície em que os níveis são desenhados
+            level (AbstractLevel): nível inicial, já montado
+            frame_budget_ms (float, optional):
+                tempo máximo por frame, em milissegundos, gasto na
+                montagem do próximo nível. 4.0 por padrão.
+        """
+        self.screen = screen
+        self.current = level
+        self.frame_budget_ms = frame_budget_ms
+
+        self.__next_class: Union[Type[AbstractLevel], None] = None
+        self.__next_kwargs: Dict[str, Any] = {}
+        self.__next: Union[AbstractLevel, None] = None
+        self.__thread: Union[Thread, None] = None
+        self.__ready = False
+        self.__switch_requested = False
+
+    @property
+    def loading(self) -> bool:
+        """Indica se há um nível sendo preparado.
+        """
+        return self.__next_class is not None
+
+    def preload(self,
+                level_class: Type[AbstractLevel],
+                **kwargs: Any) -> None:
+        """Começa a preparar um nível em segundo plano.
+
+        Args:
+            level_class (Type[AbstractLevel]): classe do próximo nível
+            kwargs (Any): argumentos do construtor do nível
+        """
+        self.__next_class = level_class
+        self.__next_kwargs = kwargs
+        self.__next = None
+        self.__ready = False
+        self.__switch_requested = False
+
+        self.__thread = Thread(
+            target=level_class.prepare,
+            kwargs=kwargs,
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def switch(self,
+               level_class: Union[Type[AbstractLevel], None] = None,
+               **kwargs: Any) -> None:
+        """Pede a troca para o próximo nível assim que ele estiver
+        pronto.
+
+        Args:
+            level_class (Union[Type[AbstractLevel], None], optional):
+                classe do próximo nível, caso ele ainda não tenha sido
+                pedido em preload. None por padrão.
+            kwargs (Any): argumentos do construtor do nível
+        """
+        if level_class is not None:
+            self.preload(level_class, **kwargs)
+
+        self.__switch_requested = True
+
+    def update(self) -> bool:
+        """Avança a preparação do próximo nível e faz a troca quando ele
+        estiver pronto e ela tiver sido pedida.
+
+        Deve ser chamado uma vez por frame.
+
+        Returns:
+            bool: define se o nível atual foi trocado neste frame
+        """
+        if not self.loading or self.__thread.is_alive():
+            return False
+
+        if not self.__ready:
+            self.__build()
+
+        if not (self.__ready and self.__switch_requested):
+            return False
+
+        self.current.close()
+        self.current = self.__next
+        self.__next_class = None
+        self.__next = None
+
+        return True
+
+    def __build(self) -> None:
+        """Executa etapas da montagem do próximo nível até acabar o
+        tempo disponível no frame.
+        """
+        deadline = perf_counter() + self.frame_budget_ms / 1000
+
+        if self.__next is None:
+            self.__next = self.__next_class(
+                self.screen,
+                deferred=True,
+                **self.__next_kwargs,
+            )
+
+        while perf_counter() < deadline:
+            if next(self.__next.loading, _DONE) is _DONE:
+                self.__ready = True
+                break
@@ -1,23 +1,61 @@
+import os
 from itertools import chain
-from random import choice as random_choice, randint
-from typing import Tuple, Union
+from zlib import crc32
+from time import perf_counter
+from typing import Iterator, List, Tuple, Union
 
 from pygame import Surface
 from pygame.math import Vector2
-from pygame.sprite import Group, groupcollide
-
+from pygame.sprite import Group, Sprite, groupcollide
+
+from zelda.src.core import audio, quality
+from zelda.src.core.assets import (
+    build_animations,
+    build_folder,
+    get_folder,
+    get_layout,
+    get_sound,
+    prefetch,
+)
 from zelda.src.core.camera import CameraGroup
+from zelda.src.core.enemy_ai import EnemyAI
 from zelda.src.core.particle_effect import AnimationPlayer
-from zelda.src.core.utils import import_csv, import_folder
+from zelda.src.core.input import InputSource, KeyboardInput
+from zelda.src.core.profiler import FrameProfiler
+from zelda.src.core.proximity import Proximity
+from zelda.src.core.render_thread import (
+    BlitCommand,
+    RenderList,
+    RenderThread,
+)
+from zelda.src.core.rng import choice as random_choice, randint
+from zelda.src.core.scheduler import FrameScheduler
+from zelda.src.core.separation import separate
+from zelda.src.core.snapshot import Snapshot
+from zelda.src.core.state_stream import EntityState
 from zelda.src.elements.enemy import Enemy
 from zelda.src.elements.entity import Entity
 from zelda.src.elements.magic import MagicPlayer
+from zelda.src.elements.minimap import Minimap
 from zelda.src.elements.player import Player
 from zelda.src.elements.tile import Tile
 from zelda.src.elements.ui import UI
-from zelda.src.elements.weapon import Weapon
+from zelda.src.elements.weapon import (
+    Weapon,
+    build_weapon_graphics,
+    load_weapon_graphics,
+)
 from zelda.src.levels.abstract_level import AbstractLevel
-from zelda.src.settings import BASE_PATH, TILESIZE
+from zelda.src.settings import (
+    BASE_PATH,
+    FLOOR_IMAGE,
+    MAP_PATH,
+    MONSTER_DATA,
+    PLAYER_MAX_STATS,
+    TILESIZE,
+    UPGRADE_COST,
+    WATER_COLOR,
+)
 from zelda.src.elements.upgrade import UpgradeMenu
 
 
@@ -25,49 +63,194 @@ class MainLevel(AbstractLevel):
     """Level principal, o primeiro quando o jogo começa.
     """
 
-    def __init__(self, screen: Surface) -> None:
+    music = (f"{BASE_PATH}/audio/main.ogg",)
+
+    def __init__(self,
+                 screen: Surface,
+                 map_path: str = MAP_PATH,
+                 input_source: Union[InputSource, None] = None,
+                 dirty_rects: bool = False,
+                 deferred: bool = False,
+                 ai_workers: Union[int, None] = None) -> None:
+        """Monta o nível a partir das camadas do mapa.
+
+        Args:
+            screen (Surface): superfície em que o nível será desenhado
+            map_path (str, optional):
+                pasta com os arquivos csv do mapa. MAP_PATH por padrão.
+            input_source (Union[InputSource, None], optional):
+                fonte das entradas do player e dos menus. None por
+                padrão, o que equivale a ler do teclado.
+            dirty_rects (bool, optional):
+                define se o nível registra apenas as áreas alteradas em
+                cada frame, em vez da tela inteira. False por padrão.
+            deferred (bool, optional):
+                define se a criação dos sprites fica para as iterações
+                de loading, em vez de acontecer no construtor. False
+                por padrão.
+            ai_workers (Union[int, None], optional):
+                quantidade de processos que calculam a distância, a
+                direção e o status dos inimigos em lote, sendo 0 o
+                cálculo em lote no próprio processo. None por padrão, o
+                que faz o cálculo com o Proximity, apenas para os
+                inimigos próximos do player.
+        """
         super().__init__(screen)
 
+        self.map_path = map_path
+        self.input_source = input_source or KeyboardInput()
+        self.profiler = FrameProfiler()
+        self.scheduler = FrameScheduler()
+        self.enemy_ai = None if ai_workers is None else EnemyAI(ai_workers)
+        self.proximity = Proximity()
+
         # Setup dos grupos de sprites
-        self.visible_sprites = CameraGroup()
+        self.visible_sprites = CameraGroup(
+            floor_chunks=self.__load_floor_chunks(),
+            track_changes=dirty_rects,
+            deferred=True,
+        )
         self.obstacle_sprites = Group()
         self.attackable_sprites = Group()
-        self.attack_sprites = Group()
 
-        # Setup dos sprites
-        self.__create_map()
+        # Apenas os sprites que mudam a cada frame, como entidades e
+        # partículas, para que os tiles estáticos não sejam percorridos
+        # na atualização
+        self.updatable_sprites = Group()
+
+        # Tufos de grama na ordem do mapa, usados para salvar quais foram
+        # cortados, e a impressão digital das camadas do mapa
+        self.__grass_tiles: List[Tile] = []
+        self.map_id = 0
+        self.attack_sprites = Group()
 
         # Sprites de ataque
         self.current_attack = None
         self.current_attack_type = None
 
-        # Interface do usuário
-        self.ui = UI()
-        self.upgrade_menu = UpgradeMenu(self.player)
         self.game_paused = False
 
+        # Mundo congelado, sem a UI, enquanto o menu está aberto
+        self.__paused_frame: Union[Surface, None] = None
+        self.__full_redraw = False
+
+        # Cópia dos elementos da UI entregue à thread de renderização,
+        # refeita apenas quando a UI muda
+        self.__ui_widgets: Union[List[BlitCommand], None] = None
+
+        self.loading = self.__load()
+
+        if not deferred:
+            for _ in self.loading:
+                pass
+
+    @staticmethod
+    def prepare(map_path: str = MAP_PATH, **_) -> None:
+        """Lê do disco as camadas do mapa, as imagens e os sons do
+        nível, deixando para o construtor apenas a conversão das
+        imagens e a criação dos sprites.
+
+        Args:
+            map_path (str, optional):
+                pasta com os arquivos csv do mapa. MAP_PATH por padrão.
+        """
+        for layer in ("FloorBlocks", "Grass", "Objects", "Entities"):
+            get_layout(f"{map_path}/map_{layer}.csv")
+
+        if os.path.exists(f"{map_path}/map_FloorChunks.csv"):
+            get_layout(f"{map_path}/map_FloorChunks.csv")
+
+        prefetch(FLOOR_IMAGE)
+
+        for folder in ("grass", "objects", "player", "monsters",
+                       "particles", "weapons"):
+            prefetch(f"{BASE_PATH}/graphics/{folder}")
+
+        for sound in ("death", "hit", "sword", "heal", "flame"):
+            get_sound(f"{BASE_PATH}/audio/{sound}.wav")
+
+        for monster in MONSTER_DATA.values():
+            get_sound(monster["attack_sound"])
+
+    def __load(self) -> Iterator[None]:
+        """Cria os sprites e a interface do nível, pausando após cada
+        linha do mapa para que o trabalho possa ser dividido entre
+        vários frames.
+        """
+        # Setup do chão e dos sprites
+        yield from self.visible_sprites.loading
+        yield from self.__create_map()
+
+        yield from build_weapon_graphics()
+        self.weapon_graphics = load_weapon_graphics()
+
+        # Interface do usuário
+        self.minimap = Minimap(
+            self.map_path, self.__load_floor_chunks(), deferred=True,
+        )
+        yield from self.minimap.loading
+        self.minimap.update(
+            self.player.hitbox.center,
+            [enemy.hitbox.center for enemy in self.__enemies()],
+        )
+        yield
+
+        self.ui = UI(self.weapon_graphics, self.minimap)
+        yield
+
+        self.upgrade_menu = UpgradeMenu(self.player, self.input_source)
+
         # Particles
-        self.animation_player = AnimationPlayer()
-        self.magic_player = MagicPlayer(self.animation_player)
+        self.animation_player = AnimationPlayer(deferred=True)
+        yield from self.animation_player.loading
+
+        self.magic_player = MagicPlayer(
+            self.animation_player, self.scheduler,
+        )
 
-    def __create_map(self) -> None:
+    def __load_floor_chunks(self) -> Union[List[List[str]], None]:
+        """Carrega a camada que define como o chão é repetido, presente
+        apenas em mapas maiores do que a imagem do chão.
+
+        Returns:
+            Union[List[List[str]], None]:
+                matriz de espelhamento do chão, ou None caso o mapa não
+                possua essa camada
+        """
+        path = f"{self.map_path}/map_FloorChunks.csv"
+
+        if os.path.exists(path):
+            return get_layout(path)
+
+    def __create_map(self) -> Iterator[None]:
         """Método que instância os elementos do mapa em seus devidos
-        grupos de sprites.
+        grupos de sprites, uma linha de cada camada por iteração.
         """
         # Mapeia os layouts com o posicionamento dos elementos em cada
         # camada do mapa
         layouts = {
-            "boundary": import_csv(f"{BASE_PATH}/map/map_FloorBlocks.csv"),
-            "grass": import_csv(f"{BASE_PATH}/map/map_Grass.csv"),
-            "object": import_csv(f"{BASE_PATH}/map/map_Objects.csv"),
-            "entities": import_csv(f"{BASE_PATH}/map/map_Entities.csv"),
+            "boundary": get_layout(f"{self.map_path}/map_FloorBlocks.csv"),
+            "grass": get_layout(f"{self.map_path}/map_Grass.csv"),
+            "object": get_layout(f"{self.map_path}/map_Objects.csv"),
+            "entities": get_layout(f"{self.map_path}/map_Entities.csv"),
         }
 
+        # Converte as imagens dos elementos do mapa antes de criá-los,
+        # já que a primeira linha de cada camada usaria todas de uma vez
+        yield from build_folder(f"{BASE_PATH}/graphics/grass")
+        yield from build_folder(f"{BASE_PATH}/graphics/objects")
+        yield from build_animations(f"{BASE_PATH}/graphics/player")
+
+        for name in MONSTER_DATA:
+            yield from build_animations(
+                f"{BASE_PATH}/graphics/monsters/{name}",
+            )
+
         # Mapeia os assets representando cada elemento especificado
         # no layout
         graphics = {
-            "grass": import_folder(f"{BASE_PATH}/graphics/grass"),
-            "object": import_folder(f"{BASE_PATH}/graphics/objects"),
+            "grass": get_folder(f"{BASE_PATH}/graphics/grass"),
+            "object": get_folder(f"{BASE_PATH}/graphics/objects"),
         }
 
         enemy_names = {
@@ -79,6 +262,8 @@ class MainLevel(AbstractLevel):
 
         for style, layout in layouts.items():
             for i, row in enumerate(layout):
+                self.map_id = crc32(",".join(row).encode(), self.map_id)
+
                 for j, tile in enumerate(row):
                     if tile != "-1":
                         x = j * TILESIZE
@@ -107,37 +292,62 @@ class MainLevel(AbstractLevel):
                                 groups.append(self.attackable_sprites)
                                 surface = random_choice(graphics[style])
 
-                            Tile(
+                            tile_sprite = Tile(
                                 position=(x, y),
                                 groups=groups,
                                 sprite_type=style,
                                 surface=surface,
                             )
 
+                            if style == "grass":
+                                self.__grass_tiles.append(tile_sprite)
+
                         if style == "entities":
                             if tile == "394":
                                 self.player = Player(
                                     position=(x, y),
-                                    groups=[self.visible_sprites],
+                                    groups=[
+                                        self.visible_sprites,
+                                        self.updatable_sprites,
+                                    ],
                                     handle_collisions=self.__handle_collisions,
                                     create_attack=self.__create_attack,
                                     destroy_attack=self.__destroy_attack,
                                     create_magic=self.__create_magic,
+                                    input_source=self.input_source,
                                 )
 
                             if tile in enemy_names.keys():
-                                Enemy(
-                                    position=(x, y),
-                                    groups=[
-                                        self.visible_sprites,
-                                        self.attackable_sprites,
-                                    ],
-                                    handle_collisions=self.__handle_collisions,
-                                    monster_name=enemy_names[tile],
-                                    get_player_pos=self.__get_player_pos,
-                                    inflict_damage_on_player=self.__inflict_damage_on_player,
-                                    trigger_death_particles=self.__trigger_death_particles,
-                                )
+                                self.spawn_enemy(enemy_names[tile], (x, y))
+
+                yield
+
+    def spawn_enemy(self,
+                    monster_name: str,
+                    position: Tuple[int, int]) -> Enemy:
+        """Cria um inimigo no nível, já ligado às interações com o
+        player e com o mapa.
+
+        Args:
+            monster_name (str): nome do monstro, chave de MONSTER_DATA
+            position (Tuple[int, int]): posição do inimigo, em pixels
+
+        Returns:
+            Enemy: inimigo criado
+        """
+        return Enemy(
+            position=position,
+            groups=[
+                self.visible_sprites,
+                self.updatable_sprites,
+                self.attackable_sprites,
+            ],
+            handle_collisions=self.__handle_collisions,
+            monster_name=monster_name,
+            get_player_pos=self.__get_player_pos,
+            inflict_damage_on_player=self.__inflict_damage_on_player,
+            trigger_death_particles=self.__trigger_death_particles,
+        )
 
     def __create_attack(self) -> None:
         """Cria a arma selecionada pelo player na tela.
@@ -146,6 +356,7 @@ class MainLevel(AbstractLevel):
         self.current_attack = Weapon(
             self.player,
             [self.visible_sprites, self.attack_sprites],
+            self.weapon_graphics,
         )
 
     def __destroy_attack(self) -> None:
@@ -172,7 +383,11 @@ class MainLevel(AbstractLevel):
             self.magic_player.flame(
                 player=self.player,
                 cost=cost,
-                groups=[self.visible_sprites, self.attack_sprites],
+                groups=[
+                    self.visible_sprites,
+                    self.updatable_sprites,
+                    self.attack_sprites,
+                ],
             )
 
         if style == "heal":
@@ -180,7 +395,7 @@ class MainLevel(AbstractLevel):
                 player=self.player,
                 strength=strength,
                 cost=cost,
-                groups=[self.visible_sprites],
+                groups=[self.visible_sprites, self.updatable_sprites],
             )
 
     def __handle_collisions(self,
@@ -246,7 +461,7 @@ class MainLevel(AbstractLevel):
         self.animation_player.create_particles(
             name=attack_type,
             position=self.player.rect.center,
-            groups=[self.visible_sprites],
+            groups=[self.visible_sprites, self.updatable_sprites],
         )
 
     def __trigger_death_particles(self,
@@ -263,9 +478,24 @@ class MainLevel(AbstractLevel):
         self.animation_player.create_particles(
             name=particle_type,
             position=position,
-            groups=[self.visible_sprites],
+            groups=[self.visible_sprites, self.updatable_sprites],
         )
 
+    def __create_leaves(self, position: Vector2) -> Iterator[None]:
+        """Cria as folhas da grama cortada, uma por iteração.
+
+        Args:
+            position (Vector2): posição onde as folhas surgem
+        """
+        for _ in range(randint(*quality.get().leaves)):
+            self.animation_player.create_particles(
+                name="leaf",
+                position=position,
+                groups=[self.visible_sprites, self.updatable_sprites],
+            )
+
+            yield
+
     def __player_attack_logic(self) -> None:
         """Implementa a lógica de ataque do player.
         """
@@ -280,14 +510,12 @@ class MainLevel(AbstractLevel):
             for collided in collide_list:
                 if isinstance(collided, Tile):
                     collided.kill()
+                    self.minimap.set_grass(collided.rect.topleft, False)
 
                     offset = Vector2(0, 75)
-                    for _ in range(randint(3, 6)):
-                        self.animation_player.create_particles(
-                            name="leaf",
-                            position=collided.rect.center - offset,
-                            groups=[self.visible_sprites],
-                        )
+                    self.scheduler.submit(self.__create_leaves(
+                        collided.rect.center - offset,
+                    ))
 
                 if isinstance(collided, Enemy):
                     collided.receive_damage(
@@ -300,14 +528,282 @@ class MainLevel(AbstractLevel):
 
     def toggle_menu(self) -> None:
         self.game_paused = not self.game_paused
+        self.__paused_frame = None
+        self.__ui_widgets = None
+        self.__full_redraw = True
+
+    def snapshot(self) -> Snapshot:
+        """Captura o estado dinâmico do nível.
+
+        O mapa não é salvo, apenas referenciado, e efeitos passageiros,
+        como partículas e a arma em uso, ficam de fora.
+
+        Returns:
+            Snapshot: estado que pode ser restaurado com restore
+        """
+        killed_grass = bytearray((len(self.__grass_tiles) + 7) // 8)
+
+        for index, tile in enumerate(self.__grass_tiles):
+            if not tile.alive():
+                killed_grass[index >> 3] |= 1 << (index & 7)
+
+        return Snapshot(
+            map_id=self.map_id,
+            player=self.player.get_state(),
+            enemies=[enemy.get_state() for enemy in self.__enemies()],
+            killed_grass=bytes(killed_grass),
+            upgrade_cost=tuple(
+                UPGRADE_COST[name] for name in PLAYER_MAX_STATS
+            ),
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Restaura um estado capturado com snapshot.
+
+        Args:
+            snapshot (Snapshot): estado do nível
+
+        Raises:
+            ValueError: caso o snapshot pertença a outro mapa
+        """
+        if snapshot.map_id != self.map_id:
+            raise ValueError("o snapshot pertence a outro mapa")
+
+        self.__destroy_attack()
+        self.player.set_state(snapshot.player)
+
+        # Os inimigos atuais são descartados sem as partículas de morte
+        for enemy in self.__enemies():
+            enemy.remove(*enemy.groups())
+
+        for record in snapshot.enemies:
+            self.spawn_enemy(record.monster_name, (0, 0)).set_state(record)
+
+        for index, tile in enumerate(self.__grass_tiles):
+            killed = snapshot.killed_grass[index >> 3] >> (index & 7) & 1
+
+            if killed and tile.alive():
+                tile.kill()
+                self.minimap.set_grass(tile.rect.topleft, False)
+            elif not killed and not tile.alive():
+                tile.add(
+                    self.visible_sprites,
+                    self.obstacle_sprites,
+                    self.attackable_sprites,
+                )
+                self.minimap.set_grass(tile.rect.topleft, True)
+
+        UPGRADE_COST.update(zip(PLAYER_MAX_STATS, snapshot.upgrade_cost))
+        self.upgrade_menu.invalidate()
+
+        self.__paused_frame = None
+        self.invalidate()
+
+    def entity_states(self) -> Iterator[EntityState]:
+        """Itera sobre o estado visível do player e dos inimigos, usado
+        pelo stream de estado.
+        """
+        yield self.player.get_stream_state()
+
+        for enemy in self.__enemies():
+            yield enemy.get_stream_state()
+
+    def __enemies(self) -> List[Enemy]:
+        """Retorna os inimigos vivos do nível.
+        """
+        return [
+            sprite for sprite in self.attackable_sprites
+            if isinstance(sprite, Enemy)
+        ]
+
+    def invalidate(self) -> None:
+        """Indica que o conteúdo da superfície foi perdido e deve ser
+        totalmente redesenhado no próximo frame.
+        """
+        self.__full_redraw = True
+
+    def draw(self) -> None:
+        """Desenha o mapa, os sprites e a interface do usuário.
+        """
+        with self.profiler.section("draw"):
+            self.dirty_regions.add_all(self.visible_sprites.custom_draw(
+                self.display_surface,
+                self.player,
+            ))
+
+        with self.profiler.section("ui"):
+            self.dirty_regions.add_all(self.ui.display(self.player))
+
+    def update(self, frame_start: Union[float, None] = None) -> None:
+        """Avança a simulação do nível em um frame, sem desenhar nada.
+
+        Ao final, o trabalho adiável é executado no tempo que sobra no
+        frame.
+
+        Args:
+            frame_start (Union[float, None], optional):
+                início do frame, medido com time.perf_counter. None por
+                padrão, o que considera o início da atualização.
+        """
+        if frame_start is None:
+            frame_start = perf_counter()
+
+        audio.next_frame()
+
+        with self.profiler.section("update"):
+            self.__update_in_batches()
+
+        with self.profiler.section("separation"):
+            enemies = self.__enemies()
+            separate(enemies)
+
+        with self.profiler.section("attack_logic"):
+            self.__player_attack_logic()
+
+        with self.profiler.section("minimap"):
+            self.minimap.update(
+                self.player.hitbox.center,
+                [enemy.hitbox.center for enemy in enemies],
+            )
+
+        with self.profiler.section("scheduler"):
+            self.scheduler.run(frame_start)
+
+    def __update_in_batches(self) -> None:
+        """Atualiza os sprites na ordem de updatable_sprites, com a
+        distância, a direção e o status dos inimigos calculados em lote,
+        pelo EnemyAI ou, sem ele, pelo Proximity.
+
+        Os inimigos que vêm antes do player no grupo enxergam a posição
+        dele no frame anterior, e os que vêm depois a posição já
+        atualizada. Por isso cada trecho é calculado logo antes de ser
+        atualizado, o que mantém o resultado idêntico ao da atualização
+        comum.
+        """
+        sprites = self.updatable_sprites.sprites()
+        start = 0
+
+        for index, sprite in enumerate(sprites):
+            if sprite is self.player:
+                self.__update_batch(sprites[start:index])
+                sprite.update()
+                start = index + 1
+
+        self.__update_batch(sprites[start:])
+
+    def __update_batch(self, sprites: List[Sprite]) -> None:
+        player_pos = self.__get_player_pos()
+
+        if player_pos:
+            planner = self.enemy_ai or self.proximity
+            planner.plan(
+                [sprite for sprite in sprites if isinstance(sprite, Enemy)],
+                player_pos,
+            )
+
+        for sprite in sprites:
+            sprite.update()
+
+    def close(self) -> None:
+        """Encerra os processos do cálculo dos inimigos em lote.
+        """
+        if self.enemy_ai is not None:
+            self.enemy_ai.close()
+
+    def __run_paused(self) -> None:
+        """Desenha a UI e o menu de upgrade sobre o mundo congelado.
+
+        O mundo é desenhado apenas no primeiro frame da pausa, e a
+        partir daí somente as áreas da UI e os itens do menu que mudaram
+        são redesenhados. Frames sem mudança não precisam ser enviados
+        para a tela.
+        """
+        screen_rect = self.display_surface.get_rect()
+
+        if self.__paused_frame is None:
+            with self.profiler.section("draw"):
+                self.visible_sprites.custom_draw(
+                    self.display_surface,
+                    self.player,
+                )
+
+            self.__paused_frame = self.display_surface.copy()
+            redraw = [screen_rect]
+        elif self.__full_redraw:
+            redraw = [screen_rect]
+        else:
+            redraw = []
+
+        with self.profiler.section("ui"):
+            redraw.extend(self.ui.refresh(self.player))
+
+            for rect in redraw:
+                self.display_surface.blit(self.__paused_frame, rect, rect)
+                self.display_surface.blit(self.ui.surface, rect, rect)
+
+        with self.profiler.section("menu"):
+            self.upgrade_menu.invalidate(redraw)
+            self.dirty_regions.add_all(redraw)
+            self.dirty_regions.add_all(self.upgrade_menu.display())
+
+        self.__full_redraw = False
+
+    def run_pipelined(self, render_thread: RenderThread) -> None:
+        """Roda um frame entregando o desenho para a thread de
+        renderização.
+
+        Os comandos de desenho são montados a partir do estado atual, e
+        a simulação do próximo frame acontece enquanto a thread os
+        executa. Com o jogo pausado o nível desenha direto na tela.
+
+        Args:
+            render_thread (RenderThread): thread de renderização
+        """
+        if self.game_paused:
+            super().run_pipelined(render_thread)
+            return
+
+        frame_start = perf_counter()
+
+        with self.profiler.section("draw"):
+            commands, changed = self.visible_sprites.render_commands(
+                self.player,
+                self.display_surface.get_size(),
+            )
+            self.dirty_regions.add_all(changed)
+
+        with self.profiler.section("ui"):
+            changed = self.ui.refresh(self.player)
+
+            if changed or self.__ui_widgets is None:
+                self.__ui_widgets = self.ui.copy_widgets()
+
+            self.dirty_regions.add_all(changed)
+
+        # As áreas são coletadas antes da simulação, então o redesenho
+        # completo pedido antes do frame precisa valer já para ele
+        if self.__full_redraw:
+            self.dirty_regions.invalidate()
+            self.__full_redraw = False
+
+        render_thread.submit(RenderList(
+            WATER_COLOR,
+            tuple(commands + self.__ui_widgets),
+            tuple(self.dirty_regions.collect()),
+        ))
+
+        self.update(frame_start)
 
     def run(self) -> None:
-        self.visible_sprites.custom_draw(self.display_surface, self.player)
-        self.ui.display(self.player)
+        frame_start = perf_counter()
 
         if self.game_paused:
-            self.upgrade_menu.display()
+            self.__run_paused()
             return
 
-        self.visible_sprites.update()
-        self.__player_attack_logic()
+        self.draw()
+        self.update(frame_start)
+
+        if self.__full_redraw:
+            self.dirty_regions.invalidate()
+            self.__full_redraw = False
@@ -5,6 +5,10 @@ BASE_PATH = str(Path().resolve()).replace('/zelda', '')
 
 GAME_TITLE = "Zelda"
 
+# Mapa
+MAP_PATH: str = f"{BASE_PATH}/map"
+FLOOR_IMAGE: str = f"{BASE_PATH}/graphics/tilemap/ground.png"
+
 SCREEN_WIDTH: int = 1280
 SCREEN_HEIGHT: int = 720
 FPS: int = 60
@@ -17,6 +21,25 @@ HITBOX_OFFSET: Dict[str, int] = {
     "invisible": 0,
 }
 
+# Tempo de cada frame, em milissegundos, a partir do qual o trabalho
+# adiável fica para os próximos frames
+FRAME_BUDGET_MS: float = 12.0
+
+# Distância, em pixels, a partir da qual um inimigo parado é
+# considerado distante do player e pode ser atualizado com menos
+# frequência quando a qualidade é reduzida
+FAR_ENEMY_DISTANCE: int = 800
+
+# Fração da sobreposição entre as hitboxes de dois inimigos desfeita a
+# cada frame
+ENEMY_SEPARATION: float = 0.5
+
+# Intervalo, em milissegundos, entre os salvamentos automáticos
+AUTOSAVE_INTERVAL: int = 5000
+
+# Quantidade máxima de efeitos sonoros iniciados em um mesmo frame
+SOUND_FRAME_BUDGET: int = 4
+
 # Cores gerais
 WATER_COLOR: str = "#71ddee"
 TEXT_COLOR: str = "#EEEEEE"
@@ -36,6 +59,16 @@ UI_HEALTH_COLOR: str = "red"
 UI_ENERGY_COLOR: str = "blue"
 UI_BORDER_COLOR_ACTIVE: str = "gold"
 
+# Minimapa, com o tamanho de cada tile do mapa em pixels
+MINIMAP_CELL: int = 4
+MINIMAP_WIDTH: int = 200
+MINIMAP_HEIGHT: int = 160
+MINIMAP_BOUNDARY_SHADE: str = "#999999"
+MINIMAP_OBJECT_COLOR: str = "#4a3b2a"
+MINIMAP_GRASS_COLOR: str = "#2f7d32"
+MINIMAP_PLAYER_COLOR: str = "gold"
+MINIMAP_ENEMY_COLOR: str = "red"
+
 # Menu de upgrade
 TEXT_COLOR_SELECTED = '#111111'
 BAR_COLOR = '#EEEEEE'
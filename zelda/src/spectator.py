@@ -0,0 +1,134 @@
+import os
+from argparse import ArgumentParser
+from typing import Dict, List
+
+import pygame
+from pygame import Surface
+
+from zelda.src.core.assets import get_animations, get_image
+from zelda.src.core.snapshot import ENEMY_STATUSES
+from zelda.src.core.state_stream import KINDS, EntityState, StateStreamReader
+from zelda.src.elements.player import PlayerState
+from zelda.src.settings import (
+    BASE_PATH,
+    FLOOR_IMAGE,
+    GAME_TITLE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    WATER_COLOR,
+)
+
+
+class Spectator:
+    """Exibe as entidades de um stream de estado gravado pelo jogo.
+
+    O espectador roda em outro processo e recebe apenas o estado das
+    entidades, que é desenhado sobre a imagem do chão com a câmera
+    centralizada no player. A grama e os objetos do mapa não fazem parte
+    do stream e não são desenhados.
+    """
+
+    def __init__(self, screen: Surface) -> None:
+        """Carrega as imagens das entidades.
+
+        Args:
+            screen (Surface): superfície em que o stream é desenhado
+        """
+        self.screen = screen
+        self.floor = get_image(FLOOR_IMAGE, alpha=False)
+        self.animations: List[Dict[str, List[Surface]]] = [
+            get_animations(f"{BASE_PATH}/graphics/player"),
+            *(
+                get_animations(f"{BASE_PATH}/graphics/monsters/{name}")
+                for name in KINDS[1:]
+            ),
+        ]
+
+    def __image(self, entity: EntityState) -> Surface:
+        """Seleciona a imagem de uma entidade pelo tipo, status e frame.
+        """
+        if entity.kind == 0:
+            status = PlayerState(entity.status).animation
+        else:
+            status = ENEMY_STATUSES[entity.status]
+
+        frames = self.animations[entity.kind][status]
+        return frames[entity.frame % len(frames)]
+
+    def draw(self, entities: List[EntityState]) -> None:
+        """Desenha as entidades de um frame.
+
+        Args:
+            entities (List[EntityState]): entidades presentes no frame
+        """
+        player = next(
+            (entity for entity in entities if entity.kind == 0), None,
+        )
+        offset_x, offset_y = 0, 0
+
+        if player is not None:
+            offset_x = player.x - self.screen.get_width() // 2
+            offset_y = player.y - self.screen.get_height() // 2
+
+        self.screen.fill(WATER_COLOR)
+        self.screen.blit(self.floor, (-offset_x, -offset_y))
+
+        for entity in sorted(entities, key=lambda entity: entity.y):
+            image = self.__image(entity)
+            rect = image.get_rect(
+                center=(entity.x - offset_x, entity.y - offset_y),
+            )
+            self.screen.blit(image, rect)
+
+
+def watch(path: str) -> int:
+    """Exibe um stream de estado, no ritmo em que ele foi gravado.
+
+    Args:
+        path (str): arquivo, ou pipe nomeado, com o stream
+
+    Returns:
+        int: quantidade de frames exibidos
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(f"{GAME_TITLE} - espectador")
+    clock = pygame.time.Clock()
+    frames = 0
+
+    with open(path, "rb") as stream:
+        reader = StateStreamReader(stream)
+        spectator = Spectator(screen)
+
+        for entities in reader:
+            if pygame.event.peek(pygame.QUIT):
+                break
+
+            pygame.event.pump()
+            spectator.draw(entities)
+            pygame.display.update()
+
+            frames += 1
+            clock.tick(reader.fps)
+
+    pygame.quit()
+
+    return frames
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        prog="python -m zelda.src.spectator",
+        description="Exibe o stream de estado gravado com --stream.",
+    )
+    parser.add_argument("stream", help="arquivo ou pipe nomeado")
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="roda sem janela, apenas lendo o stream",
+    )
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    print(f"{watch(args.stream)} frames")